@@ -1,15 +1,21 @@
 import asyncio
+import time
+import tracemalloc
 import pytest_asyncio
 from typing import (
+    Any,
     AsyncGenerator,
     Callable,
     Awaitable,
+    Dict,
+    Generator,
     Optional,
 )
 
 import pytest
 
-from cent import Client, AsyncClient
+from cent.bench.server import FakeCentrifugo, FakeCentrifugoThread
+from cent import Client, AsyncClient, Histogram
 
 API_URL = "http://localhost:8000/api"
 API_KEY = "api_key"
@@ -47,3 +53,158 @@ def aio_benchmark(benchmark, event_loop):  # type: ignore
             benchmark(func, *args, **kwargs)
 
     return _wrapper
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("fake centrifugo")
+    group.addoption(
+        "--fake-latency",
+        type=float,
+        default=0.0,
+        help="Latency of fake Centrifugo API in seconds.",
+    )
+    group.addoption(
+        "--fake-items",
+        type=int,
+        default=100,
+        help="Number of publications and clients in history and presence responses.",
+    )
+    group.addoption(
+        "--fake-item-size",
+        type=int,
+        default=64,
+        help="Size of each publication or client data in bytes.",
+    )
+
+
+@pytest.fixture(scope="session")
+def fake_api_url(pytestconfig: pytest.Config) -> Generator[str, None, None]:
+    server = FakeCentrifugo(
+        latency=pytestconfig.getoption("--fake-latency"),
+        items=pytestconfig.getoption("--fake-items"),
+        item_size=pytestconfig.getoption("--fake-item-size"),
+    )
+    with FakeCentrifugoThread(server) as thread:
+        yield thread.api_url
+
+
+@pytest.fixture()
+def fake_sync_client(fake_api_url: str) -> Generator[Client, None, None]:
+    with Client(fake_api_url, API_KEY) as client:
+        yield client
+
+
+@pytest.fixture()
+def bench_loop() -> Generator[asyncio.AbstractEventLoop, None, None]:
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest.fixture()
+def fake_async_client(
+    fake_api_url: str,
+    bench_loop: asyncio.AbstractEventLoop,
+) -> Generator[AsyncClient, None, None]:
+    async def create() -> AsyncClient:
+        return AsyncClient(fake_api_url, API_KEY)
+
+    client = bench_loop.run_until_complete(create())
+    yield client
+    bench_loop.run_until_complete(client.close())
+
+
+class LatencyRecorder:
+    """Collects latency of calls and throughput of benchmark rounds."""
+
+    def __init__(self) -> None:
+        self.latency = Histogram(scale=1e6)
+        self.calls = 0
+        self.elapsed = 0.0
+
+    def add_round(self, calls: int, elapsed: float) -> None:
+        self.calls += calls
+        self.elapsed += elapsed
+
+    @property
+    def throughput(self) -> float:
+        return self.calls / self.elapsed if self.elapsed else 0.0
+
+    def timed(self, call: Callable[[], Any]) -> Callable[[], None]:
+        """Wraps sync call to record its latency, one call per round."""
+
+        def run() -> None:
+            started = time.perf_counter()
+            call()
+            elapsed = time.perf_counter() - started
+            self.latency.record(elapsed)
+            self.add_round(1, elapsed)
+
+        return run
+
+    async def timed_async(self, call: Callable[[], Awaitable[Any]]) -> None:
+        started = time.perf_counter()
+        await call()
+        self.latency.record(time.perf_counter() - started)
+
+
+_recorders: Dict[str, LatencyRecorder] = {}
+
+
+@pytest.fixture()
+def latency(request: pytest.FixtureRequest) -> LatencyRecorder:
+    recorder = _recorders[request.node.name] = LatencyRecorder()
+    return recorder
+
+
+class MemoryUsage:
+    """Memory allocated by one call, measured with tracemalloc."""
+
+    def __init__(self) -> None:
+        self.peak = 0
+        self.retained = 0
+
+    def measure(self, call: Callable[[], Any]) -> None:
+        # Warm up caches (e.g. pydantic type adapters) so they are not counted.
+        call()
+        tracemalloc.start()
+        try:
+            result = call()
+            self.retained, self.peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        del result
+
+
+_memory: Dict[str, MemoryUsage] = {}
+
+
+@pytest.fixture()
+def memory_usage(request: pytest.FixtureRequest) -> MemoryUsage:
+    usage = _memory[request.node.name] = MemoryUsage()
+    return usage
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if _memory:
+        terminalreporter.section("memory usage")
+        terminalreporter.write_line(f"{'Name':<50} {'Peak KiB':>10} {'Retained KiB':>13}")
+        for name, usage in sorted(_memory.items()):
+            terminalreporter.write_line(
+                f"{name:<50} {usage.peak / 1024:>10.1f} {usage.retained / 1024:>13.1f}",
+            )
+    if not _recorders:
+        return
+    terminalreporter.section("latency percentiles")
+    terminalreporter.write_line(
+        f"{'Name':<40} {'Calls':>8} {'Calls/s':>10} "
+        f"{'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'p99.9 ms':>9}",
+    )
+    for name, recorder in sorted(_recorders.items()):
+        if not recorder.calls:
+            continue
+        percentiles = recorder.latency.percentiles((50, 90, 99, 99.9))
+        terminalreporter.write_line(
+            f"{name:<40} {recorder.calls:>8} {recorder.throughput:>10.1f} "
+            + " ".join(f"{value * 1000:>9.3f}" for value in percentiles.values()),
+        )
@@ -0,0 +1,280 @@
+import json
+from typing import Any, Dict, List, NamedTuple
+
+import pytest
+
+from benchmarks.conftest import MemoryUsage
+from cent.dto import (
+    BatchRequest,
+    BlockUserRequest,
+    BroadcastRequest,
+    CancelPushRequest,
+    CentRequest,
+    ChannelsRequest,
+    ConnectionsRequest,
+    DeleteUserStatusRequest,
+    DeviceListRequest,
+    DeviceRegisterRequest,
+    DeviceRemoveRequest,
+    DeviceTopicListRequest,
+    DeviceTopicUpdateRequest,
+    DeviceUpdateRequest,
+    DisconnectRequest,
+    FcmPushNotification,
+    GetUserStatusRequest,
+    HistoryRemoveRequest,
+    HistoryRequest,
+    InfoRequest,
+    InvalidateUserTokensRequest,
+    PresenceRequest,
+    PresenceStatsRequest,
+    PublishRequest,
+    PushNotification,
+    PushRecipient,
+    RefreshRequest,
+    RevokeTokenRequest,
+    SendPushNotificationRequest,
+    SubscribeRequest,
+    UnblockUserRequest,
+    UnsubscribeRequest,
+    UpdatePushStatusRequest,
+    UpdateUserStatusRequest,
+    UserTopicListRequest,
+    UserTopicUpdateRequest,
+)
+
+DATA = {"message": "Hello world!", "tags": ["a", "b"], "count": 42}
+PUBLISHED = {"offset": 1, "epoch": "epoch"}
+
+LARGE_PRESENCE = 10_000
+LARGE_HISTORY = 1_000
+LARGE_BROADCAST = 1_000
+LARGE_BATCH = 1_000
+LARGE_CHANNELS = 10_000
+LARGE_DEVICES = 1_000
+
+
+class DtoCase(NamedTuple):
+    name: str
+    request: CentRequest[Any]
+    result: Any
+
+
+def client_info(i: int) -> Dict[str, Any]:
+    return {"client": f"client-{i}", "user": f"user-{i}", "conn_info": {"name": f"User {i}"}}
+
+
+def publication(i: int) -> Dict[str, Any]:
+    return {"data": {"text": f"message {i}", "index": i}, "offset": i, "tags": {"k": "v"}}
+
+
+def device(i: int) -> Dict[str, Any]:
+    return {
+        "id": f"device-{i}",
+        "platform": "android",
+        "provider": "fcm",
+        "token": f"token-{i}",
+        "user": f"user-{i}",
+        "created_at": 1700000000,
+        "updated_at": 1700000000,
+        "meta": {"app": "1.0"},
+        "topics": ["news"],
+    }
+
+
+def node(i: int) -> Dict[str, Any]:
+    return {
+        "uid": f"uid-{i}",
+        "name": f"node-{i}",
+        "version": "5.4.0",
+        "num_clients": 1000,
+        "num_subs": 5000,
+        "num_users": 900,
+        "num_channels": 300,
+        "uptime": 3600,
+        "metrics": {"interval": 60, "items": {f"metric_{j}": float(j) for j in range(50)}},
+        "process": {"cpu": 1.5, "rss": 100_000_000},
+    }
+
+
+def small_cases() -> List[DtoCase]:
+    push = SendPushNotificationRequest(
+        recipient=PushRecipient(fcm_tokens=["token"]),
+        notification=PushNotification(fcm=FcmPushNotification(message={"title": "Hi"})),
+    )
+    return [
+        DtoCase("publish", PublishRequest(channel="chat", data=DATA), PUBLISHED),
+        DtoCase(
+            "broadcast",
+            BroadcastRequest(channels=["a", "b"], data=DATA),
+            {"responses": [{"result": PUBLISHED}, {"result": PUBLISHED}]},
+        ),
+        DtoCase(
+            "batch",
+            BatchRequest(requests=[PublishRequest(channel="chat", data=DATA)] * 2),
+            {"replies": [{"publish": PUBLISHED}, {"publish": PUBLISHED}]},
+        ),
+        DtoCase("subscribe", SubscribeRequest(user="1", channel="chat"), {}),
+        DtoCase("unsubscribe", UnsubscribeRequest(user="1", channel="chat"), {}),
+        DtoCase("disconnect", DisconnectRequest(user="1"), {}),
+        DtoCase("refresh", RefreshRequest(user="1"), {}),
+        DtoCase(
+            "presence",
+            PresenceRequest(channel="chat"),
+            {"presence": {f"client-{i}": client_info(i) for i in range(3)}},
+        ),
+        DtoCase(
+            "presence_stats",
+            PresenceStatsRequest(channel="chat"),
+            {"num_clients": 3, "num_users": 2},
+        ),
+        DtoCase(
+            "history",
+            HistoryRequest(channel="chat", limit=10),
+            {"publications": [publication(i) for i in range(10)], "offset": 10, "epoch": "e"},
+        ),
+        DtoCase("history_remove", HistoryRemoveRequest(channel="chat"), {}),
+        DtoCase("info", InfoRequest(), {"nodes": [node(i) for i in range(3)]}),
+        DtoCase(
+            "channels",
+            ChannelsRequest(pattern="chat:*"),
+            {"channels": {f"chat:{i}": {"num_clients": i} for i in range(10)}},
+        ),
+        DtoCase(
+            "connections",
+            ConnectionsRequest(user="1", expression=""),
+            {
+                "connections": {
+                    f"client-{i}": {"transport": "websocket", "protocol": "json", "user": "1"}
+                    for i in range(3)
+                },
+            },
+        ),
+        DtoCase("update_user_status", UpdateUserStatusRequest(users=["1", "2"]), {}),
+        DtoCase(
+            "get_user_status",
+            GetUserStatusRequest(users=["1", "2"]),
+            {"statuses": [{"user": "1", "active": 1, "online": 1}, {"user": "2"}]},
+        ),
+        DtoCase("delete_user_status", DeleteUserStatusRequest(users=["1", "2"]), {}),
+        DtoCase("block_user", BlockUserRequest(user="1", expire_at=1700000000), {}),
+        DtoCase("unblock_user", UnblockUserRequest(user="1"), {}),
+        DtoCase("revoke_token", RevokeTokenRequest(uid="uid", expire_at=1700000000), {}),
+        DtoCase(
+            "invalidate_user_tokens",
+            InvalidateUserTokensRequest(user="1", issued_before=1700000000),
+            {},
+        ),
+        DtoCase(
+            "device_register",
+            DeviceRegisterRequest(provider="fcm", token="token", platform="android", user="1"),
+            {"id": "device-1"},
+        ),
+        DtoCase("device_update", DeviceUpdateRequest(ids=["device-1"]), {}),
+        DtoCase("device_remove", DeviceRemoveRequest(ids=["device-1"]), {}),
+        DtoCase(
+            "device_list",
+            DeviceListRequest(limit=10),
+            {"items": [device(i) for i in range(10)], "next_cursor": "10"},
+        ),
+        DtoCase(
+            "device_topic_list",
+            DeviceTopicListRequest(limit=10),
+            {
+                "items": [
+                    {"id": str(i), "topic": "news", "device": device(i)} for i in range(10)
+                ],
+            },
+        ),
+        DtoCase(
+            "device_topic_update",
+            DeviceTopicUpdateRequest(device_id="device-1", op="add", topics=["news"]),
+            {},
+        ),
+        DtoCase(
+            "user_topic_list",
+            UserTopicListRequest(limit=10),
+            {"items": [{"id": str(i), "user": "1", "topic": f"t{i}"} for i in range(10)]},
+        ),
+        DtoCase(
+            "user_topic_update",
+            UserTopicUpdateRequest(user="1", op="add", topics=["news"]),
+            {},
+        ),
+        DtoCase("send_push_notification", push, {"uid": "push-1"}),
+        DtoCase(
+            "update_push_status",
+            UpdatePushStatusRequest(analytics_uid="uid", status="delivered"),
+            {},
+        ),
+        DtoCase("cancel_push", CancelPushRequest(uid="uid"), {}),
+    ]
+
+
+def large_cases() -> List[DtoCase]:
+    return [
+        DtoCase(
+            f"presence_{LARGE_PRESENCE}",
+            PresenceRequest(channel="chat"),
+            {"presence": {f"client-{i}": client_info(i) for i in range(LARGE_PRESENCE)}},
+        ),
+        DtoCase(
+            f"history_{LARGE_HISTORY}",
+            HistoryRequest(channel="chat", limit=LARGE_HISTORY),
+            {
+                "publications": [publication(i) for i in range(LARGE_HISTORY)],
+                "offset": LARGE_HISTORY,
+                "epoch": "e",
+            },
+        ),
+        DtoCase(
+            f"broadcast_{LARGE_BROADCAST}",
+            BroadcastRequest(
+                channels=[f"personal_{i}" for i in range(LARGE_BROADCAST)],
+                data=DATA,
+            ),
+            {"responses": [{"result": PUBLISHED}] * LARGE_BROADCAST},
+        ),
+        DtoCase(
+            f"batch_{LARGE_BATCH}",
+            BatchRequest(
+                requests=[
+                    PublishRequest(channel=f"personal_{i}", data=DATA) for i in range(LARGE_BATCH)
+                ],
+            ),
+            {"replies": [{"publish": PUBLISHED}] * LARGE_BATCH},
+        ),
+        DtoCase(
+            f"channels_{LARGE_CHANNELS}",
+            ChannelsRequest(),
+            {"channels": {f"chat:{i}": {"num_clients": i} for i in range(LARGE_CHANNELS)}},
+        ),
+        DtoCase(
+            f"device_list_{LARGE_DEVICES}",
+            DeviceListRequest(limit=LARGE_DEVICES),
+            {"items": [device(i) for i in range(LARGE_DEVICES)]},
+        ),
+    ]
+
+
+CASES = small_cases() + large_cases()
+
+
+def response_content(case: DtoCase) -> bytes:
+    if isinstance(case.request, BatchRequest):
+        return json.dumps(case.result).encode()
+    return json.dumps({"result": case.result}).encode()
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_api_payload(benchmark: Any, memory_usage: MemoryUsage, case: DtoCase) -> None:
+    memory_usage.measure(lambda: case.request.api_payload)
+    benchmark(lambda: case.request.api_payload)
+
+
+@pytest.mark.parametrize("case", CASES, ids=[case.name for case in CASES])
+def test_parse_response(benchmark: Any, memory_usage: MemoryUsage, case: DtoCase) -> None:
+    content = response_content(case)
+    memory_usage.measure(lambda: case.request.parse_response(content))
+    response = benchmark(lambda: case.request.parse_response(content))
+    assert response.error is None
@@ -0,0 +1,75 @@
+import asyncio
+import time
+from typing import Any, Callable
+
+import pytest
+
+from benchmarks.conftest import LatencyRecorder
+from cent import (
+    AsyncClient,
+    BatchRequest,
+    BroadcastRequest,
+    Client,
+    HistoryRequest,
+    PresenceRequest,
+    PublishRequest,
+)
+from cent.dto import CentRequest
+
+# Concurrent AsyncClient calls in one benchmark round.
+CONCURRENCY = 10
+BROADCAST_CHANNELS = 100
+BATCH_COMMANDS = 100
+
+METHODS = ("publish", "broadcast", "batch", "history", "presence")
+
+
+def make_request(method: str) -> CentRequest[Any]:
+    data = {"message": "Hello world!"}
+    if method == "publish":
+        return PublishRequest(channel="personal_1", data=data)
+    if method == "broadcast":
+        channels = [f"personal_{i}" for i in range(BROADCAST_CHANNELS)]
+        return BroadcastRequest(channels=channels, data=data)
+    if method == "batch":
+        return BatchRequest(
+            requests=[
+                PublishRequest(channel=f"personal_{i}", data=data) for i in range(BATCH_COMMANDS)
+            ],
+        )
+    if method == "history":
+        return HistoryRequest(channel="personal_1", limit=-1)
+    return PresenceRequest(channel="personal_1")
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_sync_client(
+    benchmark: Any,
+    fake_sync_client: Client,
+    latency: LatencyRecorder,
+    method: str,
+) -> None:
+    request = make_request(method)
+    call: Callable[[CentRequest[Any]], Any] = getattr(fake_sync_client, method)
+    benchmark(latency.timed(lambda: call(request)))
+
+
+@pytest.mark.parametrize("method", METHODS)
+def test_async_client(
+    benchmark: Any,
+    fake_async_client: AsyncClient,
+    bench_loop: asyncio.AbstractEventLoop,
+    latency: LatencyRecorder,
+    method: str,
+) -> None:
+    request = make_request(method)
+    call: Callable[[CentRequest[Any]], Any] = getattr(fake_async_client, method)
+
+    async def run_round() -> None:
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(latency.timed_async(lambda: call(request)) for _ in range(CONCURRENCY)),
+        )
+        latency.add_round(CONCURRENCY, time.perf_counter() - started)
+
+    benchmark(lambda: bench_loop.run_until_complete(run_round()))
@@ -1,201 +1,294 @@
-from .client import (
-    Client,
-    AsyncClient,
-)
-from cent.dto import (
-    CentResult,
-    CentRequest,
-    Response,
-    BatchRequest,
-    BatchResult,
-    BroadcastRequest,
-    PublishRequest,
-    SubscribeRequest,
-    UnsubscribeRequest,
-    PresenceRequest,
-    PresenceStatsRequest,
-    HistoryRequest,
-    HistoryRemoveRequest,
-    RefreshRequest,
-    ChannelsRequest,
-    DisconnectRequest,
-    InfoRequest,
-    PublishResult,
-    BroadcastResult,
-    SubscribeResult,
-    UnsubscribeResult,
-    PresenceResult,
-    PresenceStatsResult,
-    HistoryResult,
-    HistoryRemoveResult,
-    RefreshResult,
-    ChannelsResult,
-    DisconnectResult,
-    InfoResult,
-    StreamPosition,
-    ChannelOptionsOverride,
-    Disconnect,
-    BoolValue,
-    ProcessStats,
-    Node,
-    Publication,
-    ClientInfo,
-    DeviceRegisterRequest,
-    DeviceRegisterResult,
-    DeviceUpdateRequest,
-    DeviceUpdateResult,
-    DeviceListRequest,
-    DeviceListResult,
-    DeviceRemoveRequest,
-    DeviceRemoveResult,
-    DeviceTopicListRequest,
-    DeviceTopicListResult,
-    UserTopicListRequest,
-    UserTopicListResult,
-    SendPushNotificationRequest,
-    SendPushNotificationResult,
-    PushNotification,
-    FcmPushNotification,
-    HmsPushNotification,
-    ApnsPushNotification,
-    Device,
-    DeviceFilter,
-    DeviceTopicFilter,
-    DeviceUserUpdate,
-    DeviceMetaUpdate,
-    DeviceTopicsUpdate,
-    DeviceTopicUpdateRequest,
-    DeviceTopicUpdateResult,
-    UpdatePushStatusRequest,
-    UpdatePushStatusResult,
-    CancelPushRequest,
-    CancelPushResult,
-    UpdateUserStatusRequest,
-    UpdateUserStatusResult,
-    GetUserStatusRequest,
-    GetUserStatusResult,
-    UserStatus,
-    DeleteUserStatusRequest,
-    DeleteUserStatusResult,
-    BlockUserRequest,
-    BlockUserResult,
-    UnblockUserRequest,
-    UnblockUserResult,
-    RevokeTokenRequest,
-    RevokeTokenResult,
-    InvalidateUserTokensRequest,
-    InvalidateUserTokensResult,
-    ConnectionsRequest,
-    ConnectionsResult,
-    ConnectionState,
-    ConnectionTokenInfo,
-    SubscriptionTokenInfo,
-    ChannelContext,
-)
-from cent.exceptions import (
-    CentError,
-    CentNetworkError,
-    CentTransportError,
-    CentUnauthorizedError,
-    CentDecodeError,
-    CentApiResponseError,
-)
+from typing import TYPE_CHECKING
 
-__all__ = (
-    "ApnsPushNotification",
-    "AsyncClient",
-    "BatchRequest",
-    "BatchResult",
-    "BlockUserRequest",
-    "BlockUserResult",
-    "BoolValue",
-    "BroadcastRequest",
-    "BroadcastResult",
-    "CancelPushRequest",
-    "CancelPushResult",
-    "CentApiResponseError",
-    "CentDecodeError",
-    "CentError",
-    "CentNetworkError",
-    "CentRequest",
-    "CentResult",
-    "CentTransportError",
-    "CentUnauthorizedError",
-    "ChannelContext",
-    "ChannelOptionsOverride",
-    "ChannelsRequest",
-    "ChannelsResult",
-    "Client",
-    "ClientInfo",
-    "ConnectionState",
-    "ConnectionTokenInfo",
-    "ConnectionsRequest",
-    "ConnectionsResult",
-    "DeleteUserStatusRequest",
-    "DeleteUserStatusResult",
-    "Device",
-    "DeviceFilter",
-    "DeviceListRequest",
-    "DeviceListResult",
-    "DeviceMetaUpdate",
-    "DeviceRegisterRequest",
-    "DeviceRegisterResult",
-    "DeviceRemoveRequest",
-    "DeviceRemoveResult",
-    "DeviceTopicFilter",
-    "DeviceTopicListRequest",
-    "DeviceTopicListResult",
-    "DeviceTopicUpdateRequest",
-    "DeviceTopicUpdateResult",
-    "DeviceTopicsUpdate",
-    "DeviceUpdateRequest",
-    "DeviceUpdateResult",
-    "DeviceUserUpdate",
-    "Disconnect",
-    "DisconnectRequest",
-    "DisconnectResult",
-    "FcmPushNotification",
-    "GetUserStatusRequest",
-    "GetUserStatusResult",
-    "HistoryRemoveRequest",
-    "HistoryRemoveResult",
-    "HistoryRequest",
-    "HistoryResult",
-    "HmsPushNotification",
-    "InfoRequest",
-    "InfoResult",
-    "InvalidateUserTokensRequest",
-    "InvalidateUserTokensResult",
-    "Node",
-    "PresenceRequest",
-    "PresenceResult",
-    "PresenceStatsRequest",
-    "PresenceStatsResult",
-    "ProcessStats",
-    "Publication",
-    "PublishRequest",
-    "PublishResult",
-    "PushNotification",
-    "RefreshRequest",
-    "RefreshResult",
-    "Response",
-    "RevokeTokenRequest",
-    "RevokeTokenResult",
-    "SendPushNotificationRequest",
-    "SendPushNotificationResult",
-    "StreamPosition",
-    "SubscribeRequest",
-    "SubscribeResult",
-    "SubscriptionTokenInfo",
-    "UnblockUserRequest",
-    "UnblockUserResult",
-    "UnsubscribeRequest",
-    "UnsubscribeResult",
-    "UpdatePushStatusRequest",
-    "UpdatePushStatusResult",
-    "UpdateUserStatusRequest",
-    "UpdateUserStatusResult",
-    "UserStatus",
-    "UserTopicListRequest",
-    "UserTopicListResult",
-)
+from cent._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    # Aliases re-export names for type checkers, `__all__` is built at runtime.
+    from cent.codec import (
+        JsonCodec as JsonCodec,
+        StdlibJsonCodec as StdlibJsonCodec,
+        OrjsonCodec as OrjsonCodec,
+        MsgspecCodec as MsgspecCodec,
+    )
+    from cent.exceptions import (
+        CentError as CentError,
+        CentNetworkError as CentNetworkError,
+        CentQueueFullError as CentQueueFullError,
+        CentCircuitOpenError as CentCircuitOpenError,
+        CentEpochChangedError as CentEpochChangedError,
+        CentPartialBatchError as CentPartialBatchError,
+        CentRateLimitError as CentRateLimitError,
+        CentTimeoutError as CentTimeoutError,
+        CentTransportError as CentTransportError,
+        CentUnauthorizedError as CentUnauthorizedError,
+        CentDecodeError as CentDecodeError,
+        CentApiResponseError as CentApiResponseError,
+    )
+    from cent.client import (
+        Client as Client,
+        AsyncClient as AsyncClient,
+        BatchChunking as BatchChunking,
+        BatchPublisher as BatchPublisher,
+        CacheStats as CacheStats,
+        CircuitBreaker as CircuitBreaker,
+        ClusterSnapshot as ClusterSnapshot,
+        ClusterStatsCollector as ClusterStatsCollector,
+        CoalesceOptions as CoalesceOptions,
+        ConcurrencyLimiter as ConcurrencyLimiter,
+        Hedging as Hedging,
+        HedgingStats as HedgingStats,
+        Histogram as Histogram,
+        Instrumentation as Instrumentation,
+        LimiterStats as LimiterStats,
+        LoadBalancing as LoadBalancing,
+        MethodStats as MethodStats,
+        Profiler as Profiler,
+        RateLimit as RateLimit,
+        RateLimiter as RateLimiter,
+        RateLimiterStats as RateLimiterStats,
+        RequestEvent as RequestEvent,
+        ResponseCache as ResponseCache,
+        RetryPolicy as RetryPolicy,
+        SingleFlight as SingleFlight,
+        SingleFlightStats as SingleFlightStats,
+    )
+    from cent.dto import (
+        CentResult as CentResult,
+        CentRequest as CentRequest,
+        Response as Response,
+        BatchRequest as BatchRequest,
+        BatchResult as BatchResult,
+        BroadcastRequest as BroadcastRequest,
+        PublishRequest as PublishRequest,
+        SubscribeRequest as SubscribeRequest,
+        UnsubscribeRequest as UnsubscribeRequest,
+        PresenceRequest as PresenceRequest,
+        PresenceStatsRequest as PresenceStatsRequest,
+        HistoryRequest as HistoryRequest,
+        HistoryRemoveRequest as HistoryRemoveRequest,
+        RefreshRequest as RefreshRequest,
+        ChannelsRequest as ChannelsRequest,
+        DisconnectRequest as DisconnectRequest,
+        InfoRequest as InfoRequest,
+        PublishResult as PublishResult,
+        BroadcastResult as BroadcastResult,
+        SubscribeResult as SubscribeResult,
+        UnsubscribeResult as UnsubscribeResult,
+        PresenceResult as PresenceResult,
+        PresenceStatsResult as PresenceStatsResult,
+        HistoryResult as HistoryResult,
+        HistoryRemoveResult as HistoryRemoveResult,
+        RefreshResult as RefreshResult,
+        ChannelsResult as ChannelsResult,
+        DisconnectResult as DisconnectResult,
+        InfoResult as InfoResult,
+        StreamPosition as StreamPosition,
+        ChannelOptionsOverride as ChannelOptionsOverride,
+        Disconnect as Disconnect,
+        BoolValue as BoolValue,
+        ProcessStats as ProcessStats,
+        Node as Node,
+        Publication as Publication,
+        ClientInfo as ClientInfo,
+        DeviceRegisterRequest as DeviceRegisterRequest,
+        DeviceRegisterResult as DeviceRegisterResult,
+        DeviceUpdateRequest as DeviceUpdateRequest,
+        DeviceUpdateResult as DeviceUpdateResult,
+        DeviceListRequest as DeviceListRequest,
+        DeviceListResult as DeviceListResult,
+        DeviceRemoveRequest as DeviceRemoveRequest,
+        DeviceRemoveResult as DeviceRemoveResult,
+        DeviceTopicListRequest as DeviceTopicListRequest,
+        DeviceTopicListResult as DeviceTopicListResult,
+        UserTopicListRequest as UserTopicListRequest,
+        UserTopicListResult as UserTopicListResult,
+        SendPushNotificationRequest as SendPushNotificationRequest,
+        SendPushNotificationResult as SendPushNotificationResult,
+        PushNotification as PushNotification,
+        FcmPushNotification as FcmPushNotification,
+        HmsPushNotification as HmsPushNotification,
+        ApnsPushNotification as ApnsPushNotification,
+        Device as Device,
+        DeviceFilter as DeviceFilter,
+        DeviceTopicFilter as DeviceTopicFilter,
+        DeviceUserUpdate as DeviceUserUpdate,
+        DeviceMetaUpdate as DeviceMetaUpdate,
+        DeviceTopicsUpdate as DeviceTopicsUpdate,
+        DeviceTopicUpdateRequest as DeviceTopicUpdateRequest,
+        DeviceTopicUpdateResult as DeviceTopicUpdateResult,
+        UpdatePushStatusRequest as UpdatePushStatusRequest,
+        UpdatePushStatusResult as UpdatePushStatusResult,
+        CancelPushRequest as CancelPushRequest,
+        CancelPushResult as CancelPushResult,
+        UpdateUserStatusRequest as UpdateUserStatusRequest,
+        UpdateUserStatusResult as UpdateUserStatusResult,
+        GetUserStatusRequest as GetUserStatusRequest,
+        GetUserStatusResult as GetUserStatusResult,
+        UserStatus as UserStatus,
+        DeleteUserStatusRequest as DeleteUserStatusRequest,
+        DeleteUserStatusResult as DeleteUserStatusResult,
+        BlockUserRequest as BlockUserRequest,
+        BlockUserResult as BlockUserResult,
+        UnblockUserRequest as UnblockUserRequest,
+        UnblockUserResult as UnblockUserResult,
+        RevokeTokenRequest as RevokeTokenRequest,
+        RevokeTokenResult as RevokeTokenResult,
+        InvalidateUserTokensRequest as InvalidateUserTokensRequest,
+        InvalidateUserTokensResult as InvalidateUserTokensResult,
+        ConnectionsRequest as ConnectionsRequest,
+        ConnectionsResult as ConnectionsResult,
+        ConnectionState as ConnectionState,
+        ConnectionTokenInfo as ConnectionTokenInfo,
+        SubscriptionTokenInfo as SubscriptionTokenInfo,
+        ChannelContext as ChannelContext,
+        ReplyError as ReplyError,
+        warmup_response_adapters as warmup_response_adapters,
+    )
+
+# Names are imported on first access, so e.g. a process using only Client never
+# imports aiohttp, and pydantic models are loaded when first needed.
+_EXPORTS = {
+    "cent.codec": (
+        "JsonCodec",
+        "StdlibJsonCodec",
+        "OrjsonCodec",
+        "MsgspecCodec",
+    ),
+    "cent.exceptions": (
+        "CentError",
+        "CentNetworkError",
+        "CentQueueFullError",
+        "CentCircuitOpenError",
+        "CentEpochChangedError",
+        "CentPartialBatchError",
+        "CentRateLimitError",
+        "CentTimeoutError",
+        "CentTransportError",
+        "CentUnauthorizedError",
+        "CentDecodeError",
+        "CentApiResponseError",
+    ),
+    "cent.client": (
+        "Client",
+        "AsyncClient",
+        "BatchChunking",
+        "BatchPublisher",
+        "CacheStats",
+        "CircuitBreaker",
+        "ClusterSnapshot",
+        "ClusterStatsCollector",
+        "CoalesceOptions",
+        "ConcurrencyLimiter",
+        "Hedging",
+        "HedgingStats",
+        "Histogram",
+        "Instrumentation",
+        "LimiterStats",
+        "LoadBalancing",
+        "MethodStats",
+        "Profiler",
+        "RateLimit",
+        "RateLimiter",
+        "RateLimiterStats",
+        "RequestEvent",
+        "ResponseCache",
+        "RetryPolicy",
+        "SingleFlight",
+        "SingleFlightStats",
+    ),
+    "cent.dto": (
+        "CentResult",
+        "CentRequest",
+        "Response",
+        "BatchRequest",
+        "BatchResult",
+        "BroadcastRequest",
+        "PublishRequest",
+        "SubscribeRequest",
+        "UnsubscribeRequest",
+        "PresenceRequest",
+        "PresenceStatsRequest",
+        "HistoryRequest",
+        "HistoryRemoveRequest",
+        "RefreshRequest",
+        "ChannelsRequest",
+        "DisconnectRequest",
+        "InfoRequest",
+        "PublishResult",
+        "BroadcastResult",
+        "SubscribeResult",
+        "UnsubscribeResult",
+        "PresenceResult",
+        "PresenceStatsResult",
+        "HistoryResult",
+        "HistoryRemoveResult",
+        "RefreshResult",
+        "ChannelsResult",
+        "DisconnectResult",
+        "InfoResult",
+        "StreamPosition",
+        "ChannelOptionsOverride",
+        "Disconnect",
+        "BoolValue",
+        "ProcessStats",
+        "Node",
+        "Publication",
+        "ClientInfo",
+        "DeviceRegisterRequest",
+        "DeviceRegisterResult",
+        "DeviceUpdateRequest",
+        "DeviceUpdateResult",
+        "DeviceListRequest",
+        "DeviceListResult",
+        "DeviceRemoveRequest",
+        "DeviceRemoveResult",
+        "DeviceTopicListRequest",
+        "DeviceTopicListResult",
+        "UserTopicListRequest",
+        "UserTopicListResult",
+        "SendPushNotificationRequest",
+        "SendPushNotificationResult",
+        "PushNotification",
+        "FcmPushNotification",
+        "HmsPushNotification",
+        "ApnsPushNotification",
+        "Device",
+        "DeviceFilter",
+        "DeviceTopicFilter",
+        "DeviceUserUpdate",
+        "DeviceMetaUpdate",
+        "DeviceTopicsUpdate",
+        "DeviceTopicUpdateRequest",
+        "DeviceTopicUpdateResult",
+        "UpdatePushStatusRequest",
+        "UpdatePushStatusResult",
+        "CancelPushRequest",
+        "CancelPushResult",
+        "UpdateUserStatusRequest",
+        "UpdateUserStatusResult",
+        "GetUserStatusRequest",
+        "GetUserStatusResult",
+        "UserStatus",
+        "DeleteUserStatusRequest",
+        "DeleteUserStatusResult",
+        "BlockUserRequest",
+        "BlockUserResult",
+        "UnblockUserRequest",
+        "UnblockUserResult",
+        "RevokeTokenRequest",
+        "RevokeTokenResult",
+        "InvalidateUserTokensRequest",
+        "InvalidateUserTokensResult",
+        "ConnectionsRequest",
+        "ConnectionsResult",
+        "ConnectionState",
+        "ConnectionTokenInfo",
+        "SubscriptionTokenInfo",
+        "ChannelContext",
+        "ReplyError",
+        "warmup_response_adapters",
+    ),
+}
+
+if not TYPE_CHECKING:
+    __all__, __getattr__, __dir__ = lazy_attributes(globals(), _EXPORTS)
@@ -0,0 +1,27 @@
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+
+def lazy_attributes(
+    namespace: Dict[str, Any],
+    modules: Mapping[str, Sequence[str]],
+) -> Tuple[Tuple[str, ...], Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Returns `__all__`, `__getattr__` and `__dir__` (PEP 562) of package with
+    `namespace` globals, which imports names listed by module on first access.
+    """
+    origins = {name: module for module, names in modules.items() for name in names}
+    package = namespace["__name__"]
+
+    def module_getattr(name: str) -> Any:
+        module = origins.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module), name)
+        namespace[name] = value
+        return value
+
+    def module_dir() -> List[str]:
+        return sorted(set(namespace) | set(origins))
+
+    return tuple(origins), module_getattr, module_dir
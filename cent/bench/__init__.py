@@ -0,0 +1,7 @@
+from .load import LoadOptions, LoadReport, run_load
+
+__all__ = (
+    "LoadOptions",
+    "LoadReport",
+    "run_load",
+)
@@ -0,0 +1,93 @@
+import argparse
+import asyncio
+import json
+import sys
+from typing import List, Optional
+
+from cent.bench.load import METHODS, LoadOptions, LoadReport, run_load
+from cent.bench.server import FakeCentrifugo, FakeCentrifugoThread
+from cent.client.async_client import AsyncClient
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m cent.bench",
+        description=(
+            "Drive sustained publish, broadcast or batch load with AsyncClient and report "
+            "throughput, latency percentiles and errors. Without --api-url runs against "
+            "local stand-in server."
+        ),
+    )
+    parser.add_argument("--api-url", help="Centrifugo API URL, e.g. http://localhost:8000/api")
+    parser.add_argument("--api-key", default="", help="Centrifugo API key")
+    parser.add_argument("--method", choices=METHODS, default="publish")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds to run load for")
+    parser.add_argument(
+        "--rate",
+        type=float,
+        help="target calls per second, otherwise --concurrency calls run back to back",
+    )
+    parser.add_argument("--concurrency", type=int, default=10, help="max calls in flight")
+    parser.add_argument("--channels", type=int, default=1000, help="number of distinct channels")
+    parser.add_argument("--payload-size", type=int, default=128, help="publication data bytes")
+    parser.add_argument("--broadcast-channels", type=int, default=10)
+    parser.add_argument("--batch-size", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=10.0, help="request timeout seconds")
+    parser.add_argument(
+        "--server-latency",
+        type=float,
+        default=0.0,
+        help="latency of local stand-in server in seconds",
+    )
+    parser.add_argument("--json", action="store_true", help="print report as JSON")
+    return parser.parse_args(argv)
+
+
+def format_report(report: LoadReport) -> str:
+    data = report.to_dict()
+    latency = data["latency"]
+    lines = [
+        f"calls:        {data['calls']} ({data['failed']} failed) in {data['elapsed']:.2f}s",
+        f"throughput:   {data['throughput']:.1f} calls/s, "
+        f"{data['publications_per_second']:.1f} publications/s",
+        f"latency ms:   mean {latency['mean'] * 1000:.3f}, p50 {latency['p50'] * 1000:.3f}, "
+        f"p99 {latency['p99'] * 1000:.3f}, p999 {latency['p999'] * 1000:.3f}, "
+        f"max {latency['max'] * 1000:.3f}",
+    ]
+    if report.errors:
+        lines.append("errors:")
+        lines.extend(
+            f"  {name}: {count}"
+            for name, count in sorted(report.errors.items(), key=lambda item: -item[1])
+        )
+    return "\n".join(lines)
+
+
+async def bench(args: argparse.Namespace, api_url: str) -> LoadReport:
+    options = LoadOptions(
+        method=args.method,
+        duration=args.duration,
+        rate=args.rate,
+        concurrency=args.concurrency,
+        channels=args.channels,
+        payload_size=args.payload_size,
+        broadcast_channels=args.broadcast_channels,
+        batch_size=args.batch_size,
+    )
+    async with AsyncClient(api_url, args.api_key, timeout=args.timeout) as client:
+        return await run_load(client, options)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_args(argv)
+    if args.api_url:
+        report = asyncio.run(bench(args, args.api_url))
+    else:
+        server = FakeCentrifugo(latency=args.server_latency)
+        with FakeCentrifugoThread(server) as thread:
+            report = asyncio.run(bench(args, thread.api_url))
+    if args.json:
+        sys.stdout.write(json.dumps(report.to_dict(), indent=2) + "\n")
+    else:
+        sys.stdout.write(format_report(report) + "\n")
+    return 0
@@ -0,0 +1,210 @@
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Set
+
+from cent.client.async_client import AsyncClient
+from cent.client.instrumentation import Histogram
+from cent.dto import (
+    BatchRequest,
+    BatchResult,
+    BroadcastRequest,
+    BroadcastResult,
+    CentRequest,
+    PublishRequest,
+)
+from cent.exceptions import CentApiResponseError
+
+METHODS = ("publish", "broadcast", "batch")
+
+
+@dataclass(frozen=True)
+class LoadOptions:
+    """
+    Options of load run.
+
+    Attributes:
+        method: API method to call: `publish`, `broadcast` or `batch`.
+        duration: Time to run load for in seconds.
+        rate: Target number of calls per second. Calls are started on schedule
+            regardless of responses (open loop), latency is measured from the
+            scheduled start. None to run `concurrency` calls back to back instead.
+        concurrency: Max number of calls in flight.
+        channels: Number of distinct channels to publish into.
+        payload_size: Size of publication data in bytes.
+        broadcast_channels: Number of channels in each `broadcast` call.
+        batch_size: Number of publications in each `batch` call.
+        channel_prefix: Prefix of channel names.
+    """
+
+    method: str = "publish"
+    duration: float = 10.0
+    rate: Optional[float] = None
+    concurrency: int = 10
+    channels: int = 1000
+    payload_size: int = 128
+    broadcast_channels: int = 10
+    batch_size: int = 10
+    channel_prefix: str = "bench_"
+
+    def __post_init__(self) -> None:
+        if self.method not in METHODS:
+            raise ValueError(f"method must be one of {', '.join(METHODS)}")
+        if self.rate is not None and self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if self.channels < 1:
+            raise ValueError("channels must be at least 1")
+
+
+@dataclass
+class LoadReport:
+    """
+    Result of load run.
+
+    Attributes:
+        calls: Number of finished calls.
+        failed: Number of failed calls.
+        errors: Number of failed calls and failed commands of successful batch and
+            broadcast calls by error, API and command errors are keyed by code.
+        elapsed: Time from first call start to last call finish in seconds.
+        latency: Histogram of call latencies in seconds.
+        publications: Number of successful publications.
+    """
+
+    calls: int = 0
+    failed: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    elapsed: float = 0.0
+    latency: Histogram = field(default_factory=lambda: Histogram(scale=1e6))
+    publications: int = 0
+
+    @property
+    def throughput(self) -> float:
+        """Finished calls per second."""
+        return self.calls / self.elapsed if self.elapsed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        latency = self.latency
+        return {
+            "calls": self.calls,
+            "failed": self.failed,
+            "errors": dict(self.errors),
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+            "publications_per_second": self.publications / self.elapsed if self.elapsed else 0.0,
+            "latency": {
+                "mean": latency.mean,
+                "p50": latency.percentile(50),
+                "p99": latency.percentile(99),
+                "p999": latency.percentile(99.9),
+                "max": latency.max,
+            },
+        }
+
+
+class _Load:
+    def __init__(self, client: AsyncClient, options: LoadOptions) -> None:
+        self.send = getattr(client, options.method)
+        self.options = options
+        self.report = LoadReport()
+        self.data = {"payload": "x" * options.payload_size}
+        self.publications = {
+            "publish": 1,
+            "broadcast": options.broadcast_channels,
+            "batch": options.batch_size,
+        }[options.method]
+
+    def channel(self) -> str:
+        return f"{self.options.channel_prefix}{random.randrange(self.options.channels)}"  # noqa: S311
+
+    def request(self) -> CentRequest[Any]:
+        options = self.options
+        if options.method == "broadcast":
+            channels = [self.channel() for _ in range(options.broadcast_channels)]
+            return BroadcastRequest(channels=channels, data=self.data)
+        if options.method == "batch":
+            return BatchRequest(
+                requests=[
+                    PublishRequest(channel=self.channel(), data=self.data)
+                    for _ in range(options.batch_size)
+                ],
+            )
+        return PublishRequest(channel=self.channel(), data=self.data)
+
+    async def call(self, started: float) -> None:
+        report = self.report
+        try:
+            result = await self.send(self.request())
+        except CentApiResponseError as error:
+            report.failed += 1
+            self.count_error(f"{type(error).__name__}({error.code})")
+        except Exception as error:
+            report.failed += 1
+            self.count_error(type(error).__name__)
+        else:
+            report.publications += self.publications - self.count_command_errors(result)
+        report.calls += 1
+        report.latency.record(time.perf_counter() - started)
+
+    def count_error(self, name: str) -> None:
+        self.report.errors[name] = self.report.errors.get(name, 0) + 1
+
+    def count_command_errors(self, result: Any) -> int:
+        """Counts errors of commands of batch and broadcast result, returns their number."""
+        if isinstance(result, BatchResult):
+            codes = [reply.code for reply in result.errors.values()]
+        elif isinstance(result, BroadcastResult):
+            codes = [response.error.code for response in result.responses if response.error]
+        else:
+            return 0
+        for code in codes:
+            self.count_error(f"ReplyError({code})")
+        return len(codes)
+
+    async def run_closed(self, deadline: float) -> None:
+        async def worker() -> None:
+            while time.perf_counter() < deadline:
+                await self.call(time.perf_counter())
+
+        await asyncio.gather(*(worker() for _ in range(self.options.concurrency)))
+
+    async def run_open(self, started: float, deadline: float, rate: float) -> None:
+        slots = asyncio.Semaphore(self.options.concurrency)
+        tasks: Set["asyncio.Task[None]"] = set()
+
+        async def scheduled(at: float) -> None:
+            try:
+                await self.call(at)
+            finally:
+                slots.release()
+
+        index = 0
+        while True:
+            at = started + index / rate
+            if at >= deadline:
+                break
+            delay = at - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await slots.acquire()
+            task = asyncio.ensure_future(scheduled(at))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            index += 1
+        await asyncio.gather(*tasks)
+
+
+async def run_load(client: AsyncClient, options: LoadOptions) -> LoadReport:
+    """Drives load with AsyncClient according to options and returns report."""
+    load = _Load(client, options)
+    started = time.perf_counter()
+    deadline = started + options.duration
+    if options.rate is None:
+        await load.run_closed(deadline)
+    else:
+        await load.run_open(started, deadline, options.rate)
+    load.report.elapsed = time.perf_counter() - started
+    return load.report
@@ -0,0 +1,124 @@
+import asyncio
+import json
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from aiohttp import web
+
+
+class FakeCentrifugo:
+    """
+    Stand-in for Centrifugo HTTP API replying to publish, broadcast, batch, history
+    and presence with canned responses after configurable latency. Responses are
+    encoded once and reused, so the server adds little CPU cost of its own.
+    """
+
+    def __init__(self, latency: float = 0.0, items: int = 100, item_size: int = 64) -> None:
+        """
+        Args:
+            latency (float): Time in seconds to wait before replying.
+            items (int): Number of publications in history and clients in presence
+                responses.
+            item_size (int): Size of data of each publication or client in bytes.
+        """
+        self.latency = latency
+        self.items = items
+        self.item_size = item_size
+        self._responses: Dict[Tuple[str, int], bytes] = {}
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/api/{method}", self.handle)
+        return app
+
+    async def handle(self, request: web.Request) -> web.Response:
+        method = request.match_info["method"]
+        payload = json.loads(await request.read())
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(body=self.response(method, payload), content_type="application/json")
+
+    def response(self, method: str, payload: Dict[str, Any]) -> bytes:
+        if method == "broadcast":
+            size = len(payload.get("channels", ()))
+        elif method == "batch":
+            size = len(payload.get("commands", ()))
+        else:
+            size = 0
+        key = (method, size)
+        body = self._responses.get(key)
+        if body is None:
+            body = self._responses[key] = json.dumps(self._reply(method, payload)).encode()
+        return body
+
+    def _reply(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        published = {"offset": 1, "epoch": "epoch"}
+        text = "x" * self.item_size
+        if method == "broadcast":
+            return {
+                "result": {"responses": [{"result": published} for _ in payload["channels"]]},
+            }
+        if method == "batch":
+            return {
+                "replies": [
+                    {command_method: published}
+                    for command in payload["commands"]
+                    for command_method in command
+                ],
+            }
+        if method == "history":
+            publications = [{"data": {"text": text}, "offset": i} for i in range(self.items)]
+            return {"result": {"publications": publications, "offset": self.items, "epoch": "e"}}
+        if method == "presence":
+            presence = {
+                f"client-{i}": {"client": f"client-{i}", "user": str(i), "conn_info": text}
+                for i in range(self.items)
+            }
+            return {"result": {"presence": presence}}
+        if method == "publish":
+            return {"result": published}
+        return {"result": {}}
+
+
+class FakeCentrifugoThread:
+    """Runs FakeCentrifugo on a local port in background thread with its own event loop."""
+
+    def __init__(self, server: FakeCentrifugo, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.server = server
+        self._host = host
+        self._port = port
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._runner: Optional[web.AppRunner] = None
+        self._thread: Optional[threading.Thread] = None
+        self.api_url = ""
+
+    def start(self) -> str:
+        """Starts server, returns its API URL."""
+        loop = self._loop = asyncio.new_event_loop()
+        self._runner = web.AppRunner(self.server.app(), access_log=None)
+        loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, self._host, self._port)
+        loop.run_until_complete(site.start())
+        port = self._runner.addresses[0][1]
+        self.api_url = f"http://{self._host}:{port}/api"
+        self._thread = threading.Thread(target=loop.run_forever, name="fake-centrifugo")
+        self._thread.daemon = True
+        self._thread.start()
+        return self.api_url
+
+    def stop(self) -> None:
+        loop, runner, thread = self._loop, self._runner, self._thread
+        if loop is None or runner is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(runner.cleanup(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+        self._loop = self._runner = self._thread = None
+
+    def __enter__(self) -> "FakeCentrifugoThread":
+        self.start()
+        return self
+
+    def __exit__(self, *kwargs: Any) -> None:
+        self.stop()
@@ -1,7 +1,93 @@
-from .sync_client import Client
-from .async_client import AsyncClient
+from typing import TYPE_CHECKING
 
-__all__ = (
-    "AsyncClient",
-    "Client",
-)
+from cent._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from cent.client.sync_client import Client as Client
+    from cent.client.async_client import AsyncClient as AsyncClient
+    from cent.client.batching import (
+        BatchChunking as BatchChunking,
+        BatchPublisher as BatchPublisher,
+        CoalesceOptions as CoalesceOptions,
+    )
+    from cent.client.cache import (
+        CacheStats as CacheStats,
+        ResponseCache as ResponseCache,
+    )
+    from cent.client.cluster import (
+        ClusterSnapshot as ClusterSnapshot,
+        ClusterStatsCollector as ClusterStatsCollector,
+    )
+    from cent.client.instrumentation import (
+        Histogram as Histogram,
+        Instrumentation as Instrumentation,
+        MethodStats as MethodStats,
+        RequestEvent as RequestEvent,
+    )
+    from cent.client.limits import (
+        ConcurrencyLimiter as ConcurrencyLimiter,
+        LimiterStats as LimiterStats,
+        RateLimit as RateLimit,
+        RateLimiter as RateLimiter,
+        RateLimiterStats as RateLimiterStats,
+    )
+    from cent.client.profiler import Profiler as Profiler
+    from cent.client.retry import RetryPolicy as RetryPolicy
+    from cent.client.session import (
+        CircuitBreaker as CircuitBreaker,
+        Hedging as Hedging,
+        HedgingStats as HedgingStats,
+        LoadBalancing as LoadBalancing,
+    )
+    from cent.client.singleflight import (
+        SingleFlight as SingleFlight,
+        SingleFlightStats as SingleFlightStats,
+    )
+
+# Clients and helpers are imported on first access: Client imports only requests,
+# AsyncClient only aiohttp, and pydantic models are loaded when first needed.
+_EXPORTS = {
+    "cent.client.sync_client": ("Client",),
+    "cent.client.async_client": ("AsyncClient",),
+    "cent.client.batching": (
+        "BatchChunking",
+        "BatchPublisher",
+        "CoalesceOptions",
+    ),
+    "cent.client.cache": (
+        "CacheStats",
+        "ResponseCache",
+    ),
+    "cent.client.cluster": (
+        "ClusterSnapshot",
+        "ClusterStatsCollector",
+    ),
+    "cent.client.instrumentation": (
+        "Histogram",
+        "Instrumentation",
+        "MethodStats",
+        "RequestEvent",
+    ),
+    "cent.client.limits": (
+        "ConcurrencyLimiter",
+        "LimiterStats",
+        "RateLimit",
+        "RateLimiter",
+        "RateLimiterStats",
+    ),
+    "cent.client.profiler": ("Profiler",),
+    "cent.client.retry": ("RetryPolicy",),
+    "cent.client.session": (
+        "CircuitBreaker",
+        "Hedging",
+        "HedgingStats",
+        "LoadBalancing",
+    ),
+    "cent.client.singleflight": (
+        "SingleFlight",
+        "SingleFlightStats",
+    ),
+}
+
+if not TYPE_CHECKING:
+    __all__, __getattr__, __dir__ = lazy_attributes(globals(), _EXPORTS)
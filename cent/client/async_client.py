@@ -1,9 +1,51 @@
-from typing import Optional, Any, cast
-
-from aiohttp import ClientSession
+import asyncio
+import functools
+import time
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
-from cent.client.session import AiohttpSession
+from cent.client.batching import (
+    AsyncPublishCoalescer,
+    BatchChunking,
+    CoalesceOptions,
+    join_chunk_results,
+    split_batch,
+)
+from cent.client.cache import ResponseCache
+from cent.client.instrumentation import Instrumentation
+from cent.client.limits import ConcurrencyLimiter, RateLimiter
+from cent.client.pagination import (
+    RequestT,
+    history_page_error,
+    history_request,
+    iter_pages_async,
+    next_cursor_request,
+    next_history_request,
+)
+from cent.client.profiler import DECODE, DUMP, ENCODE, VALIDATE, Profiler, current_timer
+from cent.client.retry import RetryPolicy, call_with_retry_async, with_idempotency_keys
+from cent.client.session import (
+    AiohttpSession,
+    BalancedAiohttpSession,
+    CircuitBreaker,
+    Hedging,
+    LoadBalancing,
+)
+from cent.client.singleflight import SingleFlight
+from cent.codec import JsonCodec, default_json_codec
 from cent.dto import (
+    Response,
     CentRequest,
     CentResultType,
     PublishResult,
@@ -22,12 +64,15 @@ from cent.dto import (
     UserTopicUpdateRequest,
     UserTopicListResult,
     UserTopicListRequest,
+    UserTopic,
     DeviceTopicUpdateResult,
     DeviceTopicUpdateRequest,
     DeviceTopicListResult,
     DeviceTopicListRequest,
+    DeviceTopic,
     DeviceListResult,
     DeviceListRequest,
+    Device,
     DeviceRemoveResult,
     DeviceRemoveRequest,
     DeviceUpdateResult,
@@ -60,6 +105,8 @@ from cent.dto import (
     HistoryRemoveRequest,
     HistoryResult,
     HistoryRequest,
+    Publication,
+    StreamPosition,
     PresenceStatsResult,
     PresenceStatsRequest,
     PresenceResult,
@@ -71,53 +118,252 @@ from cent.dto import (
     SubscribeResult,
     SubscribeRequest,
 )
+from cent.exceptions import CentApiResponseError, CentError
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+
+    from cent.client.session.base_http_async import BaseHttpAsyncSession
 
 
 class AsyncClient:
     def __init__(
         self,
-        api_url: str,
+        api_url: Union[str, Sequence[str]],
         api_key: str,
         timeout: Optional[float] = 10.0,
-        session: Optional[ClientSession] = None,
+        session: Optional["ClientSession"] = None,
+        json_codec: Optional[JsonCodec] = None,
+        coalesce: Optional[CoalesceOptions] = None,
+        batch_chunking: Optional[BatchChunking] = None,
+        limiter: Optional[ConcurrencyLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        load_balancing: Optional[LoadBalancing] = None,
+        hedging: Optional[Hedging] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        single_flight: Optional[SingleFlight] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         """
         Creates new AsyncClient instance.
 
         Args:
-            api_url (str): Centrifugo API URL.
+            api_url (str | Sequence[str]): Centrifugo API URL, or API URLs of several
+                Centrifugo nodes to balance requests between.
             api_key (str): Centrifugo API key.
             timeout (float): Base timeout for all requests in seconds.
             session (aiohttp.ClientSession): Custom `aiohttp` session.
+            json_codec (JsonCodec): Codec to encode requests and decode responses,
+                standard library `json` is used by default.
+            coalesce (CoalesceOptions): Gather concurrent `publish` calls into batch
+                requests, disabled by default.
+            batch_chunking (BatchChunking): Split large batch requests into chunks sent
+                concurrently, disabled by default.
+            limiter (ConcurrencyLimiter): Limit number of requests in flight, not
+                limited by default.
+            retry_policy (RetryPolicy): Retry requests failed because of network errors,
+                timeouts or 5xx responses, no retries by default.
+            load_balancing (LoadBalancing): Options of balancing requests when several
+                API URLs provided.
+            hedging (Hedging): Send duplicate of slow read requests to another node,
+                requires several API URLs, disabled by default.
+            circuit_breaker (CircuitBreaker): Fail fast with CentCircuitOpenError
+                while Centrifugo node keeps failing, disabled by default.
+            rate_limiter (RateLimiter): Shape requests with token buckets, globally
+                and per API method, not limited by default.
+            cache (ResponseCache): Cache results of read requests, disabled
+                by default.
+            single_flight (SingleFlight): Share one in-flight request between identical
+                concurrent read requests, disabled by default.
+            instrumentation (Instrumentation): Record latency, body sizes and errors
+                of requests by API method, disabled by default.
+            profiler (Profiler): Attribute time of calls to phases from building
+                request payload to validating response, disabled by default.
         """
         self._api_key = api_key
-        self._session = AiohttpSession(
-            api_url,
-            timeout=timeout,
-            session=session,
-        )
+        self._json_codec = json_codec or default_json_codec
+        self._session: "BaseHttpAsyncSession"
+        if isinstance(api_url, str):
+            if hedging is not None:
+                raise ValueError("hedging requires several API URLs")
+            self._session = AiohttpSession(
+                api_url,
+                timeout=timeout,
+                session=session,
+                circuit_breaker=circuit_breaker,
+                trace_connections=profiler is not None,
+            )
+        else:
+            self._session = BalancedAiohttpSession(
+                api_url,
+                timeout=timeout,
+                session=session,
+                balancing=load_balancing,
+                hedging=hedging,
+                circuit_breaker=circuit_breaker,
+                trace_connections=profiler is not None,
+            )
+        self._coalescer: Optional[AsyncPublishCoalescer] = None
+        if coalesce is not None:
+            self._coalescer = AsyncPublishCoalescer(self, coalesce)
+        self._batch_chunking = batch_chunking
+        self._limiter = limiter
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._single_flight = single_flight
+        self._instrumentation = instrumentation
+        self._profiler = profiler
+        self._timeout = timeout
+        self._retry_policy = retry_policy
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._profiler
 
     async def _send(
         self,
         request: CentRequest[CentResultType],
         timeout: Optional[float] = None,
     ) -> CentResultType:
-        method = request.api_method
-        payload = request.api_payload
-        content = await self._session.make_request(
-            self._api_key,
-            method,
-            payload,
-            timeout=timeout,
-        )
-        response = request.parse_response(content)
+        request = self._prepare(request)
+        if self._profiler is None:
+            body = self._json_codec.dumps(request.api_payload)
+            return await self._send_body(request, body, timeout=timeout)
+        with self._profiler.profile(request.api_method) as timer:
+            started = time.perf_counter()
+            payload = request.api_payload
+            dumped = time.perf_counter()
+            body = self._json_codec.dumps(payload)
+            timer.add(DUMP, dumped - started)
+            timer.add(ENCODE, time.perf_counter() - dumped)
+            return await self._send_body(request, body, timeout=timeout)
+
+    def _prepare(self, request: CentRequest[CentResultType]) -> CentRequest[CentResultType]:
+        if self._retry_policy is not None and self._retry_policy.idempotency_keys:
+            return with_idempotency_keys(request)
+        return request
+
+    async def _send_body(
+        self,
+        request: CentRequest[CentResultType],
+        body: bytes,
+        timeout: Optional[float] = None,
+    ) -> CentResultType:
+        cache = self._cache
+        if cache is not None and cache.cacheable(request.api_method):
+            cached = cache.get(request.api_method, body)
+            if cached is not None:
+                return cast(CentResultType, cached)
+        single_flight = self._single_flight
+        if single_flight is not None and request.api_method in single_flight.methods:
+            return await single_flight.do(
+                (request.api_method, body),
+                lambda: self._fetch(request, body, timeout),
+            )
+        return await self._fetch(request, body, timeout)
+
+    async def _fetch(
+        self,
+        request: CentRequest[CentResultType],
+        body: bytes,
+        timeout: Optional[float],
+    ) -> CentResultType:
+        cache = self._cache
+        retry_policy = self._retry_policy
+        if retry_policy is None or not retry_policy.is_idempotent(request):
+            response, content = await self._make_request(request, body, timeout)
+        else:
+            response, content = await call_with_retry_async(
+                retry_policy,
+                lambda attempt_timeout: self._make_request(request, body, attempt_timeout),
+                timeout or self._timeout,
+            )
+        if cache is not None and cache.cacheable(request.api_method):
+            cache.put(request.api_method, body, response.result, size=len(content))
         return cast(CentResultType, response.result)
 
+    def _parse_response(
+        self,
+        request: CentRequest[CentResultType],
+        content: bytes,
+    ) -> Response[Any]:
+        timer = current_timer()
+        if timer is None:
+            return request.parse_response(content, self._json_codec)
+        started = time.perf_counter()
+        json_data = request.decode_response(content, self._json_codec)
+        decoded = time.perf_counter()
+        timer.add(DECODE, decoded - started)
+        try:
+            return request.validate_response(json_data)
+        finally:
+            timer.add(VALIDATE, time.perf_counter() - decoded)
+
+    async def _make_request(
+        self,
+        request: CentRequest[CentResultType],
+        body: bytes,
+        timeout: Optional[float],
+    ) -> Tuple[Response[Any], bytes]:
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire_async(request.api_method)
+        if self._limiter is None:
+            return await self._round_trip(request, body, timeout)
+        async with self._limiter:
+            return await self._round_trip(request, body, timeout)
+
+    async def _round_trip(
+        self,
+        request: CentRequest[CentResultType],
+        body: bytes,
+        timeout: Optional[float],
+    ) -> Tuple[Response[Any], bytes]:
+        method = request.api_method
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            content = await self._session.make_request(
+                self._api_key,
+                method,
+                body,
+                timeout=timeout,
+            )
+            return self._parse_response(request, content), content
+        started = instrumentation.request_started(method)
+        content = b""
+        finished: Optional[float] = None
+        error: Optional[BaseException] = None
+        try:
+            content = await self._session.make_request(
+                self._api_key,
+                method,
+                body,
+                timeout=timeout,
+            )
+            finished = time.perf_counter()
+            return self._parse_response(request, content), content
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            instrumentation.request_finished(
+                method,
+                started,
+                len(body),
+                len(content),
+                error,
+                finished=finished,
+            )
+
     async def publish(
         self,
         request: PublishRequest,
         timeout: Optional[float] = None,
     ) -> PublishResult:
+        if self._coalescer is not None:
+            return await self._coalescer.publish(request, timeout=timeout)
         return await self._send(request, timeout=timeout)
 
     async def broadcast(
@@ -169,6 +415,53 @@ class AsyncClient:
     ) -> HistoryResult:
         return await self._send(request, timeout=timeout)
 
+    async def iter_history(
+        self,
+        channel: str,
+        page_size: int = 100,
+        since: Optional[StreamPosition] = None,
+        reverse: bool = False,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Publication]:
+        """
+        Iterates over publications in channel history stream page by page.
+
+        Args:
+            channel (str): Name of channel.
+            page_size (int): Number of publications requested at once.
+            since (StreamPosition): Start after this position, from the stream start
+                (or top when `reverse`) by default.
+            reverse (bool): Iterate from latest to earliest publications.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+
+        Raises:
+            CentEpochChangedError: Stream epoch changed while iterating.
+        """
+
+        async def send(request: HistoryRequest) -> HistoryResult:
+            try:
+                return await self.history(request, timeout=timeout)
+            except CentApiResponseError as error:
+                epoch_error = history_page_error(request, error)
+                if epoch_error is None:
+                    raise
+                raise epoch_error from error
+
+        pages = iter_pages_async(
+            send,
+            history_request(channel, page_size, since, reverse),
+            next_history_request,
+            prefetch=prefetch,
+        )
+        try:
+            async for page in pages:
+                for publication in page.publications:
+                    yield publication
+        finally:
+            await pages.aclose()
+
     async def history_remove(
         self,
         request: HistoryRemoveRequest,
@@ -281,6 +574,27 @@ class AsyncClient:
     ) -> DeviceListResult:
         return await self._send(request, timeout=timeout)
 
+    def iter_device_list(
+        self,
+        request: DeviceListRequest,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[Device]:
+        """
+        Iterates over devices following `next_cursor` of result pages, `request.limit`
+        sets page size.
+
+        Args:
+            request (DeviceListRequest): Request of the first page.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+        """
+        return self._iter_cursor_items(
+            functools.partial(self.device_list, timeout=timeout),
+            request,
+            prefetch,
+        )
+
     async def device_topic_list(
         self,
         request: DeviceTopicListRequest,
@@ -288,6 +602,27 @@ class AsyncClient:
     ) -> DeviceTopicListResult:
         return await self._send(request, timeout=timeout)
 
+    def iter_device_topic_list(
+        self,
+        request: DeviceTopicListRequest,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[DeviceTopic]:
+        """
+        Iterates over device topics following `next_cursor` of result pages, `request.limit`
+        sets page size.
+
+        Args:
+            request (DeviceTopicListRequest): Request of the first page.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+        """
+        return self._iter_cursor_items(
+            functools.partial(self.device_topic_list, timeout=timeout),
+            request,
+            prefetch,
+        )
+
     async def device_topic_update(
         self,
         request: DeviceTopicUpdateRequest,
@@ -302,6 +637,27 @@ class AsyncClient:
     ) -> UserTopicListResult:
         return await self._send(request, timeout=timeout)
 
+    def iter_user_topic_list(
+        self,
+        request: UserTopicListRequest,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator[UserTopic]:
+        """
+        Iterates over user topics following `next_cursor` of result pages, `request.limit`
+        sets page size.
+
+        Args:
+            request (UserTopicListRequest): Request of the first page.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+        """
+        return self._iter_cursor_items(
+            functools.partial(self.user_topic_list, timeout=timeout),
+            request,
+            prefetch,
+        )
+
     async def user_topic_update(
         self,
         request: UserTopicUpdateRequest,
@@ -335,9 +691,71 @@ class AsyncClient:
         request: BatchRequest,
         timeout: Optional[float] = None,
     ) -> BatchResult:
-        return await self._send(request, timeout=timeout)
+        if self._batch_chunking is None:
+            return await self._send(request, timeout=timeout)
+        return await self._send_chunked_batch(request, self._batch_chunking, timeout=timeout)
+
+    @staticmethod
+    async def _iter_cursor_items(
+        send: Callable[[RequestT], Awaitable[Any]],
+        request: RequestT,
+        prefetch: bool,
+    ) -> AsyncIterator[Any]:
+        """Yields items of cursor paginated list pages starting from `request`."""
+        pages = iter_pages_async(send, request, next_cursor_request, prefetch=prefetch)
+        try:
+            async for page in pages:
+                for item in page.items:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def _send_chunked_batch(
+        self,
+        request: BatchRequest,
+        chunking: BatchChunking,
+        timeout: Optional[float] = None,
+    ) -> BatchResult:
+        request = cast(BatchRequest, self._prepare(request))
+        chunks = split_batch(request, self._json_codec, chunking)
+        if len(chunks) == 1:
+            chunk, body = chunks[0]
+            return await self._send_body(chunk, body, timeout=timeout)
+
+        results: List[Union[BatchResult, CentError]] = []
+        if request.parallel and chunking.concurrency > 1:
+            semaphore = asyncio.Semaphore(chunking.concurrency)
+
+            async def send_chunk(
+                chunk: BatchRequest,
+                body: bytes,
+            ) -> Union[BatchResult, CentError]:
+                async with semaphore:
+                    try:
+                        return await self._send_body(chunk, body, timeout=timeout)
+                    except CentError as error:
+                        return error
+
+            tasks = [asyncio.ensure_future(send_chunk(chunk, body)) for chunk, body in chunks]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+        else:
+            # Commands order must be kept, so chunks after the failed one are not sent.
+            for chunk, body in chunks:
+                try:
+                    results.append(await self._send_body(chunk, body, timeout=timeout))
+                except CentError as error:
+                    results.append(error)
+                    break
+        return join_chunk_results([chunk for chunk, _ in chunks], results)
 
     async def close(self) -> None:
+        if self._coalescer is not None:
+            await self._coalescer.close()
         await self._session.close()
 
     async def __aenter__(self) -> "AsyncClient":
@@ -0,0 +1,333 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Set, Tuple, Union, cast
+
+from cent.codec import JsonCodec
+from cent.dto import (
+    BatchRequest,
+    BatchResult,
+    CentRequest,
+    CentResult,
+    CentResultType,
+    PublishRequest,
+    PublishResult,
+    ReplyError,
+)
+from cent.exceptions import CentApiResponseError, CentError, CentPartialBatchError
+
+if TYPE_CHECKING:
+    from cent.client.async_client import AsyncClient
+    from cent.client.sync_client import Client
+
+
+@dataclass(frozen=True)
+class CoalesceOptions:
+    """
+    Options of publish coalescing.
+
+    Attributes:
+        max_size: Max number of publish commands sent in one batch.
+        max_delay: Max time in seconds publish command waits for other commands
+            before batch is sent.
+        parallel: Ask Centrifugo to process commands of batch in parallel.
+    """
+
+    max_size: int = 100
+    max_delay: float = 0.002
+    parallel: bool = False
+
+
+@dataclass(frozen=True)
+class BatchChunking:
+    """
+    Options of splitting large batch requests.
+
+    Attributes:
+        max_commands: Max number of commands in one chunk.
+        max_bytes: Max size of encoded chunk commands in bytes, None for no limit.
+        concurrency: Max number of chunks sent concurrently. Only used for batches
+            with `parallel` set, otherwise chunks are sent one after another to keep
+            commands order.
+    """
+
+    max_commands: int = 1000
+    max_bytes: Optional[int] = 1024 * 1024
+    concurrency: int = 4
+
+
+_PendingPublish = Tuple[PublishRequest, "asyncio.Future[PublishResult]", Optional[float]]
+
+
+class AsyncPublishCoalescer:
+    """Gathers concurrent publish calls of AsyncClient into batch requests."""
+
+    def __init__(self, client: "AsyncClient", options: CoalesceOptions) -> None:
+        self._client = client
+        self._options = options
+        self._pending: List[_PendingPublish] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set["asyncio.Task[None]"] = set()
+
+    async def publish(
+        self,
+        request: PublishRequest,
+        timeout: Optional[float] = None,
+    ) -> PublishResult:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[PublishResult] = loop.create_future()
+        self._pending.append((request, future, timeout))
+        if len(self._pending) >= self._options.max_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._options.max_delay, self._flush)
+        return await future
+
+    async def close(self) -> None:
+        """
+        Send pending commands and wait for all batches in flight.
+        """
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        pending, self._pending = self._pending, []
+        if not pending:
+            return
+        task = asyncio.ensure_future(self._dispatch(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _dispatch(self, pending: List[_PendingPublish]) -> None:
+        timeouts = [timeout for _, _, timeout in pending if timeout is not None]
+        try:
+            replies = await self._send_batch(
+                [request for request, _, _ in pending],
+                timeout=max(timeouts) if timeouts else None,
+            )
+        except Exception as error:
+            for _, future, _ in pending:
+                if not future.done():
+                    future.set_exception(error)
+            return
+
+        for (_, future, _), reply in zip(pending, replies):
+            if future.done():
+                continue
+            if isinstance(reply, ReplyError):
+                future.set_exception(_reply_exception(reply))
+            else:
+                future.set_result(cast(PublishResult, reply))
+
+    async def _send_batch(
+        self,
+        requests: List[PublishRequest],
+        timeout: Optional[float],
+    ) -> List[CentResult]:
+        batch = BatchRequest(requests=requests, parallel=self._options.parallel)
+        result = await self._client._send(batch, timeout=timeout)
+        return result.replies
+
+
+_PendingCommand = Tuple[CentRequest[Any], "Future[Any]"]
+
+
+class BatchPublisher:
+    """
+    Sends commands of sync Client in batches from a background thread.
+
+    Commands may be submitted from any thread, `submit` returns
+    `concurrent.futures.Future` resolved with command result or error.
+    """
+
+    def __init__(
+        self,
+        client: "Client",
+        max_size: int = 100,
+        max_delay: float = 0.005,
+        parallel: bool = False,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Creates new BatchPublisher instance and starts its worker thread.
+
+        Args:
+            client (Client): Client used to send batch requests.
+            max_size (int): Max number of commands sent in one batch.
+            max_delay (float): Max time in seconds command waits for other commands
+                before batch is sent.
+            parallel (bool): Ask Centrifugo to process commands of batch in parallel.
+            timeout (float): Timeout for batch requests, client timeout by default.
+        """
+        self._client = client
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._parallel = parallel
+        self._timeout = timeout
+        self._queue: queue.SimpleQueue[Optional[_PendingCommand]] = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="cent-batch-publisher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def submit(self, request: CentRequest[CentResultType]) -> "Future[CentResultType]":
+        future: Future[CentResultType] = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("BatchPublisher is closed")
+            self._queue.put((request, future))
+        return future
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """
+        Stop accepting commands, send pending ones and wait for worker thread.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join(timeout)
+
+    def __enter__(self) -> "BatchPublisher":
+        return self
+
+    def __exit__(self, *kwargs: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is None:
+                break
+            pending = [item]
+            deadline = time.monotonic() + self._max_delay
+            while len(pending) < self._max_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                pending.append(item)
+            self._dispatch(pending)
+
+    def _dispatch(self, pending: List[_PendingCommand]) -> None:
+        pending = [
+            (request, future)
+            for request, future in pending
+            if future.set_running_or_notify_cancel()
+        ]
+        if not pending:
+            return
+
+        batch = BatchRequest(
+            requests=[request for request, _ in pending],
+            parallel=self._parallel,
+        )
+        try:
+            replies = self._client._send(batch, timeout=self._timeout).replies
+        except Exception as error:
+            for _, future in pending:
+                future.set_exception(error)
+            return
+
+        for (_, future), reply in zip(pending, replies):
+            if isinstance(reply, ReplyError):
+                future.set_exception(_reply_exception(reply))
+            else:
+                future.set_result(reply)
+
+
+def _reply_exception(reply: ReplyError) -> CentApiResponseError:
+    return CentApiResponseError(code=reply.code, message=reply.message)
+
+
+def split_batch(
+    request: BatchRequest,
+    json_codec: JsonCodec,
+    chunking: BatchChunking,
+) -> List[Tuple[BatchRequest, bytes]]:
+    """
+    Splits batch request into chunks respecting command count and size limits.
+
+    Every command is encoded once, chunk bodies are assembled from encoded
+    commands. Returns chunk requests together with their encoded bodies.
+    """
+    parallel = b"true" if request.parallel else b"false"
+    chunks: List[Tuple[BatchRequest, bytes]] = []
+    chunk_requests: List[Any] = []
+    chunk_commands: List[bytes] = []
+    chunk_size = 0
+
+    def flush() -> None:
+        body = b'{"commands":[' + b",".join(chunk_commands) + b'],"parallel":' + parallel + b"}"
+        chunks.append((BatchRequest(requests=chunk_requests, parallel=request.parallel), body))
+
+    for command_request in request.requests:
+        command = json_codec.dumps(
+            {command_request.__api_method__: command_request.model_dump(exclude_none=True)},
+        )
+        if chunk_requests and (
+            len(chunk_requests) >= chunking.max_commands
+            or (
+                chunking.max_bytes is not None
+                and chunk_size + len(command) > chunking.max_bytes
+            )
+        ):
+            flush()
+            chunk_requests, chunk_commands, chunk_size = [], [], 0
+        chunk_requests.append(command_request)
+        chunk_commands.append(command)
+        chunk_size += len(command) + 1
+
+    if chunk_requests or not chunks:
+        flush()
+    return chunks
+
+
+def join_chunk_results(
+    chunks: Sequence[BatchRequest],
+    results: Sequence[Union[BatchResult, CentError]],
+) -> BatchResult:
+    """
+    Joins results of batch chunks into one BatchResult. Chunks missing in results
+    (not sent after previous chunk failed) fail with the error of the last failed
+    chunk. If no chunk succeeded, the first error is raised as is, otherwise
+    CentPartialBatchError with replies of succeeded chunks.
+    """
+    replies: List[Optional[CentResult]] = []
+    errors: Dict[int, CentError] = {}
+    first_error: Optional[CentError] = None
+    error: Optional[CentError] = None
+    for index, chunk in enumerate(chunks):
+        result = results[index] if index < len(results) else error
+        if isinstance(result, BatchResult):
+            replies.extend(result.replies)
+            continue
+        error = cast(CentError, result)
+        first_error = first_error or error
+        for _ in chunk.requests:
+            errors[len(replies)] = error
+            replies.append(None)
+    if first_error is None:
+        return BatchResult(replies=cast(List[CentResult], replies))
+    if len(errors) == len(replies):
+        raise first_error
+    raise CentPartialBatchError(replies, errors) from first_error
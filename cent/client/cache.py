@@ -0,0 +1,150 @@
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Iterator, Mapping, Optional, Tuple
+
+DEFAULT_TTL: Mapping[str, float] = {
+    "presence": 1.0,
+    "presence_stats": 1.0,
+}
+
+_bypass: ContextVar[bool] = ContextVar("cent_cache_bypass", default=False)
+
+_CacheKey = Tuple[str, bytes]
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Snapshot of ResponseCache state.
+
+    Attributes:
+        entries: Number of cached results.
+        size: Approximate memory taken by cached results in bytes, measured as size
+            of encoded requests and responses.
+        hits: Number of requests answered from cache.
+        misses: Number of cacheable requests sent to Centrifugo.
+        evictions: Number of results evicted to fit size limits.
+    """
+
+    entries: int
+    size: int
+    hits: int
+    misses: int
+    evictions: int
+
+
+class ResponseCache:
+    """
+    Read-through cache of API results keyed by API method and request payload.
+    Expired results are dropped on access, least recently used ones are evicted
+    when limits are reached. Shared between threads and coroutines.
+    """
+
+    def __init__(
+        self,
+        ttl: Mapping[str, float] = DEFAULT_TTL,
+        max_entries: int = 10000,
+        max_size: Optional[int] = 64 * 1024 * 1024,
+    ) -> None:
+        """
+        Creates new ResponseCache instance.
+
+        Args:
+            ttl (Mapping[str, float]): Time to live of cached results in seconds by API
+                method, only methods listed here are cached. `presence` and
+                `presence_stats` results are cached for 1 second by default.
+            max_entries (int): Max number of cached results.
+            max_size (int): Max approximate memory taken by cached results in bytes,
+                None for no limit.
+        """
+        self._ttl = dict(ttl)
+        self._max_entries = max_entries
+        self._max_size = max_size
+        self._entries: OrderedDict[_CacheKey, Tuple[float, int, Any]] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            entries=len(self._entries),
+            size=self._size,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def cacheable(self, method: str) -> bool:
+        return method in self._ttl
+
+    def get(self, method: str, body: bytes) -> Optional[Any]:
+        """
+        Returns cached result of request, None if there is no fresh one or cache
+        is bypassed.
+        """
+        if _bypass.get():
+            return None
+        key = (method, body)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, size, result = entry
+                if expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return result
+                del self._entries[key]
+                self._size -= size
+            self._misses += 1
+            return None
+
+    def put(self, method: str, body: bytes, result: Any, size: int) -> None:
+        """Caches result of request, `size` is approximate memory taken by it."""
+        if result is None:
+            return
+        size += len(body)
+        if self._max_size is not None and size > self._max_size:
+            return
+        key = (method, body)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous[1]
+            self._entries[key] = (time.monotonic() + self._ttl[method], size, result)
+            self._size += size
+            while len(self._entries) > self._max_entries or (
+                self._max_size is not None and self._size > self._max_size
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._size -= evicted_size
+                self._evictions += 1
+
+    def invalidate(self, method: Optional[str] = None) -> None:
+        """Drops cached results of API method, or all cached results."""
+        with self._lock:
+            if method is None:
+                self._entries.clear()
+                self._size = 0
+                return
+            keys = [key for key in self._entries if key[0] == method]
+            for key in keys:
+                self._size -= self._entries.pop(key)[1]
+
+    @staticmethod
+    @contextmanager
+    def bypass() -> Iterator[None]:
+        """
+        Requests sent within this context (thread or asyncio task) skip cache,
+        their results are still cached for others.
+        """
+        token = _bypass.set(True)
+        try:
+            yield
+        finally:
+            _bypass.reset(token)
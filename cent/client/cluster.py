@@ -0,0 +1,224 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from cent.dto import InfoRequest, Node
+from cent.exceptions import CentError
+
+if TYPE_CHECKING:
+    from cent.client.async_client import AsyncClient
+
+
+@dataclass(frozen=True)
+class ClusterSnapshot:
+    """
+    Cluster state returned by one `info` call.
+
+    Attributes:
+        timestamp: Unix time of the snapshot.
+        monotonic: Monotonic clock time of the snapshot, used to calculate rates.
+        nodes: Nodes of the cluster.
+    """
+
+    timestamp: float
+    monotonic: float
+    nodes: Tuple[Node, ...]
+
+
+# Node gauges exposed in Prometheus format: metric name, help, value getter.
+_NODE_GAUGES: Tuple[Tuple[str, str, Callable[[Node], Optional[float]]], ...] = (
+    ("centrifugo_node_clients", "Number of client connections.", lambda n: n.num_clients),
+    ("centrifugo_node_subscriptions", "Number of subscriptions.", lambda n: n.num_subs),
+    ("centrifugo_node_users", "Number of unique users.", lambda n: n.num_users),
+    ("centrifugo_node_channels", "Number of channels.", lambda n: n.num_channels),
+    ("centrifugo_node_uptime_seconds", "Node uptime in seconds.", lambda n: n.uptime),
+    (
+        "centrifugo_node_process_cpu",
+        "Node process CPU usage in percents.",
+        lambda n: n.process.cpu if n.process else None,
+    ),
+    (
+        "centrifugo_node_process_rss_bytes",
+        "Node process resident set size in bytes.",
+        lambda n: n.process.rss if n.process else None,
+    ),
+)
+
+
+class ClusterStatsCollector:
+    """
+    Polls `info` of Centrifugo cluster in background, keeps ring buffer of recent
+    snapshots and exposes node stats, metric deltas and rates, also in Prometheus
+    text format.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncClient",
+        interval: float = 10.0,
+        history: int = 60,
+        timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Creates new ClusterStatsCollector instance.
+
+        Args:
+            client (AsyncClient): Client used to call `info`.
+            interval (float): Time in seconds between `info` calls.
+            history (int): Number of recent snapshots kept.
+            timeout (float): Timeout of `info` call, client timeout by default.
+        """
+        self._client = client
+        self._interval = interval
+        self._timeout = timeout
+        self._snapshots: Deque[ClusterSnapshot] = deque(maxlen=history)
+        self._task: Optional[asyncio.Task[None]] = None
+        self.errors = 0
+        self.last_error: Optional[CentError] = None
+
+    @property
+    def snapshots(self) -> List[ClusterSnapshot]:
+        """Recent snapshots from the oldest to the latest."""
+        return list(self._snapshots)
+
+    @property
+    def latest(self) -> Optional[ClusterSnapshot]:
+        return self._snapshots[-1] if self._snapshots else None
+
+    async def collect(self) -> ClusterSnapshot:
+        """Calls `info` once and stores snapshot."""
+        result = await self._client.info(InfoRequest(), timeout=self._timeout)
+        snapshot = ClusterSnapshot(
+            timestamp=time.time(),
+            monotonic=time.monotonic(),
+            nodes=tuple(result.nodes),
+        )
+        self._snapshots.append(snapshot)
+        return snapshot
+
+    def start(self) -> None:
+        """Starts polling in background task of the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    async def __aenter__(self) -> "ClusterStatsCollector":
+        self.start()
+        return self
+
+    async def __aexit__(self, *kwargs: Any) -> None:
+        await self.stop()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.collect()
+            except CentError as error:
+                # Keep polling, Centrifugo may be temporarily unavailable.
+                self.errors += 1
+                self.last_error = error
+            await asyncio.sleep(self._interval)
+
+    def deltas(self, window: int = 1) -> Dict[str, Dict[str, float]]:
+        """
+        Returns change of metric values of each node (by uid) over last `window`
+        intervals. Nodes and metrics missing in any of two snapshots are skipped.
+        """
+        pair = self._pair(window)
+        if pair is None:
+            return {}
+        previous, latest = pair
+        previous_nodes = {node.uid: node for node in previous.nodes}
+        deltas: Dict[str, Dict[str, float]] = {}
+        for node in latest.nodes:
+            old = previous_nodes.get(node.uid)
+            if old is None or old.metrics is None or node.metrics is None:
+                continue
+            old_items = old.metrics.items
+            deltas[node.uid] = {
+                name: value - old_items[name]
+                for name, value in node.metrics.items.items()
+                if name in old_items
+            }
+        return deltas
+
+    def rates(self, window: int = 1) -> Dict[str, Dict[str, float]]:
+        """
+        Returns per-second rates of metric values of each node (by uid) over last
+        `window` intervals. Negative deltas (counter reset on restart) are skipped.
+        """
+        pair = self._pair(window)
+        if pair is None:
+            return {}
+        elapsed = pair[1].monotonic - pair[0].monotonic
+        if elapsed <= 0:
+            return {}
+        return {
+            node: {name: delta / elapsed for name, delta in deltas.items() if delta >= 0}
+            for node, deltas in self.deltas(window).items()
+        }
+
+    def prometheus(self) -> str:
+        """Returns latest snapshot and metric rates in Prometheus text exposition format."""
+        latest = self.latest
+        if latest is None:
+            return ""
+        lines: List[str] = []
+        for name, help_text, getter in _NODE_GAUGES:
+            samples = [
+                f"{name}{{{_node_labels(node)}}} {_number(value)}"
+                for node in latest.nodes
+                for value in [getter(node)]
+                if value is not None
+            ]
+            if samples:
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} gauge")
+                lines.extend(samples)
+
+        metric_lines = [
+            f'centrifugo_node_metric{{{_node_labels(node)},name="{_escape(metric)}"}} '
+            f"{_number(value)}"
+            for node in latest.nodes
+            if node.metrics is not None
+            for metric, value in sorted(node.metrics.items.items())
+        ]
+        if metric_lines:
+            lines.append("# HELP centrifugo_node_metric Node metric values reported by info.")
+            lines.append("# TYPE centrifugo_node_metric gauge")
+            lines.extend(metric_lines)
+
+        rates = self.rates()
+        if rates:
+            nodes = {node.uid: node for node in latest.nodes}
+            lines.append("# HELP centrifugo_node_metric_rate Per-second rate of node metric.")
+            lines.append("# TYPE centrifugo_node_metric_rate gauge")
+            for uid, node_rates in rates.items():
+                for metric, value in sorted(node_rates.items()):
+                    labels = f'{_node_labels(nodes[uid])},name="{_escape(metric)}"'
+                    lines.append(f"centrifugo_node_metric_rate{{{labels}}} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _pair(self, window: int) -> Optional[Tuple[ClusterSnapshot, ClusterSnapshot]]:
+        if len(self._snapshots) <= window:
+            return None
+        return self._snapshots[-1 - window], self._snapshots[-1]
+
+
+def _node_labels(node: Node) -> str:
+    return f'node="{_escape(node.name)}",uid="{_escape(node.uid)}"'
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
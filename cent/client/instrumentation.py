@@ -0,0 +1,230 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Values are kept in log-linear buckets like in HDR histogram: values below
+# _SUB_BUCKETS are exact, larger ones share bucket with values of the same
+# power of two and the same 6 most significant bits, i.e. relative error < 1/64.
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_HALF_SUB_BUCKETS = _SUB_BUCKETS >> 1
+
+logger = logging.getLogger(__name__)
+
+
+def _bucket_index(value: int) -> int:
+    if value < _SUB_BUCKETS:
+        return value
+    shift = value.bit_length() - _SUB_BUCKET_BITS
+    return shift * _HALF_SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_value(index: int) -> int:
+    """Returns the highest value counted in bucket."""
+    if index < _SUB_BUCKETS:
+        return index
+    shift = index // _HALF_SUB_BUCKETS - 1
+    return ((index - shift * _HALF_SUB_BUCKETS + 1) << shift) - 1
+
+
+class Histogram:
+    """
+    Low overhead histogram of non-negative values with ~1.6% precision of
+    percentiles. Values are multiplied by `scale` and counted as integers, e.g.
+    scale 1e6 keeps latencies in seconds with microsecond resolution. Not thread-safe.
+    """
+
+    def __init__(self, scale: float = 1.0) -> None:
+        self.scale = scale
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+        self._counts: List[int] = []
+
+    def record(self, value: float) -> None:
+        index = _bucket_index(max(0, int(value * self.scale)))
+        counts = self._counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] += 1
+        if not self.count or value < self.min:
+            self.min = value
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percentile: float) -> float:
+        """Returns value below or equal to which `percentile` percents of values are."""
+        if not self.count:
+            return 0.0
+        rank = max(1, round(self.count * percentile / 100))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self.max, _bucket_value(index) / self.scale)
+        return self.max
+
+    def percentiles(self, percentiles: Iterable[float] = (50, 90, 99, 99.9)) -> Dict[float, float]:
+        return {percentile: self.percentile(percentile) for percentile in percentiles}
+
+    def merge(self, other: "Histogram") -> None:
+        """Adds values counted by other histogram with the same scale."""
+        if not other.count:
+            return
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for index, count in enumerate(other._counts):
+            self._counts[index] += count
+        self.min = min(self.min, other.min) if self.count else other.min
+        self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def copy(self) -> "Histogram":
+        histogram = Histogram(self.scale)
+        histogram.merge(self)
+        return histogram
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """
+    Finished HTTP request to Centrifugo API, passed to instrumentation hooks.
+
+    Attributes:
+        method: API method.
+        duration: Time in seconds from sending request to reading response.
+        request_size: Size of request body in bytes.
+        response_size: Size of response body in bytes, 0 if request failed.
+        error: Error request failed with, including Centrifugo API errors.
+    """
+
+    method: str
+    duration: float
+    request_size: int
+    response_size: int
+    error: Optional[BaseException] = None
+
+
+@dataclass
+class MethodStats:
+    """
+    Stats of requests of one API method.
+
+    Attributes:
+        in_flight: Number of requests in flight.
+        latency: Histogram of request durations in seconds.
+        request_size: Histogram of request body sizes in bytes.
+        response_size: Histogram of response body sizes in bytes.
+        errors: Number of failed requests by error class name.
+    """
+
+    in_flight: int = 0
+    latency: Histogram = field(default_factory=lambda: Histogram(scale=1e6))
+    request_size: Histogram = field(default_factory=Histogram)
+    response_size: Histogram = field(default_factory=Histogram)
+    errors: Dict[str, int] = field(default_factory=dict)
+
+    def copy(self) -> "MethodStats":
+        return MethodStats(
+            in_flight=self.in_flight,
+            latency=self.latency.copy(),
+            request_size=self.request_size.copy(),
+            response_size=self.response_size.copy(),
+            errors=dict(self.errors),
+        )
+
+
+RequestHook = Callable[[RequestEvent], None]
+
+
+class Instrumentation:
+    """
+    Records latency, body sizes, errors and requests in flight of HTTP requests
+    to Centrifugo API by API method, and calls user hooks for every finished
+    request. Shared between threads and coroutines.
+    """
+
+    def __init__(self, hooks: Iterable[RequestHook] = ()) -> None:
+        """
+        Creates new Instrumentation instance.
+
+        Args:
+            hooks (Iterable[Callable[[RequestEvent], None]]): Callbacks called with
+                every finished request. Hooks are called synchronously, keep them fast.
+        """
+        self._hooks = list(hooks)
+        self._methods: Dict[str, MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook: RequestHook) -> None:
+        self._hooks.append(hook)
+
+    def stats(self) -> Dict[str, MethodStats]:
+        """Returns copy of stats by API method."""
+        with self._lock:
+            return {method: stats.copy() for method, stats in self._methods.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods = {
+                method: MethodStats(in_flight=stats.in_flight)
+                for method, stats in self._methods.items()
+            }
+
+    def request_started(self, method: str) -> float:
+        """Counts request in flight, returns start time to pass to `request_finished`."""
+        with self._lock:
+            stats = self._methods.get(method)
+            if stats is None:
+                stats = self._methods[method] = MethodStats()
+            stats.in_flight += 1
+        return time.perf_counter()
+
+    def request_finished(
+        self,
+        method: str,
+        started: float,
+        request_size: int,
+        response_size: int,
+        error: Optional[BaseException] = None,
+        finished: Optional[float] = None,
+    ) -> None:
+        """
+        Records finished request and calls hooks. Error is either the one request
+        failed with or the one its response was parsed to, `finished` is the time
+        response was received at, now by default. Errors of hooks are logged, they
+        don't affect the request.
+        """
+        if finished is None:
+            finished = time.perf_counter()
+        event = RequestEvent(
+            method=method,
+            duration=finished - started,
+            request_size=request_size,
+            response_size=response_size,
+            error=error,
+        )
+        with self._lock:
+            stats = self._methods.setdefault(method, MethodStats(in_flight=1))
+            stats.in_flight -= 1
+            stats.latency.record(event.duration)
+            stats.request_size.record(request_size)
+            if error is None:
+                stats.response_size.record(response_size)
+            else:
+                name = type(error).__name__
+                stats.errors[name] = stats.errors.get(name, 0) + 1
+        for hook in self._hooks:
+            try:
+                hook(event)
+            except Exception:
+                logger.exception("instrumentation hook %r failed", hook)
@@ -0,0 +1,264 @@
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional
+
+from cent.exceptions import CentQueueFullError, CentRateLimitError
+
+
+@dataclass(frozen=True)
+class LimiterStats:
+    """
+    Snapshot of ConcurrencyLimiter state.
+
+    Attributes:
+        in_flight: Number of requests in flight.
+        waiting: Number of requests waiting in queue.
+        acquired: Total number of requests let through.
+        rejected: Total number of requests rejected because queue was full or
+            queue timeout expired.
+        wait_time_total: Total time in seconds requests spent in queue.
+        wait_time_max: Max time in seconds request spent in queue.
+    """
+
+    in_flight: int
+    waiting: int
+    acquired: int
+    rejected: int
+    wait_time_total: float
+    wait_time_max: float
+
+
+class ConcurrencyLimiter:
+    """Limits number of AsyncClient requests in flight."""
+
+    def __init__(
+        self,
+        max_in_flight: int,
+        max_queue: Optional[int] = None,
+        queue_timeout: Optional[float] = None,
+    ) -> None:
+        """
+        Creates new ConcurrencyLimiter instance.
+
+        Args:
+            max_in_flight (int): Max number of requests sent concurrently.
+            max_queue (int): Max number of requests waiting for a free slot, requests
+                over this limit fail immediately with CentQueueFullError. Unbounded
+                by default.
+            queue_timeout (float): Max time in seconds request waits for a free slot
+                before failing with CentQueueFullError. Unbounded by default.
+        """
+        self._max_in_flight = max_in_flight
+        self._max_queue = max_queue
+        self._queue_timeout = queue_timeout
+        # Created lazily to bind to the running event loop.
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+
+    def stats(self) -> LimiterStats:
+        return LimiterStats(
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            acquired=self._acquired,
+            rejected=self._rejected,
+            wait_time_total=self._wait_time_total,
+            wait_time_max=self._wait_time_max,
+        )
+
+    async def acquire(self) -> None:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_in_flight)
+        semaphore = self._semaphore
+
+        if semaphore.locked() and self._max_queue is not None and self._waiting >= self._max_queue:
+            self._rejected += 1
+            raise CentQueueFullError(
+                message=f"{self._waiting} requests already waiting",
+            )
+
+        self._waiting += 1
+        started = time.monotonic()
+        try:
+            if self._queue_timeout is None:
+                await semaphore.acquire()
+            else:
+                await asyncio.wait_for(semaphore.acquire(), self._queue_timeout)
+        except asyncio.TimeoutError as error:
+            self._rejected += 1
+            raise CentQueueFullError(
+                message=f"no free slot within {self._queue_timeout}s",
+            ) from error
+        finally:
+            self._waiting -= 1
+
+        wait_time = time.monotonic() - started
+        self._wait_time_total += wait_time
+        self._wait_time_max = max(self._wait_time_max, wait_time)
+        self._acquired += 1
+        self._in_flight += 1
+
+    def release(self) -> None:
+        if self._semaphore is not None:
+            self._in_flight -= 1
+            self._semaphore.release()
+
+    async def __aenter__(self) -> "ConcurrencyLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *kwargs: Any) -> None:
+        self.release()
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Token bucket options.
+
+    Attributes:
+        rate: Number of requests per second.
+        burst: Max number of requests sent at once after idle period, `rate`
+            rounded up by default.
+    """
+
+    rate: float
+    burst: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            raise ValueError("rate must be positive")
+        if self.burst is not None and self.burst < 1:
+            raise ValueError("burst must be at least 1")
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """
+    Snapshot of RateLimiter counters.
+
+    Attributes:
+        acquired: Total number of requests let through.
+        delayed: Number of requests which waited for a token.
+        rejected: Number of requests rejected with CentRateLimitError.
+        wait_time_total: Total time in seconds requests waited for tokens.
+    """
+
+    acquired: int
+    delayed: int
+    rejected: int
+    wait_time_total: float
+
+
+class _TokenBucket:
+    def __init__(self, limit: RateLimit) -> None:
+        self.rate = limit.rate
+        self.capacity = float(limit.burst or math.ceil(limit.rate))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+
+    def wait_time(self, now: float) -> float:
+        """Refills bucket and returns time in seconds until token is available."""
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class RateLimiter:
+    """
+    Shapes client requests with token buckets: global one for all requests and
+    separate ones for some API methods. Shared between threads and coroutines.
+
+    Subclass and override `reserve` to plug in a different limiting algorithm.
+    """
+
+    def __init__(
+        self,
+        limit: Optional[RateLimit] = None,
+        method_limits: Optional[Mapping[str, RateLimit]] = None,
+        block: bool = True,
+        max_wait: Optional[float] = None,
+    ) -> None:
+        """
+        Creates new RateLimiter instance.
+
+        Args:
+            limit (RateLimit): Limit of all requests, not limited by default.
+            method_limits (Mapping[str, RateLimit]): Limits of requests by API method,
+                for example `{"device_register": RateLimit(rate=50)}`. Batch request
+                counts as one `batch` request.
+            block (bool): Wait for token when limit is reached, otherwise fail
+                immediately with CentRateLimitError.
+            max_wait (float): Max time in seconds request may wait for token, requests
+                which would wait longer fail immediately with CentRateLimitError.
+                Unbounded by default.
+        """
+        self._global = _TokenBucket(limit) if limit is not None else None
+        self._methods = {
+            method: _TokenBucket(method_limit)
+            for method, method_limit in (method_limits or {}).items()
+        }
+        self._block = block
+        self._max_wait = max_wait
+        self._lock = threading.Lock()
+        self._acquired = 0
+        self._delayed = 0
+        self._rejected = 0
+        self._wait_time_total = 0.0
+
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(
+            acquired=self._acquired,
+            delayed=self._delayed,
+            rejected=self._rejected,
+            wait_time_total=self._wait_time_total,
+        )
+
+    def reserve(self, method: str) -> float:
+        """
+        Takes tokens for request of API method and returns time in seconds request
+        must wait before being sent. Raises CentRateLimitError if request can't wait.
+        """
+        buckets = [self._global, self._methods.get(method)]
+        with self._lock:
+            now = time.monotonic()
+            wait_time = max(
+                (bucket.wait_time(now) for bucket in buckets if bucket is not None),
+                default=0.0,
+            )
+            if wait_time > 0 and (
+                not self._block or (self._max_wait is not None and wait_time > self._max_wait)
+            ):
+                self._rejected += 1
+                raise CentRateLimitError(
+                    message=f"rate limit of {method} exceeded",
+                    retry_after=wait_time,
+                )
+            # Tokens may go negative: waiting requests are queued by their reservations.
+            for bucket in buckets:
+                if bucket is not None:
+                    bucket.tokens -= 1
+            self._acquired += 1
+            if wait_time > 0:
+                self._delayed += 1
+                self._wait_time_total += wait_time
+        return wait_time
+
+    def acquire(self, method: str) -> None:
+        """Blocks current thread until request of API method may be sent."""
+        wait_time = self.reserve(method)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, method: str) -> None:
+        """Waits until request of API method may be sent without blocking event loop."""
+        wait_time = self.reserve(method)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
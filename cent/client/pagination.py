@@ -0,0 +1,159 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
+    Optional,
+    TypeVar,
+)
+
+from cent.dto import CentRequest, HistoryRequest, HistoryResult, StreamPosition
+from cent.exceptions import CentApiResponseError, CentEpochChangedError
+
+RequestT = TypeVar("RequestT", bound=CentRequest[Any])
+ResultT = TypeVar("ResultT")
+
+# Centrifugo error code returned when `since` position can't be recovered.
+UNRECOVERABLE_POSITION = 112
+
+NextRequest = Callable[[RequestT, ResultT], Optional[RequestT]]
+
+
+async def iter_pages_async(
+    send: Callable[[RequestT], Awaitable[ResultT]],
+    request: RequestT,
+    next_request: NextRequest[RequestT, ResultT],
+    prefetch: bool = True,
+) -> AsyncGenerator[ResultT, None]:
+    """
+    Yields results of consecutive page requests. With `prefetch` the next page is
+    requested while the consumer processes the current one, so at most two pages
+    are held in memory.
+    """
+    pending: Optional[asyncio.Future[ResultT]] = None
+    try:
+        result = await send(request)
+        while True:
+            following = next_request(request, result)
+            if following is not None and prefetch:
+                pending = asyncio.ensure_future(send(following))
+            yield result
+            if following is None:
+                return
+            request = following
+            if pending is not None:
+                result, pending = await pending, None
+            else:
+                result = await send(request)
+    finally:
+        if pending is not None:
+            if pending.done() and not pending.cancelled():
+                # Consumer stopped early, error of unused page is not interesting.
+                pending.exception()
+            pending.cancel()
+
+
+def iter_pages(
+    send: Callable[[RequestT], ResultT],
+    request: RequestT,
+    next_request: NextRequest[RequestT, ResultT],
+    prefetch: bool = True,
+) -> Generator[ResultT, None, None]:
+    """
+    Yields results of consecutive page requests. With `prefetch` the next page is
+    requested from a background thread while the consumer processes the current one.
+    """
+    executor: Optional[ThreadPoolExecutor] = None
+    pending: Optional[Future[ResultT]] = None
+    try:
+        result = send(request)
+        while True:
+            following = next_request(request, result)
+            if following is not None and prefetch:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cent-page")
+                pending = executor.submit(send, following)
+            yield result
+            if following is None:
+                return
+            request = following
+            if pending is not None:
+                result, pending = pending.result(), None
+            else:
+                result = send(request)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def next_history_request(
+    request: HistoryRequest,
+    result: HistoryResult,
+) -> Optional[HistoryRequest]:
+    """
+    Returns request of the history page following `result`, None if it's the last one.
+    Raises CentEpochChangedError if stream epoch changed since previous page.
+    """
+    if request.since is not None and request.since.epoch != result.epoch:
+        raise _epoch_changed(request.channel, request.since.epoch, result.epoch)
+    publications = result.publications
+    if not publications or (request.limit and len(publications) < request.limit):
+        return None
+    last_offset = publications[-1].offset
+    # Stop without requesting empty page once stream start or top is reached.
+    reached_end = last_offset <= 1 if request.reverse else last_offset >= result.offset
+    if reached_end:
+        return None
+    return request.model_copy(
+        update={"since": StreamPosition(offset=last_offset, epoch=result.epoch)},
+    )
+
+
+def next_cursor_request(request: RequestT, result: Any) -> Optional[RequestT]:
+    """
+    Returns request of the page following `result` of cursor paginated list request
+    (device_list, device_topic_list, user_topic_list), None if it's the last one.
+    """
+    if not result.next_cursor:
+        return None
+    # Total count is only needed once, counting on every page is expensive.
+    return request.model_copy(
+        update={"cursor": result.next_cursor, "include_total_count": None},
+    )
+
+
+def history_page_error(
+    request: HistoryRequest,
+    error: CentApiResponseError,
+) -> Optional[CentEpochChangedError]:
+    """
+    Converts unrecoverable position error of history request into CentEpochChangedError,
+    returns None for other errors.
+    """
+    if error.code == UNRECOVERABLE_POSITION and request.since is not None:
+        return _epoch_changed(request.channel, request.since.epoch, "")
+    return None
+
+
+def history_request(
+    channel: str,
+    page_size: int,
+    since: Optional[StreamPosition],
+    reverse: bool,
+) -> HistoryRequest:
+    if page_size <= 0:
+        raise ValueError("page_size must be positive")
+    return HistoryRequest(channel=channel, limit=page_size, since=since, reverse=reverse)
+
+
+def _epoch_changed(channel: str, epoch: str, new_epoch: str) -> CentEpochChangedError:
+    return CentEpochChangedError(
+        message=f"history stream of {channel} was reset",
+        epoch=epoch,
+        new_epoch=new_epoch,
+    )
@@ -0,0 +1,118 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+from cent.client.instrumentation import Histogram
+
+DUMP = "dump"
+ENCODE = "encode"
+ACQUIRE = "acquire"
+NETWORK = "network"
+READ = "read"
+DECODE = "decode"
+VALIDATE = "validate"
+TOTAL = "total"
+
+PHASES = (DUMP, ENCODE, ACQUIRE, NETWORK, READ, DECODE, VALIDATE, TOTAL)
+
+_current: ContextVar[Optional["PhaseTimer"]] = ContextVar("cent_phase_timer", default=None)
+
+
+class PhaseTimer:
+    """Time spent by one API call in each phase, in seconds."""
+
+    def __init__(self) -> None:
+        self.phases: Dict[str, float] = {}
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+
+def current_timer() -> Optional[PhaseTimer]:
+    """Returns timer of API call being profiled in this context, if any."""
+    return _current.get()
+
+
+class Profiler:
+    """
+    Attributes time of client API calls to phases, aggregated by API method:
+
+    * `dump` - building request payload with pydantic `model_dump`,
+    * `encode` - encoding payload to JSON,
+    * `acquire` - getting connection from pool, including connecting
+      (only AsyncClient with its own aiohttp session, counted in `network` otherwise),
+    * `network` - sending request and waiting for response headers,
+    * `read` - reading response body,
+    * `decode` - decoding response JSON,
+    * `validate` - validating response with pydantic,
+    * `total` - whole call, including retries and waits not attributed to phases.
+
+    Phases of retried and hedged requests are summed. Shared between threads and
+    coroutines.
+    """
+
+    def __init__(self) -> None:
+        self._methods: Dict[str, Dict[str, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def profile(self, method: str) -> Iterator[PhaseTimer]:
+        """Makes new timer current within the context and records it on exit."""
+        timer = PhaseTimer()
+        token = _current.set(timer)
+        started = time.perf_counter()
+        try:
+            yield timer
+        finally:
+            timer.add(TOTAL, time.perf_counter() - started)
+            _current.reset(token)
+            self.record(method, timer)
+
+    def record(self, method: str, timer: PhaseTimer) -> None:
+        with self._lock:
+            phases = self._methods.get(method)
+            if phases is None:
+                phases = self._methods[method] = {}
+            for phase, seconds in timer.phases.items():
+                histogram = phases.get(phase)
+                if histogram is None:
+                    histogram = phases[phase] = Histogram(scale=1e6)
+                histogram.record(seconds)
+
+    def stats(self) -> Dict[str, Dict[str, Histogram]]:
+        """Returns copy of phase duration histograms (in seconds) by API method."""
+        with self._lock:
+            return {
+                method: {phase: histogram.copy() for phase, histogram in phases.items()}
+                for method, phases in self._methods.items()
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._methods = {}
+
+    def to_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """Returns summary of phase durations in seconds by API method."""
+        return {
+            method: {
+                phase: {
+                    "count": histogram.count,
+                    "total": histogram.total,
+                    "mean": histogram.mean,
+                    "p50": histogram.percentile(50),
+                    "p90": histogram.percentile(90),
+                    "p99": histogram.percentile(99),
+                    "max": histogram.max,
+                }
+                for phase in PHASES
+                for histogram in [phases.get(phase)]
+                if histogram is not None
+            }
+            for method, phases in self.stats().items()
+        }
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        return json.dumps(self.to_dict(), indent=indent)
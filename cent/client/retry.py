@@ -0,0 +1,181 @@
+import asyncio
+import random
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, FrozenSet, Optional, TypeVar, cast
+
+from cent.client.session.hedging import READ_METHODS
+from cent.dto import (
+    BatchRequest,
+    BroadcastRequest,
+    CentRequest,
+    CentResultType,
+    PublishRequest,
+)
+from cent.exceptions import (
+    CentError,
+    CentNetworkError,
+    CentTimeoutError,
+    CentTransportError,
+)
+
+T = TypeVar("T")
+
+# Methods which have the same effect when applied several times.
+IDEMPOTENT_METHODS = READ_METHODS | frozenset({
+    "subscribe",
+    "unsubscribe",
+    "disconnect",
+    "refresh",
+    "history_remove",
+    "update_user_status",
+    "delete_user_status",
+    "block_user",
+    "unblock_user",
+    "revoke_token",
+    "invalidate_user_tokens",
+    "device_update",
+    "device_remove",
+    "device_topic_update",
+    "user_topic_update",
+    "update_push_status",
+    "cancel_push",
+})
+
+# Sessions treat zero timeout as no timeout passed, so attempt started right at
+# the deadline gets the smallest positive one instead.
+_MIN_ATTEMPT_TIMEOUT = 0.001
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Policy of retrying requests failed because of network errors, timeouts
+    or 5xx responses.
+
+    Attributes:
+        max_attempts: Max number of attempts including the first one.
+        backoff_base: Delay in seconds before the first retry, doubled on every
+            next retry.
+        backoff_max: Max delay in seconds between attempts.
+        deadline: Max total time in seconds spent on all attempts and delays between
+            them. Timeout of every attempt is cut to time left until deadline, no retry
+            is made if it does not fit into deadline.
+        retry_statuses: HTTP status codes to retry.
+        idempotency_keys: Set `idempotency_key` of publish and broadcast requests
+            (including ones in batch) if not set, so Centrifugo drops duplicate
+            publications made by retries.
+        methods: API methods safe to retry. Publish and broadcast requests are also
+            retried if they have `idempotency_key`, batch requests if all their
+            commands may be retried.
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.1
+    backoff_max: float = 2.0
+    deadline: Optional[float] = None
+    retry_statuses: FrozenSet[int] = frozenset({500, 502, 503, 504})
+    idempotency_keys: bool = True
+    methods: FrozenSet[str] = IDEMPOTENT_METHODS
+
+    def is_idempotent(self, request: CentRequest[Any]) -> bool:
+        """Tells whether request may be retried without applying it twice."""
+        if isinstance(request, BatchRequest):
+            return all(self.is_idempotent(command) for command in request.requests)
+        if isinstance(request, (PublishRequest, BroadcastRequest)) and request.idempotency_key:
+            return True
+        return request.api_method in self.methods
+
+    def is_retryable(self, error: CentError) -> bool:
+        if isinstance(error, (CentNetworkError, CentTimeoutError)):
+            return True
+        return isinstance(error, CentTransportError) and (
+            error.status_code in self.retry_statuses
+        )
+
+    def backoff(self, retry: int) -> float:
+        """
+        Returns delay before retry number `retry` (starting from 0), uses full
+        jitter to spread retries of many clients over time.
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2**retry))
+        return random.uniform(0, delay)  # noqa: S311
+
+    def next_delay(self, error: CentError, attempt: int, started: float) -> Optional[float]:
+        """
+        Returns delay before next attempt or None if request should not be retried.
+        """
+        if attempt >= self.max_attempts or not self.is_retryable(error):
+            return None
+        delay = self.backoff(attempt - 1)
+        if self.deadline is not None and time.monotonic() - started + delay >= self.deadline:
+            return None
+        return delay
+
+    def attempt_timeout(self, timeout: Optional[float], started: float) -> Optional[float]:
+        """Returns timeout of next attempt, `timeout` cut to time left until deadline."""
+        if self.deadline is None:
+            return timeout
+        left = max(self.deadline - (time.monotonic() - started), _MIN_ATTEMPT_TIMEOUT)
+        return left if timeout is None else min(timeout, left)
+
+
+def call_with_retry(
+    policy: RetryPolicy,
+    func: Callable[[Optional[float]], T],
+    timeout: Optional[float],
+) -> T:
+    """Calls `func` with attempt timeout until it succeeds or policy stops retries."""
+    started = time.monotonic()
+    attempt = 1
+    while True:
+        try:
+            return func(policy.attempt_timeout(timeout, started))
+        except CentError as error:
+            delay = policy.next_delay(error, attempt, started)
+            if delay is None:
+                raise
+        time.sleep(delay)
+        attempt += 1
+
+
+async def call_with_retry_async(
+    policy: RetryPolicy,
+    func: Callable[[Optional[float]], Awaitable[T]],
+    timeout: Optional[float],
+) -> T:
+    """Awaits `func` with attempt timeout until it succeeds or policy stops retries."""
+    started = time.monotonic()
+    attempt = 1
+    while True:
+        try:
+            return await func(policy.attempt_timeout(timeout, started))
+        except CentError as error:
+            delay = policy.next_delay(error, attempt, started)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def with_idempotency_keys(
+    request: CentRequest[CentResultType],
+) -> CentRequest[CentResultType]:
+    """
+    Returns copy of request with `idempotency_key` set for publish and broadcast
+    commands which don't have it.
+    """
+    return cast(CentRequest[CentResultType], _with_idempotency_keys(request))
+
+
+def _with_idempotency_keys(request: Any) -> Any:
+    if isinstance(request, (PublishRequest, BroadcastRequest)):
+        if request.idempotency_key is None:
+            return request.model_copy(update={"idempotency_key": uuid.uuid4().hex})
+        return request
+    if isinstance(request, BatchRequest):
+        requests = [_with_idempotency_keys(command) for command in request.requests]
+        if any(new is not old for new, old in zip(requests, request.requests)):
+            return request.model_copy(update={"requests": requests})
+    return request
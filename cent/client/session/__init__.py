@@ -1,7 +1,41 @@
-from .aiohttp import AiohttpSession
-from .requests import RequestsSession
+from typing import TYPE_CHECKING
 
-__all__ = (
-    "AiohttpSession",
-    "RequestsSession",
-)
+from cent._lazy import lazy_attributes
+
+if TYPE_CHECKING:
+    from cent.client.session.breaker import CircuitBreaker as CircuitBreaker
+    from cent.client.session.hedging import (
+        Hedging as Hedging,
+        HedgingStats as HedgingStats,
+    )
+    from cent.client.session.pool import LoadBalancing as LoadBalancing
+    from cent.client.session.aiohttp import (
+        AiohttpSession as AiohttpSession,
+        BalancedAiohttpSession as BalancedAiohttpSession,
+    )
+    from cent.client.session.requests import (
+        RequestsSession as RequestsSession,
+        BalancedRequestsSession as BalancedRequestsSession,
+    )
+
+# Transports are imported on first access, so only the HTTP library of the
+# transport in use gets imported.
+_EXPORTS = {
+    "cent.client.session.breaker": ("CircuitBreaker",),
+    "cent.client.session.hedging": (
+        "Hedging",
+        "HedgingStats",
+    ),
+    "cent.client.session.pool": ("LoadBalancing",),
+    "cent.client.session.aiohttp": (
+        "AiohttpSession",
+        "BalancedAiohttpSession",
+    ),
+    "cent.client.session.requests": (
+        "RequestsSession",
+        "BalancedRequestsSession",
+    ),
+}
+
+if not TYPE_CHECKING:
+    __all__, __getattr__, __dir__ = lazy_attributes(globals(), _EXPORTS)
@@ -1,10 +1,45 @@
 import asyncio
-from typing import Optional, Dict, Any
+import time
+from types import SimpleNamespace
+from typing import Any, Optional, Sequence, Set
 
-from aiohttp import ClientSession, ClientError
+from aiohttp import ClientSession, ClientError, TraceConfig
 
+from cent.client.profiler import ACQUIRE, NETWORK, READ, PhaseTimer, current_timer
 from cent.client.session.base_http_async import BaseHttpAsyncSession
-from cent.exceptions import CentNetworkError, CentTimeoutError
+from cent.client.session.breaker import CircuitBreaker, EndpointBreaker
+from cent.client.session.hedging import Hedging
+from cent.client.session.pool import Endpoint, EndpointPool, LoadBalancing
+from cent.exceptions import CentError, CentNetworkError, CentTimeoutError
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class _Attempt:
+    __slots__ = ("connected", "started", "timer")
+
+    def __init__(self, timer: PhaseTimer) -> None:
+        self.timer = timer
+        self.started = time.perf_counter()
+        self.connected: Optional[float] = None
+
+
+async def _on_connection_acquired(
+    session: ClientSession,  # noqa: ARG001
+    context: SimpleNamespace,
+    params: Any,  # noqa: ARG001
+) -> None:
+    attempt = context.trace_request_ctx
+    if isinstance(attempt, _Attempt):
+        attempt.connected = time.perf_counter()
+
+
+def _connection_trace_config() -> TraceConfig:
+    trace_config = TraceConfig()
+    trace_config.on_connection_create_end.append(_on_connection_acquired)
+    trace_config.on_connection_reuseconn.append(_on_connection_acquired)
+    return trace_config
 
 
 class AiohttpSession(BaseHttpAsyncSession):
@@ -13,13 +48,21 @@ class AiohttpSession(BaseHttpAsyncSession):
         base_url: str,
         timeout: Optional[float] = 10.0,
         session: Optional[ClientSession] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        trace_connections: bool = False,
     ) -> None:
         super().__init__()
         self._base_url = base_url
         self._timeout = timeout
+        self.breaker: Optional[EndpointBreaker] = None
+        if circuit_breaker is not None:
+            self.breaker = EndpointBreaker(base_url, circuit_breaker)
         self._session: ClientSession
         if session:
             self._session = session
+        elif trace_connections:
+            # Lets profiler tell waiting for connection from network round trip.
+            self._session = ClientSession(trace_configs=[_connection_trace_config()])
         else:
             self._session = ClientSession()
 
@@ -34,22 +77,54 @@ class AiohttpSession(BaseHttpAsyncSession):
         self,
         api_key: str,
         method: str,
-        json_data: Dict[str, Any],
+        body: bytes,
         timeout: Optional[float] = None,
-    ) -> str:
+    ) -> bytes:
+        breaker = self.breaker
+        if breaker is None:
+            return await self._post(api_key, method, body, timeout)
+        breaker.before_request()
+        error: Optional[BaseException] = None
+        try:
+            return await self._post(api_key, method, body, timeout)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            breaker.after_request(error)
+
+    async def _post(
+        self,
+        api_key: str,
+        method: str,
+        body: bytes,
+        timeout: Optional[float],
+    ) -> bytes:
         session = self._session
         if api_key:
             session.headers["X-API-Key"] = api_key
 
         url = f"{self._base_url}/{method}"
 
+        timer = current_timer()
+        attempt = None if timer is None else _Attempt(timer)
         try:
             async with session.post(
                 url=url,
-                json=json_data,
+                data=body,
+                headers=_JSON_HEADERS,
                 timeout=timeout or self._timeout,
+                trace_request_ctx=attempt,
             ) as resp:
-                raw_result = await resp.text()
+                if attempt is None:
+                    raw_result = await resp.read()
+                else:
+                    received = time.perf_counter()
+                    raw_result = await resp.read()
+                    connected = attempt.connected or attempt.started
+                    attempt.timer.add(ACQUIRE, connected - attempt.started)
+                    attempt.timer.add(NETWORK, received - connected)
+                    attempt.timer.add(READ, time.perf_counter() - received)
         except asyncio.TimeoutError as error:
             raise CentTimeoutError(
                 message="Request timeout",
@@ -66,3 +141,140 @@ class AiohttpSession(BaseHttpAsyncSession):
             if self._session.connector is not None and self._session.connector_owner:
                 self._session.connector.close()
             self._session._connector = None
+
+
+class BalancedAiohttpSession(BaseHttpAsyncSession):
+    """Spreads requests over several Centrifugo nodes."""
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        timeout: Optional[float] = 10.0,
+        session: Optional[ClientSession] = None,
+        balancing: Optional[LoadBalancing] = None,
+        hedging: Optional[Hedging] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        trace_connections: bool = False,
+    ) -> None:
+        super().__init__()
+        self.pool = EndpointPool(base_urls, balancing or LoadBalancing())
+        self._hedging = hedging
+        self._sessions = {
+            url: AiohttpSession(
+                url,
+                timeout=timeout,
+                session=session,
+                circuit_breaker=circuit_breaker,
+                trace_connections=trace_connections,
+            )
+            for url in base_urls
+        }
+        self._api_key = ""
+        self._probes: Set["asyncio.Task[None]"] = set()
+
+    async def close(self) -> None:
+        for task in self._probes:
+            task.cancel()
+        for session in self._sessions.values():
+            await session.close()
+
+    async def make_request(
+        self,
+        api_key: str,
+        method: str,
+        body: bytes,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        self._api_key = api_key
+        self._start_probes()
+        hedging = self._hedging
+        if hedging is not None and method in hedging.methods and len(self.pool.endpoints) > 1:
+            return await self._make_hedged_request(hedging, api_key, method, body, timeout)
+        return await self._attempt(self.pool.select(), api_key, method, body, timeout)
+
+    async def _attempt(
+        self,
+        endpoint: Endpoint,
+        api_key: str,
+        method: str,
+        body: bytes,
+        timeout: Optional[float],
+    ) -> bytes:
+        error: Optional[BaseException] = None
+        started = time.monotonic()
+        try:
+            content = await self._sessions[endpoint.url].make_request(
+                api_key,
+                method,
+                body,
+                timeout=timeout,
+            )
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.pool.release(endpoint, error)
+        if self._hedging is not None and method in self._hedging.methods:
+            self._hedging.observe(method, time.monotonic() - started)
+        return content
+
+    async def _make_hedged_request(
+        self,
+        hedging: Hedging,
+        api_key: str,
+        method: str,
+        body: bytes,
+        timeout: Optional[float],
+    ) -> bytes:
+        endpoint = self.pool.select()
+        primary = asyncio.ensure_future(self._attempt(endpoint, api_key, method, body, timeout))
+        tasks = [primary]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=hedging.delay(method))
+            if done:
+                hedging.record()
+                return primary.result()
+
+            hedge_endpoint = self.pool.select(exclude=[endpoint])
+            hedge = asyncio.ensure_future(
+                self._attempt(hedge_endpoint, api_key, method, body, timeout),
+            )
+            tasks.append(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        hedging.record(hedged=True, hedge_won=task is hedge)
+                        return task.result()
+            # Both attempts failed, report error of the original request.
+            hedging.record(hedged=True)
+            return primary.result()
+        finally:
+            losers = [task for task in tasks if not task.done()]
+            for task in losers:
+                task.cancel()
+            if losers:
+                # Wait for cancelled attempts to release their endpoints.
+                await asyncio.gather(*losers, return_exceptions=True)
+
+    def _start_probes(self) -> None:
+        for endpoint in self.pool.due_probes():
+            task = asyncio.ensure_future(self._probe(endpoint))
+            self._probes.add(task)
+            task.add_done_callback(self._probes.discard)
+
+    async def _probe(self, endpoint: Endpoint) -> None:
+        ok = False
+        try:
+            await self._sessions[endpoint.url].make_request(
+                self._api_key,
+                "info",
+                b"{}",
+                timeout=self.pool.options.probe_timeout,
+            )
+            ok = True
+        except CentError:
+            pass
+        finally:
+            self.pool.probe_done(endpoint, ok)
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional
 
 from cent.client.session.base_http import BaseHttpSession
 
@@ -16,9 +16,11 @@ class BaseHttpSyncSession(BaseHttpSession, ABC):
         self,
         api_key: str,
         method: str,
-        json_data: Dict[str, Any],
+        body: bytes,
         timeout: Optional[float] = None,
-    ) -> str:
+    ) -> bytes:
         """
         Make request to Centrifugo HTTP API.
+
+        Takes JSON encoded request body and returns raw response body.
         """
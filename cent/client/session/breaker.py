@@ -0,0 +1,89 @@
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from cent.client.session.pool import is_node_failure
+from cent.exceptions import CentCircuitOpenError, CentError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class CircuitBreaker:
+    """
+    Options of circuit breaker of Centrifugo node.
+
+    Attributes:
+        failure_threshold: Number of consecutive failures (network errors, timeouts,
+            5xx responses) after which circuit opens and requests fail immediately.
+        recovery_time: Time in seconds circuit stays open before trial requests
+            are let through.
+        half_open_requests: Number of trial requests sent concurrently while circuit
+            is half-open. Circuit closes if trial request succeeds and opens again
+            if it fails.
+    """
+
+    failure_threshold: int = 5
+    recovery_time: float = 30.0
+    half_open_requests: int = 1
+
+
+class EndpointBreaker:
+    """Circuit breaker state of one Centrifugo node. Thread-safe."""
+
+    def __init__(self, url: str, options: CircuitBreaker) -> None:
+        self.url = url
+        self.options = options
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._trials = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == OPEN and self._recovered():
+                return HALF_OPEN
+            return self._state
+
+    def before_request(self) -> None:
+        """
+        Lets request through or raises CentCircuitOpenError, `after_request`
+        must be called when request passed is done.
+        """
+        with self._lock:
+            if self._state == OPEN:
+                if not self._recovered():
+                    raise CentCircuitOpenError(
+                        message=f"{self.url} failed {self._failures} times in a row",
+                    )
+                self._state = HALF_OPEN
+                self._trials = 0
+            if self._state == HALF_OPEN:
+                if self._trials >= self.options.half_open_requests:
+                    raise CentCircuitOpenError(
+                        message=f"{self.url} is being probed by trial request",
+                    )
+                self._trials += 1
+
+    def after_request(self, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            half_open = self._state == HALF_OPEN
+            if error is not None and is_node_failure(error):
+                self._failures += 1
+                if half_open or self._failures >= self.options.failure_threshold:
+                    self._state = OPEN
+                    self._opened_at = time.monotonic()
+            elif error is None or isinstance(error, CentError):
+                # Node answered, errors of the request itself don't count.
+                self._state = CLOSED
+                self._failures = 0
+            if half_open and self._trials:
+                self._trials -= 1
+
+    def _recovered(self) -> bool:
+        return time.monotonic() - self._opened_at >= self.options.recovery_time
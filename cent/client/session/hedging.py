@@ -0,0 +1,113 @@
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Collection, Deque, Dict
+
+READ_METHODS = frozenset({
+    "presence",
+    "presence_stats",
+    "history",
+    "info",
+    "channels",
+    "connections",
+    "get_user_status",
+    "device_list",
+    "device_topic_list",
+    "user_topic_list",
+})
+
+
+_RECALCULATE_EVERY = 20
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """
+    Hedging counters.
+
+    Attributes:
+        requests: Number of requests eligible for hedging.
+        hedged: Number of requests for which duplicate request was sent.
+        hedge_wins: Number of hedged requests answered by duplicate request first.
+    """
+
+    requests: int
+    hedged: int
+    hedge_wins: int
+
+    @property
+    def hedge_rate(self) -> float:
+        return self.hedged / self.requests if self.requests else 0.0
+
+
+class Hedging:
+    """
+    Sends duplicate of a slow read request to another Centrifugo node and uses
+    the first successful response.
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        initial_delay: float = 0.05,
+        min_delay: float = 0.005,
+        methods: Collection[str] = READ_METHODS,
+        window: int = 1000,
+    ) -> None:
+        """
+        Creates new Hedging instance.
+
+        Args:
+            percentile (float): Duplicate request is sent if response did not arrive
+                within this percentile of recent latencies of the same API method.
+            initial_delay (float): Delay in seconds used until enough latencies
+                are observed.
+            min_delay (float): Min delay in seconds before sending duplicate request.
+            methods (Collection[str]): API methods to hedge, only idempotent read
+                methods by default.
+            window (int): Number of recent latencies per method to calculate
+                percentile from.
+        """
+        self.methods = frozenset(methods)
+        self._percentile = percentile
+        self._initial_delay = initial_delay
+        self._min_delay = min_delay
+        self._window = window
+        self._latencies: Dict[str, Deque[float]] = {}
+        self._delays: Dict[str, float] = {}
+        self._observed: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._hedged = 0
+        self._hedge_wins = 0
+
+    def stats(self) -> HedgingStats:
+        return HedgingStats(
+            requests=self._requests,
+            hedged=self._hedged,
+            hedge_wins=self._hedge_wins,
+        )
+
+    def delay(self, method: str) -> float:
+        """Returns time in seconds to wait before sending duplicate request."""
+        return max(self._min_delay, self._delays.get(method, self._initial_delay))
+
+    def observe(self, method: str, latency: float) -> None:
+        with self._lock:
+            latencies = self._latencies.get(method)
+            if latencies is None:
+                latencies = self._latencies[method] = deque(maxlen=self._window)
+            latencies.append(latency)
+            observed = self._observed.get(method, 0) + 1
+            self._observed[method] = observed
+            # Percentile is recalculated periodically to keep observe cheap.
+            if observed % _RECALCULATE_EVERY == 0:
+                ordered = sorted(latencies)
+                index = min(len(ordered) - 1, int(len(ordered) * self._percentile / 100))
+                self._delays[method] = ordered[index]
+
+    def record(self, hedged: bool = False, hedge_won: bool = False) -> None:
+        with self._lock:
+            self._requests += 1
+            self._hedged += hedged
+            self._hedge_wins += hedge_won
@@ -0,0 +1,142 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Collection, List, Optional, Sequence
+
+from cent.exceptions import (
+    CentCircuitOpenError,
+    CentNetworkError,
+    CentTimeoutError,
+    CentTransportError,
+)
+
+LEAST_OUTSTANDING = "least_outstanding"
+POWER_OF_TWO_CHOICES = "p2c"
+
+
+@dataclass(frozen=True)
+class LoadBalancing:
+    """
+    Options of balancing requests over several Centrifugo nodes.
+
+    Attributes:
+        strategy: Node selection strategy - "p2c" (pick the less loaded of two random
+            nodes) or "least_outstanding" (pick the node with the least requests
+            in flight).
+        max_failures: Number of consecutive failures after which node is ejected.
+        eject_time: Time in seconds node stays ejected before it's probed with
+            `info` request to return back into rotation.
+        probe_timeout: Timeout of probe request in seconds.
+    """
+
+    strategy: str = POWER_OF_TWO_CHOICES
+    max_failures: int = 3
+    eject_time: float = 5.0
+    probe_timeout: float = 1.0
+
+
+class Endpoint:
+    """State of one Centrifugo node in EndpointPool."""
+
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.outstanding = 0
+        self.failures = 0
+        self.ejected_until: Optional[float] = None
+        self.probing = False
+        self.requests = 0
+        self.errors = 0
+        self.ejections = 0
+
+    @property
+    def healthy(self) -> bool:
+        return self.ejected_until is None
+
+    def __repr__(self) -> str:
+        return f"Endpoint({self.url!r}, outstanding={self.outstanding}, healthy={self.healthy})"
+
+
+def is_node_failure(error: BaseException) -> bool:
+    """Whether error means node is unavailable (in contrast to error in request)."""
+    if isinstance(error, (CentNetworkError, CentTimeoutError, CentCircuitOpenError)):
+        return True
+    return isinstance(error, CentTransportError) and error.status_code >= 500  # noqa: PLR2004
+
+
+class EndpointPool:
+    """
+    Selects nodes for requests and tracks their health. Nodes failing
+    `max_failures` times in a row are ejected and probed back later. Thread-safe.
+    """
+
+    def __init__(self, urls: Sequence[str], options: LoadBalancing) -> None:
+        if not urls:
+            raise ValueError("at least one node URL required")
+        if options.strategy not in {LEAST_OUTSTANDING, POWER_OF_TWO_CHOICES}:
+            raise ValueError(f"unknown load balancing strategy: {options.strategy}")
+        self.endpoints = [Endpoint(url) for url in urls]
+        self._options = options
+        self._lock = threading.Lock()
+
+    @property
+    def options(self) -> LoadBalancing:
+        return self._options
+
+    def select(self, exclude: Collection[Endpoint] = ()) -> Endpoint:
+        """
+        Selects endpoint for request and counts request as outstanding, `release`
+        must be called when request is done.
+        """
+        with self._lock:
+            candidates = [e for e in self.endpoints if e.healthy and e not in exclude]
+            if not candidates:
+                # All nodes are ejected - still try instead of failing without request.
+                candidates = [e for e in self.endpoints if e not in exclude] or self.endpoints
+            if self._options.strategy == POWER_OF_TWO_CHOICES and len(candidates) > 1:
+                first, second = random.sample(candidates, 2)
+                endpoint = first if first.outstanding <= second.outstanding else second
+            else:
+                least = min(e.outstanding for e in candidates)
+                endpoint = random.choice([e for e in candidates if e.outstanding == least])  # noqa: S311
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, error: Optional[BaseException] = None) -> None:
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is None or not is_node_failure(error):
+                endpoint.failures = 0
+                return
+            endpoint.errors += 1
+            endpoint.failures += 1
+            if endpoint.healthy and endpoint.failures >= self._options.max_failures:
+                endpoint.ejected_until = time.monotonic() + self._options.eject_time
+                endpoint.ejections += 1
+
+    def due_probes(self) -> List[Endpoint]:
+        """
+        Returns ejected endpoints which should be probed now, marks them as being probed.
+        """
+        now = time.monotonic()
+        due = []
+        with self._lock:
+            for endpoint in self.endpoints:
+                if (
+                    endpoint.ejected_until is not None
+                    and not endpoint.probing
+                    and now >= endpoint.ejected_until
+                ):
+                    endpoint.probing = True
+                    due.append(endpoint)
+        return due
+
+    def probe_done(self, endpoint: Endpoint, ok: bool) -> None:
+        with self._lock:
+            endpoint.probing = False
+            if ok:
+                endpoint.ejected_until = None
+                endpoint.failures = 0
+            else:
+                endpoint.ejected_until = time.monotonic() + self._options.eject_time
@@ -1,10 +1,18 @@
-from typing import Optional, Dict, Any
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Sequence
 
 import requests
 from requests import Session
 
+from cent.client.profiler import NETWORK, READ, current_timer
 from cent.client.session.base_http_sync import BaseHttpSyncSession
-from cent.exceptions import CentNetworkError, CentTimeoutError
+from cent.client.session.breaker import CircuitBreaker, EndpointBreaker
+from cent.client.session.pool import Endpoint, EndpointPool, LoadBalancing
+from cent.exceptions import CentError, CentNetworkError, CentTimeoutError
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class RequestsSession(BaseHttpSyncSession):
@@ -13,10 +21,14 @@ class RequestsSession(BaseHttpSyncSession):
         base_url: str,
         timeout: Optional[float] = 10.0,
         session: Optional[Session] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
     ) -> None:
         super().__init__()
         self._base_url = base_url
         self._timeout = timeout
+        self.breaker: Optional[EndpointBreaker] = None
+        if circuit_breaker is not None:
+            self.breaker = EndpointBreaker(base_url, circuit_breaker)
         self._session: Session
         if session:
             self._session = session
@@ -31,20 +43,59 @@ class RequestsSession(BaseHttpSyncSession):
         self,
         api_key: str,
         method: str,
-        json_data: Dict[str, Any],
+        body: bytes,
         timeout: Optional[float] = None,
-    ) -> str:
+    ) -> bytes:
+        breaker = self.breaker
+        if breaker is None:
+            return self._post(api_key, method, body, timeout)
+        breaker.before_request()
+        error: Optional[BaseException] = None
+        try:
+            return self._post(api_key, method, body, timeout)
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            breaker.after_request(error)
+
+    def _post(
+        self,
+        api_key: str,
+        method: str,
+        body: bytes,
+        timeout: Optional[float],
+    ) -> bytes:
         if api_key:
             self._session.headers["X-API-Key"] = api_key
 
         url = f"{self._base_url}/{method}"
 
+        timer = current_timer()
         try:
-            raw_result = self._session.post(
-                url=url,
-                json=json_data,
-                timeout=timeout or self._timeout,
-            )
+            if timer is None:
+                raw_result = self._session.post(
+                    url=url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=timeout or self._timeout,
+                )
+                content = raw_result.content
+            else:
+                # Stream to tell waiting for response headers from reading body,
+                # connecting can't be told from sending with requests.
+                started = time.perf_counter()
+                raw_result = self._session.post(
+                    url=url,
+                    data=body,
+                    headers=_JSON_HEADERS,
+                    timeout=timeout or self._timeout,
+                    stream=True,
+                )
+                received = time.perf_counter()
+                content = raw_result.content
+                timer.add(NETWORK, received - started)
+                timer.add(READ, time.perf_counter() - received)
         except requests.exceptions.Timeout as error:
             raise CentTimeoutError(
                 message="Request timeout",
@@ -56,7 +107,88 @@ class RequestsSession(BaseHttpSyncSession):
         self.check_status_code(
             status_code=raw_result.status_code,
         )
-        return raw_result.text
+        return content
 
     def __del__(self) -> None:
         self.close()
+
+
+class BalancedRequestsSession(BaseHttpSyncSession):
+    """Spreads requests over several Centrifugo nodes."""
+
+    def __init__(
+        self,
+        base_urls: Sequence[str],
+        timeout: Optional[float] = 10.0,
+        session: Optional[Session] = None,
+        balancing: Optional[LoadBalancing] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+    ) -> None:
+        super().__init__()
+        self.pool = EndpointPool(base_urls, balancing or LoadBalancing())
+        self._sessions = {
+            url: RequestsSession(
+                url,
+                timeout=timeout,
+                session=session,
+                circuit_breaker=circuit_breaker,
+            )
+            for url in base_urls
+        }
+        self._api_key = ""
+        self._prober: Optional[ThreadPoolExecutor] = None
+
+    def close(self) -> None:
+        if self._prober is not None:
+            self._prober.shutdown(wait=False)
+            self._prober = None
+        for session in self._sessions.values():
+            session.close()
+
+    def make_request(
+        self,
+        api_key: str,
+        method: str,
+        body: bytes,
+        timeout: Optional[float] = None,
+    ) -> bytes:
+        self._api_key = api_key
+        self._start_probes()
+        endpoint = self.pool.select()
+        error: Optional[BaseException] = None
+        try:
+            return self._sessions[endpoint.url].make_request(
+                api_key,
+                method,
+                body,
+                timeout=timeout,
+            )
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            self.pool.release(endpoint, error)
+
+    def _start_probes(self) -> None:
+        for endpoint in self.pool.due_probes():
+            if self._prober is None:
+                self._prober = ThreadPoolExecutor(
+                    max_workers=1,
+                    thread_name_prefix="cent-probe",
+                )
+            self._prober.submit(self._probe, endpoint)
+
+    def _probe(self, endpoint: Endpoint) -> None:
+        ok = False
+        try:
+            self._sessions[endpoint.url].make_request(
+                self._api_key,
+                "info",
+                b"{}",
+                timeout=self.pool.options.probe_timeout,
+            )
+            ok = True
+        except CentError:
+            pass
+        finally:
+            self.pool.probe_done(endpoint, ok)
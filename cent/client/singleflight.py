@@ -0,0 +1,90 @@
+import asyncio
+import functools
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Collection, Dict, Hashable, TypeVar
+
+from cent.client.session.hedging import READ_METHODS
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class SingleFlightStats:
+    """
+    SingleFlight counters.
+
+    Attributes:
+        in_flight: Number of distinct requests in flight.
+        requests: Number of requests which started new round trip.
+        shared: Number of requests which joined identical request in flight.
+    """
+
+    in_flight: int
+    requests: int
+    shared: int
+
+
+class _Flight:
+    def __init__(self, task: "asyncio.Future[Any]") -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Collapses identical concurrent AsyncClient read requests: while a request is
+    in flight, identical requests (same API method and payload) wait for its
+    result instead of sending their own. Nothing is kept after the request is done.
+    """
+
+    def __init__(self, methods: Collection[str] = READ_METHODS) -> None:
+        """
+        Creates new SingleFlight instance.
+
+        Args:
+            methods (Collection[str]): API methods to collapse, only idempotent read
+                methods by default.
+        """
+        self.methods = frozenset(methods)
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._requests = 0
+        self._shared = 0
+
+    def stats(self) -> SingleFlightStats:
+        return SingleFlightStats(
+            in_flight=len(self._flights),
+            requests=self._requests,
+            shared=self._shared,
+        )
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[T]]) -> T:
+        """
+        Returns result of `call`, or of the call with the same key already in flight.
+        The call is cancelled only when all requests waiting for it are cancelled.
+        """
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = self._flights[key] = _Flight(asyncio.ensure_future(call()))
+            flight.task.add_done_callback(functools.partial(self._forget, key))
+            self._requests += 1
+        else:
+            self._shared += 1
+
+        flight.waiters += 1
+        try:
+            result: T = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            flight.waiters -= 1
+            if not flight.waiters:
+                flight.task.cancel()
+            raise
+        flight.waiters -= 1
+        return result
+
+    def _forget(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        flight = self._flights.get(key)
+        if flight is not None and flight.task is task:
+            del self._flights[key]
+        if not task.cancelled():
+            # Retrieve error in case all waiters were cancelled before it happened.
+            task.exception()
@@ -1,8 +1,43 @@
-from typing import Optional, Any, cast
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
-from requests import Session
-from cent.client.session import RequestsSession
+from cent.client.batching import BatchChunking, join_chunk_results, split_batch
+from cent.client.cache import ResponseCache
+from cent.client.instrumentation import Instrumentation
+from cent.client.limits import RateLimiter
+from cent.client.pagination import (
+    history_page_error,
+    history_request,
+    RequestT,
+    iter_pages,
+    next_cursor_request,
+    next_history_request,
+)
+from cent.client.profiler import DECODE, DUMP, ENCODE, VALIDATE, Profiler, current_timer
+from cent.client.retry import RetryPolicy, call_with_retry, with_idempotency_keys
+from cent.client.session import (
+    BalancedRequestsSession,
+    CircuitBreaker,
+    LoadBalancing,
+    RequestsSession,
+)
+from cent.codec import JsonCodec, default_json_codec
 from cent.dto import (
+    Response,
     CentRequest,
     CentResultType,
     BatchResult,
@@ -17,12 +52,15 @@ from cent.dto import (
     UserTopicUpdateRequest,
     UserTopicListResult,
     UserTopicListRequest,
+    UserTopic,
     DeviceTopicUpdateResult,
     DeviceTopicUpdateRequest,
     DeviceTopicListResult,
     DeviceTopicListRequest,
+    DeviceTopic,
     DeviceListResult,
     DeviceListRequest,
+    Device,
     DeviceRemoveResult,
     DeviceRemoveRequest,
     DeviceUpdateResult,
@@ -55,6 +93,8 @@ from cent.dto import (
     HistoryRemoveRequest,
     HistoryResult,
     HistoryRequest,
+    Publication,
+    StreamPosition,
     PresenceStatsResult,
     PresenceStatsRequest,
     PresenceResult,
@@ -70,48 +110,201 @@ from cent.dto import (
     PublishResult,
     PublishRequest,
 )
+from cent.exceptions import CentApiResponseError, CentError
+
+if TYPE_CHECKING:
+    from requests import Session
+
+    from cent.client.session.base_http_sync import BaseHttpSyncSession
 
 
 class Client:
     def __init__(
         self,
-        api_url: str,
+        api_url: Union[str, Sequence[str]],
         api_key: str,
         timeout: Optional[float] = 10.0,
-        session: Optional[Session] = None,
+        session: Optional["Session"] = None,
+        json_codec: Optional[JsonCodec] = None,
+        batch_chunking: Optional[BatchChunking] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        load_balancing: Optional[LoadBalancing] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ResponseCache] = None,
+        instrumentation: Optional[Instrumentation] = None,
+        profiler: Optional[Profiler] = None,
     ) -> None:
         """
         Creates new Client instance.
 
         Args:
-            api_url (str): Centrifugo API URL.
+            api_url (str | Sequence[str]): Centrifugo API URL, or API URLs of several
+                Centrifugo nodes to balance requests between.
             api_key (str): Centrifugo API key.
             timeout (float): Base timeout for all requests in seconds.
             session (requests.Session): Custom `requests` session.
+            json_codec (JsonCodec): Codec to encode requests and decode responses,
+                standard library `json` is used by default.
+            batch_chunking (BatchChunking): Split large batch requests into chunks sent
+                over a thread pool, disabled by default.
+            retry_policy (RetryPolicy): Retry requests failed because of network errors,
+                timeouts or 5xx responses, no retries by default.
+            load_balancing (LoadBalancing): Options of balancing requests when several
+                API URLs provided.
+            circuit_breaker (CircuitBreaker): Fail fast with CentCircuitOpenError
+                while Centrifugo node keeps failing, disabled by default.
+            rate_limiter (RateLimiter): Shape requests with token buckets, blocking or
+                failing fast, globally and per API method, not limited by default.
+            cache (ResponseCache): Cache results of read requests, disabled
+                by default.
+            instrumentation (Instrumentation): Record latency, body sizes and errors
+                of requests by API method, disabled by default.
+            profiler (Profiler): Attribute time of calls to phases from building
+                request payload to validating response, disabled by default.
         """
 
         self._api_url = api_url
         self._api_key = api_key
-        self._session = RequestsSession(
-            api_url,
-            timeout=timeout,
-            session=session,
-        )
+        self._json_codec = json_codec or default_json_codec
+        self._session: "BaseHttpSyncSession"
+        if isinstance(api_url, str):
+            self._session = RequestsSession(
+                api_url,
+                timeout=timeout,
+                session=session,
+                circuit_breaker=circuit_breaker,
+            )
+        else:
+            self._session = BalancedRequestsSession(
+                api_url,
+                timeout=timeout,
+                session=session,
+                balancing=load_balancing,
+                circuit_breaker=circuit_breaker,
+            )
+        self._batch_chunking = batch_chunking
+        self._batch_executor: Optional[ThreadPoolExecutor] = None
+        self._batch_executor_lock = threading.Lock()
+        self._timeout = timeout
+        self._retry_policy = retry_policy
+        self._rate_limiter = rate_limiter
+        self._cache = cache
+        self._instrumentation = instrumentation
+        self._profiler = profiler
+
+    @property
+    def profiler(self) -> Optional[Profiler]:
+        return self._profiler
 
     def _send(
         self,
         request: CentRequest[CentResultType],
         timeout: Optional[float] = None,
     ) -> CentResultType:
-        content = self._session.make_request(
-            self._api_key,
-            request.api_method,
-            request.api_payload,
-            timeout=timeout,
-        )
-        response = request.parse_response(content)
+        request = self._prepare(request)
+        if self._profiler is None:
+            body = self._json_codec.dumps(request.api_payload)
+            return self._send_body(request, body, timeout=timeout)
+        with self._profiler.profile(request.api_method) as timer:
+            started = time.perf_counter()
+            payload = request.api_payload
+            dumped = time.perf_counter()
+            body = self._json_codec.dumps(payload)
+            timer.add(DUMP, dumped - started)
+            timer.add(ENCODE, time.perf_counter() - dumped)
+            return self._send_body(request, body, timeout=timeout)
+
+    def _prepare(self, request: CentRequest[CentResultType]) -> CentRequest[CentResultType]:
+        if self._retry_policy is not None and self._retry_policy.idempotency_keys:
+            return with_idempotency_keys(request)
+        return request
+
+    def _send_body(
+        self,
+        request: CentRequest[CentResultType],
+        body: bytes,
+        timeout: Optional[float] = None,
+    ) -> CentResultType:
+        cache = self._cache
+        if cache is not None and cache.cacheable(request.api_method):
+            cached = cache.get(request.api_method, body)
+            if cached is not None:
+                return cast(CentResultType, cached)
+        retry_policy = self._retry_policy
+        if retry_policy is None or not retry_policy.is_idempotent(request):
+            response, content = self._make_request(request, body, timeout)
+        else:
+            response, content = call_with_retry(
+                retry_policy,
+                lambda attempt_timeout: self._make_request(request, body, attempt_timeout),
+                timeout or self._timeout,
+            )
+        if cache is not None and cache.cacheable(request.api_method):
+            cache.put(request.api_method, body, response.result, size=len(content))
         return cast(CentResultType, response.result)
 
+    def _parse_response(
+        self,
+        request: CentRequest[CentResultType],
+        content: bytes,
+    ) -> Response[Any]:
+        timer = current_timer()
+        if timer is None:
+            return request.parse_response(content, self._json_codec)
+        started = time.perf_counter()
+        json_data = request.decode_response(content, self._json_codec)
+        decoded = time.perf_counter()
+        timer.add(DECODE, decoded - started)
+        try:
+            return request.validate_response(json_data)
+        finally:
+            timer.add(VALIDATE, time.perf_counter() - decoded)
+
+    def _make_request(
+        self,
+        request: CentRequest[CentResultType],
+        body: bytes,
+        timeout: Optional[float],
+    ) -> Tuple[Response[Any], bytes]:
+        method = request.api_method
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire(method)
+        instrumentation = self._instrumentation
+        if instrumentation is None:
+            content = self._session.make_request(
+                self._api_key,
+                method,
+                body,
+                timeout=timeout,
+            )
+            return self._parse_response(request, content), content
+        started = instrumentation.request_started(method)
+        content = b""
+        finished: Optional[float] = None
+        error: Optional[BaseException] = None
+        try:
+            content = self._session.make_request(
+                self._api_key,
+                method,
+                body,
+                timeout=timeout,
+            )
+            finished = time.perf_counter()
+            return self._parse_response(request, content), content
+        except BaseException as exc:
+            error = exc
+            raise
+        finally:
+            instrumentation.request_finished(
+                method,
+                started,
+                len(body),
+                len(content),
+                error,
+                finished=finished,
+            )
+
     def publish(
         self,
         request: PublishRequest,
@@ -168,6 +361,53 @@ class Client:
     ) -> HistoryResult:
         return self._send(request, timeout=timeout)
 
+    def iter_history(
+        self,
+        channel: str,
+        page_size: int = 100,
+        since: Optional[StreamPosition] = None,
+        reverse: bool = False,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Publication]:
+        """
+        Iterates over publications in channel history stream page by page.
+
+        Args:
+            channel (str): Name of channel.
+            page_size (int): Number of publications requested at once.
+            since (StreamPosition): Start after this position, from the stream start
+                (or top when `reverse`) by default.
+            reverse (bool): Iterate from latest to earliest publications.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+
+        Raises:
+            CentEpochChangedError: Stream epoch changed while iterating.
+        """
+
+        def send(request: HistoryRequest) -> HistoryResult:
+            try:
+                return self.history(request, timeout=timeout)
+            except CentApiResponseError as error:
+                epoch_error = history_page_error(request, error)
+                if epoch_error is None:
+                    raise
+                raise epoch_error from error
+
+        pages = iter_pages(
+            send,
+            history_request(channel, page_size, since, reverse),
+            next_history_request,
+            prefetch=prefetch,
+        )
+        try:
+            for page in pages:
+                for publication in page.publications:
+                    yield publication
+        finally:
+            pages.close()
+
     def history_remove(
         self,
         request: HistoryRemoveRequest,
@@ -280,6 +520,27 @@ class Client:
     ) -> DeviceListResult:
         return self._send(request, timeout=timeout)
 
+    def iter_device_list(
+        self,
+        request: DeviceListRequest,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[Device]:
+        """
+        Iterates over devices following `next_cursor` of result pages, `request.limit`
+        sets page size.
+
+        Args:
+            request (DeviceListRequest): Request of the first page.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+        """
+        return self._iter_cursor_items(
+            functools.partial(self.device_list, timeout=timeout),
+            request,
+            prefetch,
+        )
+
     def device_topic_list(
         self,
         request: DeviceTopicListRequest,
@@ -287,6 +548,27 @@ class Client:
     ) -> DeviceTopicListResult:
         return self._send(request, timeout=timeout)
 
+    def iter_device_topic_list(
+        self,
+        request: DeviceTopicListRequest,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[DeviceTopic]:
+        """
+        Iterates over device topics following `next_cursor` of result pages, `request.limit`
+        sets page size.
+
+        Args:
+            request (DeviceTopicListRequest): Request of the first page.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+        """
+        return self._iter_cursor_items(
+            functools.partial(self.device_topic_list, timeout=timeout),
+            request,
+            prefetch,
+        )
+
     def device_topic_update(
         self,
         request: DeviceTopicUpdateRequest,
@@ -301,6 +583,27 @@ class Client:
     ) -> UserTopicListResult:
         return self._send(request, timeout=timeout)
 
+    def iter_user_topic_list(
+        self,
+        request: UserTopicListRequest,
+        prefetch: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Iterator[UserTopic]:
+        """
+        Iterates over user topics following `next_cursor` of result pages, `request.limit`
+        sets page size.
+
+        Args:
+            request (UserTopicListRequest): Request of the first page.
+            prefetch (bool): Request next page while current one is processed.
+            timeout (float): Timeout of each page request.
+        """
+        return self._iter_cursor_items(
+            functools.partial(self.user_topic_list, timeout=timeout),
+            request,
+            prefetch,
+        )
+
     def user_topic_update(
         self,
         request: UserTopicUpdateRequest,
@@ -334,9 +637,73 @@ class Client:
         request: BatchRequest,
         timeout: Optional[float] = None,
     ) -> BatchResult:
-        return self._send(request, timeout=timeout)
+        if self._batch_chunking is None:
+            return self._send(request, timeout=timeout)
+        return self._send_chunked_batch(request, self._batch_chunking, timeout=timeout)
+
+    @staticmethod
+    def _iter_cursor_items(
+        send: Callable[[RequestT], Any],
+        request: RequestT,
+        prefetch: bool,
+    ) -> Iterator[Any]:
+        """Yields items of cursor paginated list pages starting from `request`."""
+        pages = iter_pages(send, request, next_cursor_request, prefetch=prefetch)
+        try:
+            for page in pages:
+                yield from page.items
+        finally:
+            pages.close()
+
+    def _send_chunked_batch(
+        self,
+        request: BatchRequest,
+        chunking: BatchChunking,
+        timeout: Optional[float] = None,
+    ) -> BatchResult:
+        request = cast(BatchRequest, self._prepare(request))
+        chunks = split_batch(request, self._json_codec, chunking)
+        if len(chunks) == 1:
+            chunk, body = chunks[0]
+            return self._send_body(chunk, body, timeout=timeout)
+
+        results: List[Union[BatchResult, CentError]] = []
+        if request.parallel and chunking.concurrency > 1:
+            executor = self._get_batch_executor(chunking.concurrency)
+            futures = [
+                executor.submit(self._send_body, chunk, body, timeout)
+                for chunk, body in chunks
+            ]
+            for future in futures:
+                try:
+                    results.append(future.result())
+                except CentError as error:
+                    results.append(error)
+        else:
+            # Commands order must be kept, so chunks after the failed one are not sent.
+            for chunk, body in chunks:
+                try:
+                    results.append(self._send_body(chunk, body, timeout=timeout))
+                except CentError as error:
+                    results.append(error)
+                    break
+        return join_chunk_results([chunk for chunk, _ in chunks], results)
+
+    def _get_batch_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        # Client is shared between threads, lock so only one executor is created.
+        with self._batch_executor_lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix="cent-batch",
+                )
+            return self._batch_executor
 
     def close(self) -> None:
+        with self._batch_executor_lock:
+            executor, self._batch_executor = self._batch_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         self._session.close()
 
     def __enter__(self) -> "Client":
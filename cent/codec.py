@@ -0,0 +1,72 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Union
+
+
+class JsonCodec(ABC):
+    """Base class for JSON codecs used to encode requests and decode responses."""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """
+        Encode object to JSON bytes.
+        """
+
+    @abstractmethod
+    def loads(self, data: Union[str, bytes]) -> Any:
+        """
+        Decode JSON document.
+        """
+
+
+class StdlibJsonCodec(JsonCodec):
+    """JSON codec based on standard library `json` module."""
+
+    @staticmethod
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    @staticmethod
+    def loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on `orjson` library (`pip install orjson`)."""
+
+    def __init__(self) -> None:
+        try:
+            import orjson  # noqa: PLC0415
+        except ImportError as error:
+            raise ImportError("OrjsonCodec requires orjson: pip install orjson") from error
+        self._dumps = orjson.dumps
+        self._loads = orjson.loads
+
+    def dumps(self, obj: Any) -> bytes:
+        encoded: bytes = self._dumps(obj)
+        return encoded
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._loads(data)
+
+
+class MsgspecCodec(JsonCodec):
+    """JSON codec based on `msgspec` library (`pip install msgspec`)."""
+
+    def __init__(self) -> None:
+        try:
+            import msgspec  # noqa: PLC0415
+        except ImportError as error:
+            raise ImportError("MsgspecCodec requires msgspec: pip install msgspec") from error
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        encoded: bytes = self._encoder.encode(obj)
+        return encoded
+
+    def loads(self, data: Union[str, bytes]) -> Any:
+        return self._decoder.decode(data)
+
+
+default_json_codec: JsonCodec = StdlibJsonCodec()
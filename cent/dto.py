@@ -1,8 +1,23 @@
-import json
+import threading
 from abc import ABC, abstractmethod
-from typing import TypeVar, Any, Generic, TYPE_CHECKING, ClassVar, Optional, List, Dict
+from typing import (
+    TypeVar,
+    Any,
+    Generic,
+    TYPE_CHECKING,
+    ClassVar,
+    Optional,
+    List,
+    Dict,
+    Iterable,
+    Type,
+    Union,
+    Callable,
+    Tuple,
+)
 from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, ValidationError
 
+from cent.codec import JsonCodec, default_json_codec
 from cent.exceptions import CentDecodeError, CentApiResponseError
 
 
@@ -63,19 +78,30 @@ class CentRequest(BaseModel, Generic[CentResultType], ABC):
 
     def parse_response(
         self,
-        content: str,
+        content: Union[str, bytes],
+        json_codec: Optional[JsonCodec] = None,
     ) -> Response[CentResult]:
+        return self.validate_response(self.decode_response(content, json_codec))
+
+    @staticmethod
+    def decode_response(
+        content: Union[str, bytes],
+        json_codec: Optional[JsonCodec] = None,
+    ) -> Any:
+        """Decodes response JSON, first step of `parse_response`."""
         try:
-            json_data = json.loads(content)
+            return (json_codec or default_json_codec).loads(content)
         except Exception as err:
             raise CentDecodeError from err
 
-        if isinstance(self, BatchRequest):
-            json_data = _validate_batch(self, json_data["replies"])
-
+    def validate_response(self, json_data: Any) -> Response[CentResult]:
+        """Validates decoded response, second step of `parse_response`."""
+        if not isinstance(json_data, dict):
+            raise CentDecodeError
         try:
-            response_type = Response[self.__returning__]  # type: ignore
-            response = TypeAdapter(response_type).validate_python(
+            if isinstance(self, BatchRequest) and "replies" in json_data:
+                json_data = _validate_batch(self, json_data["replies"])
+            response = get_response_adapter(self.__returning__).validate_python(
                 json_data,
             )
         except ValidationError as err:
@@ -90,6 +116,75 @@ class CentRequest(BaseModel, Generic[CentResultType], ABC):
         return response
 
 
+_adapters: Dict[Any, "TypeAdapter[Any]"] = {}
+_adapters_lock = threading.Lock()
+
+
+def _get_adapter(key: Any, build: Callable[[], "TypeAdapter[Any]"]) -> "TypeAdapter[Any]":
+    adapter = _adapters.get(key)
+    if adapter is not None:
+        return adapter
+    with _adapters_lock:
+        adapter = _adapters.get(key)
+        if adapter is None:
+            adapter = build()
+            _adapters[key] = adapter
+    return adapter
+
+
+def get_response_adapter(result_type: type) -> "TypeAdapter[Response[Any]]":
+    """
+    Returns compiled validator for `Response[result_type]`.
+
+    Validators are built once per result type on first use and then reused
+    by all clients, so response decoding does not pay for generic
+    parametrization and core schema construction on every call.
+    """
+    return _get_adapter(
+        (Response, result_type),
+        lambda: TypeAdapter(Response[result_type]),  # type: ignore[valid-type]
+    )
+
+
+def get_list_adapter(result_type: type) -> "TypeAdapter[List[Any]]":
+    """
+    Returns compiled validator for `List[result_type]`, used to validate
+    replies of batch requests in groups.
+    """
+    return _get_adapter(
+        (List, result_type),
+        lambda: TypeAdapter(List[result_type]),  # type: ignore[valid-type]
+    )
+
+
+def warmup_response_adapters(
+    result_types: Optional[Iterable[Type[CentResult]]] = None,
+) -> None:
+    """
+    Compiles response validators ahead of time.
+
+    Args:
+        result_types: Result types to prepare. By default, validators for results of
+            all known request types are built.
+    """
+    if result_types is None:
+        result_types = _known_result_types()
+    for result_type in result_types:
+        get_response_adapter(result_type)
+
+
+def _known_result_types() -> List[Type[CentResult]]:
+    result_types: List[Type[CentResult]] = []
+    pending: List[type] = [CentRequest]
+    while pending:
+        request_cls = pending.pop()
+        pending.extend(request_cls.__subclasses__())
+        returning = request_cls.__dict__.get("__returning__")
+        if isinstance(returning, type) and issubclass(returning, CentResult):
+            result_types.append(returning)
+    return result_types
+
+
 class NestedModel(BaseModel, ABC):
     model_config = ConfigDict(
         extra="allow",
@@ -98,15 +193,37 @@ class NestedModel(BaseModel, ABC):
     )
 
 
+class ReplyError(CentResult):
+    """Error reply of command in batch.
+
+    Attributes:
+        code: Error code.
+        message: Error message.
+    """
+
+    code: int
+    message: str = ""
+
+
 class BatchResult(CentResult):
     """Batch response.
 
     Attributes:
-        replies: List of results from batch request.
+        replies: List of results from batch request in the order of commands. Commands
+            which failed are represented by ReplyError.
     """
 
     replies: List[CentResult]
 
+    @property
+    def errors(self) -> Dict[int, ReplyError]:
+        """Errors of failed commands by command index in batch."""
+        return {
+            index: reply
+            for index, reply in enumerate(self.replies)
+            if isinstance(reply, ReplyError)
+        }
+
 
 class BatchRequest(CentRequest[BatchResult]):
     """Batch request."""
@@ -128,16 +245,34 @@ class BatchRequest(CentRequest[BatchResult]):
 
 def _validate_batch(
     request: BatchRequest,
-    json_replies: List[Dict[str, Any]],
-) -> Dict[str, Dict[str, List[Any]]]:
-    replies: List[CentRequest[Any]] = []
-    for command_method, json_data in zip(request.requests, json_replies):
-        validated_request: CentRequest[Any] = TypeAdapter(
-            command_method.__returning__
-        ).validate_python(
-            json_data[command_method.__api_method__],
-        )
-        replies.append(validated_request)
+    json_replies: Any,
+) -> Dict[str, Dict[str, List[CentResult]]]:
+    if not isinstance(json_replies, list) or len(json_replies) != len(request.requests):
+        raise CentDecodeError
+
+    # Replies are validated in groups by result type, one pass per group.
+    groups: Dict[type, Tuple[List[int], List[Any]]] = {}
+    for index, (command, json_reply) in enumerate(zip(request.requests, json_replies)):
+        result_type: type
+        if not isinstance(json_reply, dict):
+            raise CentDecodeError
+        if "error" in json_reply:
+            result_type, json_data = ReplyError, json_reply["error"]
+        elif command.__api_method__ in json_reply:
+            result_type = command.__returning__
+            json_data = json_reply[command.__api_method__]
+        else:
+            # A reply keyed for another method must not pass as a default success.
+            raise CentDecodeError
+        indexes, items = groups.setdefault(result_type, ([], []))
+        indexes.append(index)
+        items.append(json_data)
+
+    replies: List[CentResult] = [None] * len(json_replies)  # type: ignore[list-item]
+    for group_type, (indexes, items) in groups.items():
+        validated = get_list_adapter(group_type).validate_python(items)
+        for index, reply in zip(indexes, validated):
+            replies[index] = reply
     return {"result": {"replies": replies}}
 
 
@@ -1,3 +1,9 @@
+from typing import TYPE_CHECKING, Dict, List, Optional
+
+if TYPE_CHECKING:
+    from cent.dto import CentResult
+
+
 class CentError(Exception):
     """
     Wrapper for all exceptions coming from this library.
@@ -70,3 +76,93 @@ class CentApiResponseError(CentError):
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}('{self}')"
+
+
+class CentQueueFullError(CentError):
+    """
+    CentQueueFullError raised when request can't be sent because client limit of
+    requests in flight is reached and no more requests may wait in queue.
+    """
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Queue full error - {self.message}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+
+class CentCircuitOpenError(CentError):
+    """
+    CentCircuitOpenError raised without sending request when circuit breaker of
+    Centrifugo node is open after consecutive failures.
+    """
+
+    def __init__(self, message: str) -> None:
+        self.message = message
+
+    def __str__(self) -> str:
+        return f"Circuit open error - {self.message}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+
+class CentRateLimitError(CentError):
+    """
+    CentRateLimitError raised without sending request when client rate limit is
+    reached and request can't wait for it.
+    """
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        self.message = message
+        self.retry_after = retry_after
+
+    def __str__(self) -> str:
+        return f"Rate limit error - {self.message}, retry after {self.retry_after:.3f}s"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+
+class CentEpochChangedError(CentError):
+    """
+    CentEpochChangedError raised when history stream epoch changed while iterating
+    over it, i.e. stream was reset and positions of the old epoch are lost.
+    """
+
+    def __init__(self, message: str, epoch: str, new_epoch: str) -> None:
+        self.message = message
+        self.epoch = epoch
+        self.new_epoch = new_epoch
+
+    def __str__(self) -> str:
+        return f"Epoch changed error - {self.message}"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
+
+
+class CentPartialBatchError(CentError):
+    """
+    CentPartialBatchError raised when some chunks of chunked batch request failed
+    while others were applied. `replies` keeps replies of applied commands in the
+    order of commands (None for failed ones), `errors` maps index of every failed
+    command to the error of its chunk, so only failed commands need to be sent again.
+    """
+
+    def __init__(
+        self,
+        replies: List[Optional["CentResult"]],
+        errors: Dict[int, CentError],
+    ) -> None:
+        self.replies = replies
+        self.errors = errors
+
+    def __str__(self) -> str:
+        return f"Partial batch error - {len(self.errors)} of {len(self.replies)} commands failed"
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}('{self}')"
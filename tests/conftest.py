@@ -1,13 +1,21 @@
+import asyncio
+import json
 from typing import (
     Any,
     AsyncGenerator,
+    Awaitable,
+    Callable,
     Tuple,
     Dict,
+    List,
+    Optional,
 )
 
 import pytest
 
 from cent import Client, AsyncClient
+from cent.client.session.base_http_async import BaseHttpAsyncSession
+from cent.client.session.base_http_sync import BaseHttpSyncSession
 
 BASE_URL = "http://localhost:8000/api"
 API_KEY = "api_key"
@@ -31,3 +39,123 @@ async def async_client(
     client = AsyncClient(BASE_URL, API_KEY)
     yield client
     await client._session.close()
+
+
+Handler = Callable[[str, Dict[str, Any]], Dict[str, Any]]
+
+
+def ok_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Replies like Centrifugo would for publish-like commands."""
+    if method == "batch":
+        return {
+            "replies": [
+                {command_method: {"offset": 1, "epoch": "epoch"}}
+                for command in payload["commands"]
+                for command_method in command
+            ],
+        }
+    return {"result": {"offset": 1, "epoch": "epoch"}}
+
+
+class FakeSession(BaseHttpSyncSession):
+    """In-memory replacement of RequestsSession which calls handler for each request."""
+
+    def __init__(self, handler: Handler = ok_handler) -> None:
+        self.handler = handler
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    def close(self) -> None:
+        pass
+
+    def make_request(
+        self,
+        api_key: str,  # noqa: ARG002
+        method: str,
+        body: bytes,
+        timeout: Optional[float] = None,  # noqa: ARG002
+    ) -> bytes:
+        payload = json.loads(body)
+        self.requests.append((method, payload))
+        return json.dumps(self.handler(method, payload)).encode()
+
+
+class FakeAsyncSession(BaseHttpAsyncSession):
+    """In-memory replacement of AiohttpSession which calls handler for each request."""
+
+    def __init__(self, handler: Handler = ok_handler, delay: float = 0) -> None:
+        self.handler = handler
+        self.delay = delay
+        self.requests: List[Tuple[str, Dict[str, Any]]] = []
+
+    async def close(self) -> None:
+        pass
+
+    async def make_request(
+        self,
+        api_key: str,  # noqa: ARG002
+        method: str,
+        body: bytes,
+        timeout: Optional[float] = None,  # noqa: ARG002
+    ) -> bytes:
+        payload = json.loads(body)
+        self.requests.append((method, payload))
+        await asyncio.sleep(self.delay)
+        return json.dumps(self.handler(method, payload)).encode()
+
+
+@pytest.fixture()
+def fake_session() -> FakeSession:
+    return FakeSession()
+
+
+@pytest.fixture()
+def fake_async_session() -> FakeAsyncSession:
+    return FakeAsyncSession()
+
+
+FakeClientFactory = Callable[..., Client]
+FakeAsyncClientFactory = Callable[..., Awaitable[AsyncClient]]
+
+
+@pytest.fixture()
+def make_fake_client(fake_session: FakeSession) -> FakeClientFactory:
+    """
+    Returns factory of Clients created with given options which send requests
+    to `fake` session, `fake_session` fixture by default.
+    """
+
+    def make(fake: Optional[FakeSession] = None, **options: Any) -> Client:
+        client = Client(BASE_URL, API_KEY, **options)
+        client._session = fake or fake_session
+        return client
+
+    return make
+
+
+@pytest.fixture()
+def make_fake_async_client(
+    anyio_backend: Any,  # noqa: ARG001
+    fake_async_session: FakeAsyncSession,
+) -> FakeAsyncClientFactory:
+    """Async counterpart of `make_fake_client`."""
+
+    async def make(
+        fake: Optional[FakeAsyncSession] = None,
+        **options: Any,
+    ) -> AsyncClient:
+        client = AsyncClient(BASE_URL, API_KEY, **options)
+        await client._session.close()
+        client._session = fake or fake_async_session
+        return client
+
+    return make
+
+
+@pytest.fixture()
+def fake_client(make_fake_client: FakeClientFactory) -> Client:
+    return make_fake_client()
+
+
+@pytest.fixture()
+async def fake_async_client(make_fake_async_client: FakeAsyncClientFactory) -> AsyncClient:
+    return await make_fake_async_client()
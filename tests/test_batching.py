@@ -0,0 +1,300 @@
+import asyncio
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, List, cast
+
+import pytest
+
+from cent import (
+    BatchChunking,
+    BatchPublisher,
+    BatchRequest,
+    CentApiResponseError,
+    CentNetworkError,
+    CentPartialBatchError,
+    Client,
+    CoalesceOptions,
+    PublishRequest,
+    PublishResult,
+    StdlibJsonCodec,
+)
+from cent.client.batching import split_batch
+from tests.conftest import (
+    UNKNOWN_CHANNEL_ERROR_CODE,
+    FakeAsyncClientFactory,
+    FakeAsyncSession,
+    FakeClientFactory,
+    FakeSession,
+)
+
+PUBLISHER_THREADS = 4
+PUBLISHES_PER_THREAD = 10
+
+
+def batch_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    assert method == "batch"
+    replies = []
+    for i, command in enumerate(payload["commands"]):
+        if command["publish"]["channel"].startswith("undefined:"):
+            replies.append({"error": {"code": UNKNOWN_CHANNEL_ERROR_CODE, "message": "unknown"}})
+        else:
+            replies.append({"publish": {"offset": i + 1, "epoch": "epoch"}})
+    return {"replies": replies}
+
+
+@pytest.fixture()
+def coalescing_session(
+    anyio_backend: Any,  # noqa: ARG001
+) -> FakeAsyncSession:
+    return FakeAsyncSession(batch_handler)
+
+
+async def test_coalesce_publish(
+    make_fake_async_client: FakeAsyncClientFactory,
+    coalescing_session: FakeAsyncSession,
+) -> None:
+    client = await make_fake_async_client(
+        coalescing_session,
+        coalesce=CoalesceOptions(max_delay=0.01, parallel=True),
+    )
+    results = await asyncio.gather(*[
+        client.publish(PublishRequest(channel=f"personal_{i}", data={})) for i in range(10)
+    ])
+    assert results == [PublishResult(offset=i + 1, epoch="epoch") for i in range(10)]
+    assert len(coalescing_session.requests) == 1
+    _, payload = coalescing_session.requests[0]
+    assert payload["parallel"] is True
+    assert [command["publish"]["channel"] for command in payload["commands"]] == [
+        f"personal_{i}" for i in range(10)
+    ]
+    await client.close()
+
+
+async def test_coalesce_publish_max_size(
+    make_fake_async_client: FakeAsyncClientFactory,
+    coalescing_session: FakeAsyncSession,
+) -> None:
+    client = await make_fake_async_client(
+        coalescing_session,
+        coalesce=CoalesceOptions(max_size=4, max_delay=1),
+    )
+    await asyncio.gather(*[
+        client.publish(PublishRequest(channel=f"personal_{i}", data={})) for i in range(8)
+    ])
+    assert [len(payload["commands"]) for _, payload in coalescing_session.requests] == [4, 4]
+    await client.close()
+
+
+async def test_coalesce_publish_reply_error(
+    make_fake_async_client: FakeAsyncClientFactory,
+    coalescing_session: FakeAsyncSession,
+) -> None:
+    client = await make_fake_async_client(coalescing_session, coalesce=CoalesceOptions())
+    results = await asyncio.gather(
+        client.publish(PublishRequest(channel="personal_1", data={})),
+        client.publish(PublishRequest(channel="undefined:channel", data={})),
+        return_exceptions=True,
+    )
+    assert isinstance(results[0], PublishResult)
+    assert isinstance(results[1], CentApiResponseError)
+    assert results[1].code == UNKNOWN_CHANNEL_ERROR_CODE
+    await client.close()
+
+
+async def test_coalesce_publish_batch_error(
+    make_fake_async_client: FakeAsyncClientFactory,
+    coalescing_session: FakeAsyncSession,
+) -> None:
+    def failing_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        raise CentNetworkError("connection refused")
+
+    coalescing_session.handler = failing_handler
+    client = await make_fake_async_client(coalescing_session, coalesce=CoalesceOptions())
+    results = await asyncio.gather(
+        client.publish(PublishRequest(channel="personal_1", data={})),
+        client.publish(PublishRequest(channel="personal_2", data={})),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, CentNetworkError) for result in results)
+    await client.close()
+
+
+def test_batch_publisher(fake_client: Client, fake_session: FakeSession) -> None:
+    fake_session.handler = batch_handler
+    with BatchPublisher(fake_client, max_size=3, max_delay=0.05) as publisher:
+        futures = [
+            publisher.submit(PublishRequest(channel=f"personal_{i}", data={})) for i in range(5)
+        ]
+        futures.append(publisher.submit(PublishRequest(channel="undefined:channel", data={})))
+        results = [future.result(timeout=1) for future in futures[:5]]
+        with pytest.raises(CentApiResponseError):
+            futures[5].result(timeout=1)
+
+    assert all(isinstance(result, PublishResult) for result in results)
+    assert [len(payload["commands"]) for _, payload in fake_session.requests] == [3, 3]
+
+
+def test_batch_publisher_from_threads(fake_client: Client, fake_session: FakeSession) -> None:
+    fake_session.handler = batch_handler
+    publisher = BatchPublisher(fake_client, max_size=1000, max_delay=0.01)
+
+    def submit(thread_num: int) -> List["Future[PublishResult]"]:
+        return [
+            publisher.submit(PublishRequest(channel=f"personal_{thread_num}_{i}", data={}))
+            for i in range(PUBLISHES_PER_THREAD)
+        ]
+
+    with ThreadPoolExecutor(max_workers=PUBLISHER_THREADS) as executor:
+        futures = [
+            future for chunk in executor.map(submit, range(PUBLISHER_THREADS)) for future in chunk
+        ]
+    publisher.close()
+
+    assert all(isinstance(future.result(timeout=1), PublishResult) for future in futures)
+    assert sum(len(payload["commands"]) for _, payload in fake_session.requests) == (
+        PUBLISHER_THREADS * PUBLISHES_PER_THREAD
+    )
+
+    with pytest.raises(RuntimeError):
+        publisher.submit(PublishRequest(channel="personal_1", data={}))
+
+
+def test_split_batch() -> None:
+    request = BatchRequest(
+        requests=[PublishRequest(channel=f"personal_{i}", data="x" * 10) for i in range(10)],
+        parallel=True,
+    )
+    chunks = split_batch(request, StdlibJsonCodec(), BatchChunking(max_commands=4))
+    assert [len(chunk.requests) for chunk, _ in chunks] == [4, 4, 2]
+    for chunk, body in chunks:
+        assert json.loads(body) == chunk.api_payload
+
+    command_size = len(json.dumps(request.requests[0].api_payload)) + len('{"publish":}')
+    chunks = split_batch(
+        request,
+        StdlibJsonCodec(),
+        BatchChunking(max_commands=100, max_bytes=command_size * 3 + 2),
+    )
+    assert [len(chunk.requests) for chunk, _ in chunks] == [3, 3, 3, 1]
+
+
+def test_chunked_batch(make_fake_client: FakeClientFactory, fake_session: FakeSession) -> None:
+    client = make_fake_client(batch_chunking=BatchChunking(max_commands=3, concurrency=2))
+    requests = [PublishRequest(channel=f"personal_{i}", data={}) for i in range(8)]
+    fake_session.handler = batch_handler
+
+    result = client.batch(BatchRequest(requests=requests, parallel=True))
+    assert len(result.replies) == len(requests)
+    assert [cast(PublishResult, reply).offset for reply in result.replies] == [
+        1, 2, 3, 1, 2, 3, 1, 2,
+    ]
+    assert sorted(len(payload["commands"]) for _, payload in fake_session.requests) == [2, 3, 3]
+    client.close()
+
+
+def test_chunked_batch_from_threads(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    executors: List[ThreadPoolExecutor] = []
+
+    class CountingExecutor(ThreadPoolExecutor):
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            super().__init__(*args, **kwargs)
+            executors.append(self)
+
+    monkeypatch.setattr("cent.client.sync_client.ThreadPoolExecutor", CountingExecutor)
+    client = make_fake_client(batch_chunking=BatchChunking(max_commands=3, concurrency=2))
+    fake_session.handler = batch_handler
+    requests = [PublishRequest(channel=f"personal_{i}", data={}) for i in range(8)]
+
+    def send(_: int) -> int:
+        return len(client.batch(BatchRequest(requests=requests, parallel=True)).replies)
+
+    with ThreadPoolExecutor(max_workers=PUBLISHER_THREADS) as executor:
+        assert list(executor.map(send, range(PUBLISHER_THREADS))) == [
+            len(requests),
+        ] * PUBLISHER_THREADS
+    # Threads share one executor, so close() shuts down every worker.
+    assert len(executors) == 1
+    client.close()
+    with pytest.raises(RuntimeError):
+        executors[0].submit(print)
+
+
+def failing_chunk_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    if any(command["publish"]["channel"] == "failing" for command in payload["commands"]):
+        raise CentNetworkError("connection reset")
+    return batch_handler(method, payload)
+
+
+def test_chunked_batch_partial_failure(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    client = make_fake_client(batch_chunking=BatchChunking(max_commands=2, concurrency=2))
+    fake_session.handler = failing_chunk_handler
+    channels = ["personal_0", "personal_1", "failing", "personal_3", "personal_4"]
+    request = BatchRequest(
+        requests=[PublishRequest(channel=channel, data={}) for channel in channels],
+        parallel=True,
+    )
+
+    with pytest.raises(CentPartialBatchError) as exc_info:
+        client.batch(request)
+    error = exc_info.value
+    assert sorted(error.errors) == [2, 3]
+    assert all(isinstance(e, CentNetworkError) for e in error.errors.values())
+    assert [reply is None for reply in error.replies] == [False, False, True, True, False]
+    assert isinstance(error.__cause__, CentNetworkError)
+
+    with pytest.raises(CentNetworkError):
+        client.batch(BatchRequest(requests=[PublishRequest(channel="failing", data={})] * 3))
+    client.close()
+
+
+async def test_chunked_batch_async(
+    make_fake_async_client: FakeAsyncClientFactory,
+    coalescing_session: FakeAsyncSession,
+) -> None:
+    client = await make_fake_async_client(
+        coalescing_session,
+        batch_chunking=BatchChunking(max_commands=3, concurrency=2),
+    )
+    requests = [PublishRequest(channel=f"personal_{i}", data={}) for i in range(7)]
+
+    result = await client.batch(BatchRequest(requests=requests))
+    assert [cast(PublishResult, reply).offset for reply in result.replies] == [
+        1, 2, 3, 1, 2, 3, 1,
+    ]
+    assert [
+        [command["publish"]["channel"] for command in payload["commands"]]
+        for _, payload in coalescing_session.requests
+    ] == [
+        ["personal_0", "personal_1", "personal_2"],
+        ["personal_3", "personal_4", "personal_5"],
+        ["personal_6"],
+    ]
+
+
+async def test_chunked_batch_partial_failure_async(
+    make_fake_async_client: FakeAsyncClientFactory,
+    coalescing_session: FakeAsyncSession,
+) -> None:
+    client = await make_fake_async_client(
+        coalescing_session,
+        batch_chunking=BatchChunking(max_commands=2),
+    )
+    coalescing_session.handler = failing_chunk_handler
+    channels = ["personal_0", "personal_1", "failing", "personal_3", "personal_4"]
+    request = BatchRequest(
+        requests=[PublishRequest(channel=channel, data={}) for channel in channels],
+    )
+
+    with pytest.raises(CentPartialBatchError) as exc_info:
+        await client.batch(request)
+    # Chunks after the failed one are not sent to keep commands order.
+    assert sorted(exc_info.value.errors) == [2, 3, 4]
+    assert isinstance(exc_info.value.replies[0], PublishResult)
+    assert len(coalescing_session.requests) == len(channels) // 2
@@ -0,0 +1,91 @@
+import json
+from typing import Any, Dict, Generator
+
+import pytest
+
+from cent import AsyncClient
+from cent.bench import LoadOptions, run_load
+from cent.bench.cli import main
+from cent.bench.server import FakeCentrifugo, FakeCentrifugoThread
+from tests.conftest import API_KEY, UNKNOWN_CHANNEL_ERROR_CODE, FakeAsyncSession
+
+DURATION = 0.2
+RATE = 100
+BATCH_SIZE = 5
+
+
+@pytest.fixture(scope="module")
+def api_url() -> Generator[str, None, None]:
+    with FakeCentrifugoThread(FakeCentrifugo()) as thread:
+        yield thread.api_url
+
+
+async def test_run_load_concurrency(api_url: str, anyio_backend: Any) -> None:  # noqa: ARG001
+    options = LoadOptions(method="batch", duration=DURATION, concurrency=2, batch_size=BATCH_SIZE)
+    async with AsyncClient(api_url, API_KEY) as client:
+        report = await run_load(client, options)
+    assert report.calls > 0
+    assert not report.errors
+    assert report.publications == report.calls * BATCH_SIZE
+    assert report.latency.count == report.calls
+
+
+async def test_run_load_rate(api_url: str, anyio_backend: Any) -> None:  # noqa: ARG001
+    options = LoadOptions(method="broadcast", duration=DURATION, rate=RATE)
+    async with AsyncClient(api_url, API_KEY) as client:
+        report = await run_load(client, options)
+    assert report.calls == DURATION * RATE
+    assert not report.errors
+
+
+def failing_commands_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """Fails every other command of batch and broadcast with unknown channel error."""
+    error = {"code": UNKNOWN_CHANNEL_ERROR_CODE, "message": "unknown channel"}
+    published = {"offset": 1, "epoch": "epoch"}
+    if method == "batch":
+        replies = [
+            {"error": error} if i % 2 else {"publish": published}
+            for i in range(len(payload["commands"]))
+        ]
+        return {"replies": replies}
+    responses = [
+        {"error": error} if i % 2 else {"result": published}
+        for i in range(len(payload["channels"]))
+    ]
+    return {"result": {"responses": responses}}
+
+
+@pytest.mark.parametrize("method", ["batch", "broadcast"])
+async def test_run_load_command_errors(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+    method: str,
+) -> None:
+    fake_async_session.handler = failing_commands_handler
+    options = LoadOptions(
+        method=method,
+        duration=DURATION,
+        concurrency=1,
+        broadcast_channels=BATCH_SIZE,
+        batch_size=BATCH_SIZE,
+    )
+    report = await run_load(fake_async_client, options)
+    failed_per_call = BATCH_SIZE // 2
+    assert report.failed == 0
+    error = f"ReplyError({UNKNOWN_CHANNEL_ERROR_CODE})"
+    assert report.errors == {error: report.calls * failed_per_call}
+    assert report.publications == report.calls * (BATCH_SIZE - failed_per_call)
+
+
+def test_load_options_validation() -> None:
+    with pytest.raises(ValueError, match="method"):
+        LoadOptions(method="presence")
+    with pytest.raises(ValueError, match="rate"):
+        LoadOptions(rate=0)
+
+
+def test_main_json(api_url: str, capsys: pytest.CaptureFixture[str]) -> None:
+    assert main(["--api-url", api_url, "--duration", str(DURATION), "--json"]) == 0
+    report = json.loads(capsys.readouterr().out)
+    assert report["calls"] > 0
+    assert set(report["latency"]) == {"mean", "p50", "p99", "p999", "max"}
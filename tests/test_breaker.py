@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from cent import (
+    AsyncClient,
+    CentCircuitOpenError,
+    CentNetworkError,
+    CentTransportError,
+    CentUnauthorizedError,
+    CircuitBreaker,
+    Client,
+    InfoRequest,
+)
+from cent.client.session.breaker import CLOSED, HALF_OPEN, OPEN, EndpointBreaker
+
+URL = "http://node1/api"
+# Nothing listens on port 1, connection is refused immediately.
+UNREACHABLE_URL = "http://127.0.0.1:1/api"
+THRESHOLD = 3
+
+
+def fail(breaker: EndpointBreaker, times: int) -> None:
+    for _ in range(times):
+        breaker.before_request()
+        breaker.after_request(CentNetworkError("connection refused"))
+
+
+def test_breaker_opens_after_consecutive_failures() -> None:
+    breaker = EndpointBreaker(URL, CircuitBreaker(failure_threshold=THRESHOLD))
+    fail(breaker, THRESHOLD - 1)
+    breaker.before_request()
+    breaker.after_request(None)
+    fail(breaker, THRESHOLD - 1)
+    assert breaker.state == CLOSED
+
+    fail(breaker, 1)
+    assert breaker.state == OPEN
+    with pytest.raises(CentCircuitOpenError):
+        breaker.before_request()
+
+
+def test_breaker_request_errors_are_not_failures() -> None:
+    breaker = EndpointBreaker(URL, CircuitBreaker(failure_threshold=1))
+    for error in (CentTransportError(400), CentUnauthorizedError()):
+        breaker.before_request()
+        breaker.after_request(error)
+    assert breaker.state == CLOSED
+    breaker.before_request()
+    breaker.after_request(CentTransportError(503))
+    assert breaker.state == OPEN
+
+
+def test_breaker_half_open() -> None:
+    breaker = EndpointBreaker(URL, CircuitBreaker(failure_threshold=1, recovery_time=0))
+    fail(breaker, 1)
+    assert breaker.state == HALF_OPEN
+
+    # Only one trial request at a time, its failure opens circuit again.
+    breaker.before_request()
+    with pytest.raises(CentCircuitOpenError):
+        breaker.before_request()
+    breaker.after_request(CentNetworkError("connection refused"))
+    assert breaker._state == OPEN
+
+    # Cancelled trial request neither closes nor opens circuit.
+    breaker.before_request()
+    breaker.after_request(asyncio.CancelledError())
+    assert breaker._state == HALF_OPEN
+
+    breaker.before_request()
+    breaker.after_request(None)
+    assert breaker.state == CLOSED
+
+
+def test_client_fails_fast_while_open() -> None:
+    client = Client(
+        UNREACHABLE_URL,
+        "api_key",
+        circuit_breaker=CircuitBreaker(failure_threshold=THRESHOLD, recovery_time=60),
+    )
+    for _ in range(THRESHOLD):
+        with pytest.raises(CentNetworkError):
+            client.info(InfoRequest())
+    with pytest.raises(CentCircuitOpenError):
+        client.info(InfoRequest())
+    client.close()
+
+
+async def test_async_client_fails_fast_while_open(anyio_backend: Any) -> None:  # noqa: ARG001
+    client = AsyncClient(
+        UNREACHABLE_URL,
+        "api_key",
+        circuit_breaker=CircuitBreaker(failure_threshold=1, recovery_time=60),
+    )
+    with pytest.raises(CentNetworkError):
+        await client.info(InfoRequest())
+    with pytest.raises(CentCircuitOpenError):
+        await client.info(InfoRequest())
+    await client.close()
@@ -0,0 +1,110 @@
+import time
+from typing import Any, Dict
+
+from cent import (
+    PresenceRequest,
+    PresenceStatsRequest,
+    PresenceStatsResult,
+    PublishRequest,
+    ResponseCache,
+)
+from tests.conftest import (
+    FakeAsyncClientFactory,
+    FakeAsyncSession,
+    FakeClientFactory,
+    FakeSession,
+)
+
+NUM_CALLS = 5
+TTL = 0.05
+TWO_REQUESTS = 2
+
+
+def presence_stats_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+    return {"result": {"num_clients": 1, "num_users": 1}}
+
+
+def test_cache_read_through(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    fake_session.handler = presence_stats_handler
+    cache = ResponseCache()
+    client = make_fake_client(cache=cache)
+
+    results = [client.presence_stats(PresenceStatsRequest(channel="1")) for _ in range(NUM_CALLS)]
+    client.presence_stats(PresenceStatsRequest(channel="2"))
+    assert all(result == PresenceStatsResult(num_clients=1, num_users=1) for result in results)
+    assert len(fake_session.requests) == TWO_REQUESTS
+    stats = cache.stats()
+    assert (stats.entries, stats.hits, stats.misses) == (2, NUM_CALLS - 1, 2)
+
+    # Methods without TTL are not cached.
+    fake_session.requests.clear()
+    client.publish(PublishRequest(channel="1", data={}))
+    client.publish(PublishRequest(channel="1", data={}))
+    assert len(fake_session.requests) == TWO_REQUESTS
+
+
+def test_cache_ttl(make_fake_client: FakeClientFactory, fake_session: FakeSession) -> None:
+    fake_session.handler = presence_stats_handler
+    client = make_fake_client(cache=ResponseCache(ttl={"presence_stats": TTL}))
+    request = PresenceStatsRequest(channel="1")
+    client.presence_stats(request)
+    client.presence_stats(request)
+    time.sleep(TTL)
+    client.presence_stats(request)
+    assert len(fake_session.requests) == TWO_REQUESTS
+
+
+def test_cache_bypass(make_fake_client: FakeClientFactory, fake_session: FakeSession) -> None:
+    fake_session.handler = presence_stats_handler
+    cache = ResponseCache()
+    client = make_fake_client(cache=cache)
+    request = PresenceStatsRequest(channel="1")
+    client.presence_stats(request)
+    with cache.bypass():
+        client.presence_stats(request)
+    client.presence_stats(request)
+    assert len(fake_session.requests) == TWO_REQUESTS
+
+
+def test_cache_lru_eviction() -> None:
+    max_entries = 2
+    cache = ResponseCache(max_entries=max_entries)
+    result = PresenceStatsResult(num_clients=1, num_users=1)
+    cache.put("presence_stats", b"1", result, size=0)
+    cache.put("presence_stats", b"2", result, size=0)
+    assert cache.get("presence_stats", b"1") is result
+    cache.put("presence_stats", b"3", result, size=0)
+    # Least recently used entry is evicted.
+    assert cache.get("presence_stats", b"2") is None
+    assert cache.get("presence_stats", b"1") is result
+    assert cache.stats().evictions == 1
+
+
+def test_cache_max_size() -> None:
+    max_size = 100
+    cache = ResponseCache(max_size=max_size)
+    result = PresenceStatsResult(num_clients=1, num_users=1)
+    cache.put("presence_stats", b"1", result, size=max_size // 2)
+    cache.put("presence_stats", b"2", result, size=max_size // 2)
+    assert cache.stats().entries == 1
+    assert cache.stats().size <= max_size
+    # Result larger than the whole cache is not cached at all.
+    cache.put("presence_stats", b"3", result, size=max_size)
+    assert cache.get("presence_stats", b"3") is None
+
+    cache.invalidate("presence_stats")
+    assert cache.stats().size == 0
+
+
+async def test_cache_async(make_fake_async_client: FakeAsyncClientFactory) -> None:
+    def handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        return {"result": {"presence": {}}}
+
+    session = FakeAsyncSession(handler=handler)
+    client = await make_fake_async_client(session, cache=ResponseCache())
+    for _ in range(NUM_CALLS):
+        await client.presence(PresenceRequest(channel="1"))
+    assert len(session.requests) == 1
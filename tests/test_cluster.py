@@ -0,0 +1,82 @@
+import asyncio
+from typing import Any, Dict
+
+from cent import AsyncClient, ClusterStatsCollector
+from tests.conftest import FakeAsyncSession
+
+INTERVAL = 0.01
+HISTORY = 3
+MESSAGES_PER_POLL = 10
+
+
+class InfoHandler:
+    """
+    Replies to info requests with two nodes of the same name which sent more
+    messages on every call.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG002
+        self.calls += 1
+        return {"result": {"nodes": [self.node("uid1", 1), self.node("uid2", 2)]}}
+
+    def node(self, uid: str, messages_factor: int) -> Dict[str, Any]:
+        messages_sent = float(self.calls * MESSAGES_PER_POLL * messages_factor)
+        return {
+            "uid": uid,
+            "name": 'node "1"',
+            "num_clients": 5,
+            "num_subs": 7,
+            "metrics": {"interval": 60, "items": {"messages_sent": messages_sent}},
+            "process": {"cpu": 1.5, "rss": 1024},
+        }
+
+
+async def test_cluster_stats_collector(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    fake_async_session.handler = InfoHandler()
+    collector = ClusterStatsCollector(fake_async_client, interval=INTERVAL, history=HISTORY)
+    assert not collector.prometheus()
+    assert collector.rates() == {}
+
+    for _ in range(HISTORY + 1):
+        await collector.collect()
+    # Ring buffer keeps only recent snapshots.
+    assert len(collector.snapshots) == HISTORY
+    assert collector.deltas() == {
+        "uid1": {"messages_sent": MESSAGES_PER_POLL},
+        "uid2": {"messages_sent": 2 * MESSAGES_PER_POLL},
+    }
+    assert collector.deltas(window=2)["uid1"] == {"messages_sent": 2 * MESSAGES_PER_POLL}
+    rates = collector.rates()
+    assert rates["uid2"]["messages_sent"] > rates["uid1"]["messages_sent"] > 0
+
+    text = collector.prometheus()
+    assert "# TYPE centrifugo_node_clients gauge" in text
+    assert 'centrifugo_node_clients{node="node \\"1\\"",uid="uid1"} 5\n' in text
+    assert 'centrifugo_node_process_rss_bytes{node="node \\"1\\"",uid="uid1"} 1024\n' in text
+    labels = 'node="node \\"1\\"",uid="uid1",name="messages_sent"'
+    assert f"centrifugo_node_metric{{{labels}}} 40.0" in text
+    for uid in ("uid1", "uid2"):
+        labels = f'node="node \\"1\\"",uid="{uid}",name="messages_sent"'
+        assert f"centrifugo_node_metric_rate{{{labels}}} " in text
+
+
+async def test_cluster_stats_collector_background(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    handler = InfoHandler()
+    fake_async_session.handler = handler
+    async with ClusterStatsCollector(fake_async_client, interval=INTERVAL) as collector:
+        while handler.calls < HISTORY:
+            await asyncio.sleep(INTERVAL)
+    calls = handler.calls
+    await asyncio.sleep(INTERVAL * 2)
+    assert handler.calls == calls
+    assert len(collector.snapshots) == calls
+    assert collector.errors == 0
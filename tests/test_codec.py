@@ -0,0 +1,48 @@
+from typing import Callable
+
+import pytest
+
+from cent import (
+    BatchRequest,
+    JsonCodec,
+    MsgspecCodec,
+    OrjsonCodec,
+    PublishRequest,
+    PublishResult,
+    StdlibJsonCodec,
+)
+
+
+def _orjson_codec() -> JsonCodec:
+    pytest.importorskip("orjson")
+    return OrjsonCodec()
+
+
+def _msgspec_codec() -> JsonCodec:
+    pytest.importorskip("msgspec")
+    return MsgspecCodec()
+
+
+@pytest.fixture(params=[StdlibJsonCodec, _orjson_codec, _msgspec_codec])
+def json_codec(request: pytest.FixtureRequest) -> JsonCodec:
+    factory: Callable[[], JsonCodec] = request.param
+    return factory()
+
+
+def test_codec_roundtrip(json_codec: JsonCodec) -> None:
+    request = BatchRequest(
+        requests=[
+            PublishRequest(channel="personal_1", data={"text": "привет"}),
+            PublishRequest(channel="personal_2", data=[1, 2.5, None, True]),
+        ],
+    )
+    encoded = json_codec.dumps(request.api_payload)
+    assert isinstance(encoded, bytes)
+    assert json_codec.loads(encoded) == request.api_payload
+    assert json_codec.loads(encoded.decode()) == request.api_payload
+
+
+def test_parse_response_with_codec(json_codec: JsonCodec) -> None:
+    request = PublishRequest(channel="personal_1", data={})
+    response = request.parse_response(b'{"result": {"offset": 2}}', json_codec)
+    assert response.result == PublishResult(offset=2)
@@ -0,0 +1,149 @@
+import json
+from typing import Any, Dict, List, cast
+
+import pytest
+
+from cent import (
+    AsyncClient,
+    BatchRequest,
+    BatchResult,
+    Client,
+    CentApiResponseError,
+    CentRequest,
+    CentDecodeError,
+    PresenceRequest,
+    PresenceResult,
+    PublishRequest,
+    PublishResult,
+    ReplyError,
+    warmup_response_adapters,
+)
+from cent.dto import get_list_adapter, get_response_adapter
+from tests.conftest import UNKNOWN_CHANNEL_ERROR_CODE, FakeAsyncSession, FakeSession
+
+
+def test_response_adapter_is_reused() -> None:
+    adapter = get_response_adapter(PublishResult)
+    assert get_response_adapter(PublishResult) is adapter
+    assert get_response_adapter(PresenceResult) is not adapter
+
+
+def test_warmup_response_adapters() -> None:
+    warmup_response_adapters([PresenceResult])
+    response = get_response_adapter(PresenceResult).validate_python(
+        {"result": {"presence": {}}},
+    )
+    assert response.result == PresenceResult(presence={})
+
+
+def test_parse_response() -> None:
+    request = PublishRequest(channel="personal_1", data={})
+    response = request.parse_response('{"result": {"offset": 1, "epoch": "xyz"}}')
+    assert response.result == PublishResult(offset=1, epoch="xyz")
+
+
+def test_parse_response_error() -> None:
+    request = PublishRequest(channel="personal_1", data={})
+    with pytest.raises(CentApiResponseError, match="unknown channel"):
+        request.parse_response('{"error": {"code": 102, "message": "unknown channel"}}')
+
+    with pytest.raises(CentDecodeError):
+        request.parse_response("not json")
+
+
+def test_client_sends_encoded_body(fake_client: Client, fake_session: FakeSession) -> None:
+    result = fake_client.publish(PublishRequest(channel="personal_1", data={"data": "data"}))
+    assert result == PublishResult(offset=1, epoch="epoch")
+    assert fake_session.requests == [
+        ("publish", {"channel": "personal_1", "data": {"data": "data"}}),
+    ]
+
+
+async def test_async_client_sends_encoded_body(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    result = await fake_async_client.publish(PublishRequest(channel="personal_1", data={}))
+    assert result == PublishResult(offset=1, epoch="epoch")
+    assert fake_async_session.requests == [("publish", {"channel": "personal_1", "data": {}})]
+
+
+def test_parse_batch_response_with_errors() -> None:
+    request = BatchRequest(
+        requests=[
+            PublishRequest(channel="personal_1", data={}),
+            PublishRequest(channel="undefined:channel", data={}),
+            PresenceRequest(channel="personal_1"),
+        ],
+    )
+    content = json.dumps({
+        "replies": [
+            {"publish": {"offset": 1, "epoch": "epoch"}},
+            {"error": {"code": UNKNOWN_CHANNEL_ERROR_CODE, "message": "unknown channel"}},
+            {"presence": {"presence": {}}},
+        ],
+    })
+    result = cast(BatchResult, request.parse_response(content).result)
+    assert result.replies == [
+        PublishResult(offset=1, epoch="epoch"),
+        ReplyError(code=UNKNOWN_CHANNEL_ERROR_CODE, message="unknown channel"),
+        PresenceResult(presence={}),
+    ]
+    assert list(result.errors) == [1]
+
+
+def test_parse_batch_response_mismatch() -> None:
+    request = BatchRequest(requests=[PublishRequest(channel="personal_1", data={})])
+    with pytest.raises(CentDecodeError):
+        request.parse_response('{"replies": []}')
+
+    with pytest.raises(CentApiResponseError):
+        request.parse_response('{"error": {"code": 107, "message": "bad request"}}')
+
+
+def test_parse_batch_response_grouped() -> None:
+    requests: List[CentRequest[Any]] = []
+    json_replies: List[Dict[str, Any]] = []
+    for i in range(100):
+        if i % 3:
+            requests.append(PublishRequest(channel=f"personal_{i}", data={}))
+            json_replies.append({"publish": {"offset": i}})
+        else:
+            requests.append(PresenceRequest(channel=f"personal_{i}"))
+            json_replies.append({"presence": {"presence": {}}})
+
+    content = json.dumps({"replies": json_replies})
+    result = cast(BatchResult, BatchRequest(requests=requests).parse_response(content).result)
+    for i, reply in enumerate(result.replies):
+        if i % 3:
+            assert reply == PublishResult(offset=i)
+        else:
+            assert reply == PresenceResult(presence={})
+    assert get_list_adapter(PublishResult) is get_list_adapter(PublishResult)
+
+
+@pytest.mark.parametrize(
+    "json_reply",
+    [{}, {"presence": {}}],
+)
+def test_parse_batch_response_missing_method(json_reply: Dict[str, Any]) -> None:
+    request = BatchRequest(requests=[PublishRequest(channel="personal_1", data={})])
+    with pytest.raises(CentDecodeError):
+        request.parse_response(json.dumps({"replies": [json_reply]}))
+
+
+@pytest.mark.parametrize(
+    "content",
+    ["1", "null", "[]", '{"replies": null}', '{"replies": [1]}', '{"replies": {}}'],
+)
+def test_parse_batch_response_malformed(content: str) -> None:
+    request = BatchRequest(requests=[PublishRequest(channel="personal_1", data={})])
+    with pytest.raises(CentDecodeError):
+        request.parse_response(content)
+
+
+@pytest.mark.parametrize("content", ["1", "null", '"publish"'])
+def test_parse_response_malformed(content: str) -> None:
+    request = PublishRequest(channel="personal_1", data={})
+    with pytest.raises(CentDecodeError):
+        request.parse_response(content)
@@ -0,0 +1,77 @@
+from typing import Any
+
+import pytest
+
+from cent import AsyncClient, CentNetworkError, Hedging, LoadBalancing
+from cent.client.session import BalancedAiohttpSession
+from tests.conftest import FakeAsyncSession
+
+URLS = ["http://node1/api", "http://node2/api"]
+SLOW = 1.0
+HEDGE_DELAY = 0.01
+OBSERVED_REQUESTS = 100
+
+
+async def make_session(hedging: Hedging, slow: FakeAsyncSession) -> BalancedAiohttpSession:
+    session = BalancedAiohttpSession(
+        URLS,
+        balancing=LoadBalancing(strategy="least_outstanding"),
+        hedging=hedging,
+    )
+    for node in session._sessions.values():
+        await node.close()
+    nodes = {URLS[0]: slow, URLS[1]: FakeAsyncSession()}
+    session._sessions = nodes  # type: ignore[assignment]
+    # Make first node look less loaded so it is always selected first.
+    session.pool.endpoints[1].outstanding += 1
+    return session
+
+
+async def test_hedged_request_wins(anyio_backend: Any) -> None:  # noqa: ARG001
+    hedging = Hedging(initial_delay=HEDGE_DELAY)
+    session = await make_session(hedging, FakeAsyncSession(delay=SLOW))
+
+    await session.make_request("api_key", "presence", b'{"channel": "1"}')
+    fast = session._sessions[URLS[1]]
+    assert isinstance(fast, FakeAsyncSession)
+    assert len(fast.requests) == 1
+    stats = hedging.stats()
+    assert (stats.requests, stats.hedged, stats.hedge_wins) == (1, 1, 1)
+    # Loser is cancelled and its endpoint released.
+    assert session.pool.endpoints[0].outstanding == 0
+
+
+async def test_write_methods_not_hedged(anyio_backend: Any) -> None:  # noqa: ARG001
+    hedging = Hedging(initial_delay=HEDGE_DELAY)
+    slow = FakeAsyncSession(delay=HEDGE_DELAY * 3)
+    session = await make_session(hedging, slow)
+
+    await session.make_request("api_key", "publish", b'{"channel": "1", "data": {}}')
+    assert len(slow.requests) == 1
+    assert hedging.stats().requests == 0
+
+
+async def test_hedged_request_failed_attempt(anyio_backend: Any) -> None:  # noqa: ARG001
+    def failing_handler(method: str, payload: Any) -> Any:  # noqa: ARG001
+        raise CentNetworkError("connection refused")
+
+    hedging = Hedging(initial_delay=HEDGE_DELAY)
+    session = await make_session(hedging, FakeAsyncSession(handler=failing_handler))
+
+    with pytest.raises(CentNetworkError):
+        await session.make_request("api_key", "presence", b'{"channel": "1"}')
+    assert hedging.stats().hedged == 0
+
+
+def test_hedging_delay_follows_percentile() -> None:
+    hedging = Hedging(percentile=90, initial_delay=1, min_delay=0)
+    assert hedging.delay("info") == 1
+    for i in range(OBSERVED_REQUESTS):
+        hedging.observe("info", i / 1000)
+    assert hedging.delay("info") == pytest.approx(0.09)
+    assert hedging.delay("presence") == 1
+
+
+def test_hedging_requires_several_urls() -> None:
+    with pytest.raises(ValueError, match="several API URLs"):
+        AsyncClient("http://localhost:8000/api", "api_key", hedging=Hedging())
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+import pytest
+
+import cent
+import cent.client
+import cent.client.session
+
+
+@pytest.mark.parametrize("module", [cent, cent.client, cent.client.session])
+def test_all_names_resolve(module: object) -> None:
+    for name in module.__all__:  # type: ignore[attr-defined]
+        assert getattr(module, name) is not None
+        assert name in dir(module)
+
+
+def test_unknown_name() -> None:
+    with pytest.raises(AttributeError, match="NoSuchName"):
+        cent.NoSuchName  # type: ignore[attr-defined]  # noqa: B018
+
+
+def imported_modules(statement: str) -> str:
+    code = (
+        f"{statement}\n"
+        "import sys\n"
+        "print(' '.join(m for m in ('aiohttp', 'requests', 'pydantic') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+@pytest.mark.parametrize(
+    ("statement", "expected"),
+    [
+        ("import cent", ""),
+        ("from cent import CentError, JsonCodec", ""),
+        ("from cent import PublishRequest", "pydantic"),
+        ("from cent import Client", "requests pydantic"),
+        ("from cent import AsyncClient", "aiohttp pydantic"),
+    ],
+)
+def test_lazy_imports(statement: str, expected: str) -> None:
+    assert imported_modules(statement) == expected
@@ -0,0 +1,125 @@
+from typing import Any, Dict, List
+
+import pytest
+
+from cent import (
+    CentApiResponseError,
+    CentNetworkError,
+    Histogram,
+    Instrumentation,
+    PublishRequest,
+    RequestEvent,
+)
+from tests.conftest import (
+    UNKNOWN_CHANNEL_ERROR_CODE,
+    FakeAsyncClientFactory,
+    FakeClientFactory,
+    FakeSession,
+)
+
+NUM_VALUES = 10000
+# Relative error of percentiles is bounded by bucket width.
+PRECISION = 1 / 64
+
+
+def test_histogram_precision() -> None:
+    for value in range(0, NUM_VALUES, 7):
+        histogram = Histogram()
+        histogram.record(value)
+        assert histogram.percentile(50) == value
+        # Bucket of value is at most 1/64 wide, the highest value in it is reported.
+        histogram.record(value + 1)
+        assert value <= histogram.percentile(50) <= (value + 1) * (1 + PRECISION)
+
+
+def test_histogram_percentiles() -> None:
+    histogram = Histogram(scale=1e6)
+    for i in range(1, NUM_VALUES + 1):
+        histogram.record(i / 1e6)
+    assert histogram.count == NUM_VALUES
+    assert histogram.min == pytest.approx(1e-6)
+    assert histogram.max == pytest.approx(NUM_VALUES / 1e6)
+    for percentile, value in histogram.percentiles((50, 99)).items():
+        expected = NUM_VALUES * percentile / 100 / 1e6
+        assert value == pytest.approx(expected, rel=PRECISION)
+
+    other = Histogram(scale=1e6)
+    other.record(1.0)
+    histogram.merge(other)
+    assert histogram.percentile(100) == pytest.approx(1.0)
+    assert histogram.copy().count == NUM_VALUES + 1
+
+
+def test_client_instrumentation(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    events: List[RequestEvent] = []
+    instrumentation = Instrumentation(hooks=[events.append])
+    client = make_fake_client(instrumentation=instrumentation)
+
+    client.publish(PublishRequest(channel="channel", data={}))
+
+    def failing_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        raise CentNetworkError("connection refused")
+
+    fake_session.handler = failing_handler
+    with pytest.raises(CentNetworkError):
+        client.publish(PublishRequest(channel="channel", data={}))
+
+    stats = instrumentation.stats()["publish"]
+    assert stats.in_flight == 0
+    assert stats.latency.count == len(events)
+    assert stats.request_size.min == events[0].request_size > 0
+    assert stats.response_size.count == 1
+    assert stats.errors == {"CentNetworkError": 1}
+    assert isinstance(events[1].error, CentNetworkError)
+
+
+def test_instrumentation_api_error(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    events: List[RequestEvent] = []
+    instrumentation = Instrumentation(hooks=[events.append])
+    client = make_fake_client(instrumentation=instrumentation)
+
+    def error_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        return {"error": {"code": UNKNOWN_CHANNEL_ERROR_CODE, "message": "unknown channel"}}
+
+    fake_session.handler = error_handler
+    with pytest.raises(CentApiResponseError):
+        client.publish(PublishRequest(channel="channel", data={}))
+    assert instrumentation.stats()["publish"].errors == {"CentApiResponseError": 1}
+    assert isinstance(events[0].error, CentApiResponseError)
+
+
+def test_instrumentation_hook_error(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    def failing_hook(event: RequestEvent) -> None:  # noqa: ARG001
+        raise RuntimeError("hook bug")
+
+    instrumentation = Instrumentation(hooks=[failing_hook])
+    client = make_fake_client(instrumentation=instrumentation)
+    client.publish(PublishRequest(channel="channel", data={}))
+
+    def failing_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        raise CentNetworkError("connection refused")
+
+    fake_session.handler = failing_handler
+    with pytest.raises(CentNetworkError):
+        client.publish(PublishRequest(channel="channel", data={}))
+    stats = instrumentation.stats()["publish"]
+    assert (stats.response_size.count, stats.errors) == (1, {"CentNetworkError": 1})
+
+
+async def test_async_client_instrumentation(
+    make_fake_async_client: FakeAsyncClientFactory,
+) -> None:
+    instrumentation = Instrumentation()
+    client = await make_fake_async_client(instrumentation=instrumentation)
+    await client.publish(PublishRequest(channel="channel", data={}))
+    stats = instrumentation.stats()["publish"]
+    assert (stats.in_flight, stats.latency.count) == (0, 1)
@@ -0,0 +1,152 @@
+import asyncio
+from typing import Any, Optional
+
+import pytest
+
+from cent import (
+    CentQueueFullError,
+    CentRateLimitError,
+    ConcurrencyLimiter,
+    PublishRequest,
+    RateLimit,
+    RateLimiter,
+)
+from tests.conftest import (
+    FakeAsyncClientFactory,
+    FakeAsyncSession,
+    FakeClientFactory,
+    FakeSession,
+)
+
+RATE = 100.0
+BURST = 2
+
+
+@pytest.fixture()
+def slow_session(anyio_backend: Any) -> FakeAsyncSession:  # noqa: ARG001
+    return FakeAsyncSession(delay=0.01)
+
+
+async def test_concurrency_limiter(
+    make_fake_async_client: FakeAsyncClientFactory,
+    slow_session: FakeAsyncSession,
+) -> None:
+    limit = 2
+    num_requests = 6
+    limiter = ConcurrencyLimiter(max_in_flight=limit)
+    client = await make_fake_async_client(slow_session, limiter=limiter)
+    max_in_flight = 0
+
+    async def publish(i: int) -> None:
+        nonlocal max_in_flight
+        task = asyncio.ensure_future(
+            client.publish(PublishRequest(channel=f"personal_{i}", data={})),
+        )
+        await asyncio.sleep(0)
+        max_in_flight = max(max_in_flight, limiter.stats().in_flight)
+        await task
+
+    await asyncio.gather(*[publish(i) for i in range(num_requests)])
+    stats = limiter.stats()
+    assert max_in_flight == limit
+    assert stats.in_flight == 0
+    assert stats.waiting == 0
+    assert stats.acquired == num_requests
+    assert stats.wait_time_max > 0
+
+
+async def test_concurrency_limiter_queue_full(
+    make_fake_async_client: FakeAsyncClientFactory,
+    slow_session: FakeAsyncSession,
+) -> None:
+    limiter = ConcurrencyLimiter(max_in_flight=1, max_queue=1)
+    client = await make_fake_async_client(slow_session, limiter=limiter)
+    results = await asyncio.gather(
+        *[client.publish(PublishRequest(channel=f"personal_{i}", data={})) for i in range(3)],
+        return_exceptions=True,
+    )
+    assert isinstance(results[2], CentQueueFullError)
+    assert limiter.stats().rejected == 1
+    assert limiter.stats().acquired == len(results) - 1
+
+
+async def test_concurrency_limiter_queue_timeout(
+    make_fake_async_client: FakeAsyncClientFactory,
+    slow_session: FakeAsyncSession,
+) -> None:
+    limiter = ConcurrencyLimiter(max_in_flight=1, queue_timeout=0.001)
+    client = await make_fake_async_client(slow_session, limiter=limiter)
+    results = await asyncio.gather(
+        *[client.publish(PublishRequest(channel=f"personal_{i}", data={})) for i in range(2)],
+        return_exceptions=True,
+    )
+    assert isinstance(results[1], CentQueueFullError)
+
+
+def test_rate_limiter_burst_then_rate() -> None:
+    limiter = RateLimiter(RateLimit(rate=RATE, burst=BURST))
+    assert [limiter.reserve("publish") for _ in range(BURST)] == [0, 0]
+    # Next requests are queued one token interval after another.
+    assert limiter.reserve("publish") == pytest.approx(1 / RATE, abs=1e-3)
+    assert limiter.reserve("publish") == pytest.approx(2 / RATE, abs=1e-3)
+    stats = limiter.stats()
+    assert (stats.acquired, stats.delayed) == (BURST + 2, 2)
+
+
+def test_rate_limiter_method_buckets() -> None:
+    limiter = RateLimiter(method_limits={"device_register": RateLimit(rate=RATE, burst=1)})
+    assert limiter.reserve("device_register") == 0
+    assert limiter.reserve("device_register") > 0
+    # Other methods are not limited.
+    assert limiter.reserve("publish") == 0
+
+
+def test_rate_limiter_non_blocking(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    limiter = RateLimiter(RateLimit(rate=RATE, burst=1), block=False)
+    client = make_fake_client(rate_limiter=limiter)
+    request = PublishRequest(channel="channel", data={})
+    client.publish(request)
+    with pytest.raises(CentRateLimitError) as exc_info:
+        client.publish(request)
+    assert 0 < exc_info.value.retry_after <= 1 / RATE
+    assert len(fake_session.requests) == 1
+    assert limiter.stats().rejected == 1
+
+
+def test_rate_limiter_max_wait() -> None:
+    limiter = RateLimiter(RateLimit(rate=RATE, burst=1), max_wait=1.5 / RATE)
+    limiter.reserve("publish")
+    limiter.reserve("publish")
+    with pytest.raises(CentRateLimitError):
+        limiter.reserve("publish")
+    # Rejected request does not take token.
+    assert limiter.stats().acquired == BURST
+
+
+@pytest.mark.parametrize(
+    ("rate", "burst"),
+    [(0, None), (-RATE, None), (RATE, 0), (RATE, -1)],
+)
+def test_rate_limit_invalid(rate: float, burst: Optional[int]) -> None:
+    with pytest.raises(ValueError, match="must be"):
+        RateLimit(rate=rate, burst=burst)
+
+
+async def test_rate_limiter_async(
+    make_fake_async_client: FakeAsyncClientFactory,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    limiter = RateLimiter(RateLimit(rate=RATE, burst=1))
+    client = await make_fake_async_client(rate_limiter=limiter)
+
+    num_requests = 5
+    started = asyncio.get_running_loop().time()
+    await asyncio.gather(
+        *[client.publish(PublishRequest(channel="channel", data={})) for _ in range(num_requests)],
+    )
+    elapsed = asyncio.get_running_loop().time() - started
+    assert len(fake_async_session.requests) == num_requests
+    assert elapsed >= (num_requests - 1) / RATE * 0.9
@@ -0,0 +1,199 @@
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from cent import (
+    AsyncClient,
+    CentApiResponseError,
+    CentEpochChangedError,
+    Client,
+    DeviceListRequest,
+    DeviceTopicListRequest,
+    StreamPosition,
+    UserTopicListRequest,
+)
+from tests.conftest import FakeAsyncSession, FakeSession
+
+STREAM_SIZE = 25
+PAGE_SIZE = 10
+EPOCH = "epoch"
+PAGES = 2
+
+
+class HistoryStream:
+    """Replies to history requests like Centrifugo does for stream with `size` publications."""
+
+    def __init__(self, size: int = STREAM_SIZE) -> None:
+        self.size = size
+        self.epoch = EPOCH
+
+    def __call__(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        assert method == "history"
+        offsets = list(range(1, self.size + 1))
+        since = payload.get("since")
+        if payload.get("reverse"):
+            offsets.reverse()
+            if since:
+                offsets = [offset for offset in offsets if offset < since["offset"]]
+        elif since:
+            offsets = [offset for offset in offsets if offset > since["offset"]]
+        if since and since["epoch"] != self.epoch:
+            return {"error": {"code": 112, "message": "unrecoverable position"}}
+        return {
+            "result": {
+                "publications": [
+                    {"offset": offset, "data": {"n": offset}}
+                    for offset in offsets[: payload["limit"]]
+                ],
+                "offset": self.size,
+                "epoch": self.epoch,
+            },
+        }
+
+
+def page_requests(session: Any) -> List[Any]:
+    return [payload.get("since") for _, payload in session.requests]
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_history(fake_client: Client, fake_session: FakeSession, prefetch: bool) -> None:
+    fake_session.handler = HistoryStream()
+    publications = list(
+        fake_client.iter_history("channel", page_size=PAGE_SIZE, prefetch=prefetch),
+    )
+    assert [p.offset for p in publications] == list(range(1, STREAM_SIZE + 1))
+    assert page_requests(fake_session) == [
+        None,
+        {"offset": 10, "epoch": EPOCH},
+        {"offset": 20, "epoch": EPOCH},
+    ]
+
+
+def test_iter_history_reverse_since(fake_client: Client, fake_session: FakeSession) -> None:
+    fake_session.handler = HistoryStream()
+    since = StreamPosition(offset=STREAM_SIZE - 1, epoch=EPOCH)
+    publications = fake_client.iter_history(
+        "channel",
+        page_size=PAGE_SIZE,
+        since=since,
+        reverse=True,
+    )
+    assert [p.offset for p in publications] == list(range(STREAM_SIZE - 2, 0, -1))
+    # Stream start reached, no request for empty page.
+    assert len(fake_session.requests) == STREAM_SIZE // PAGE_SIZE + 1
+
+
+def test_iter_history_exact_pages(fake_client: Client, fake_session: FakeSession) -> None:
+    fake_session.handler = HistoryStream(size=PAGE_SIZE * 2)
+    publications = list(fake_client.iter_history("channel", page_size=PAGE_SIZE))
+    assert len(publications) == PAGE_SIZE * 2
+    assert len(fake_session.requests) == PAGES
+
+
+def test_iter_history_epoch_changed(fake_client: Client, fake_session: FakeSession) -> None:
+    stream = HistoryStream()
+    fake_session.handler = stream
+    publications = fake_client.iter_history("channel", page_size=PAGE_SIZE, prefetch=False)
+    next(publications)
+    stream.epoch = "new epoch"
+    with pytest.raises(CentEpochChangedError) as exc_info:
+        list(publications)
+    assert exc_info.value.epoch == EPOCH
+
+
+def test_iter_history_other_errors(fake_client: Client, fake_session: FakeSession) -> None:
+    def handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        return {"error": {"code": 102, "message": "unknown channel"}}
+
+    fake_session.handler = handler
+    with pytest.raises(CentApiResponseError):
+        list(fake_client.iter_history("channel"))
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+async def test_iter_history_async(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+    prefetch: bool,
+) -> None:
+    fake_async_session.handler = HistoryStream()
+    offsets = [
+        publication.offset
+        async for publication in fake_async_client.iter_history(
+            "channel",
+            page_size=PAGE_SIZE,
+            prefetch=prefetch,
+        )
+    ]
+    assert offsets == list(range(1, STREAM_SIZE + 1))
+
+
+async def test_iter_history_async_prefetch(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    fake_async_session.handler = HistoryStream()
+    publications = fake_async_client.iter_history("channel", page_size=PAGE_SIZE)
+    async for _ in publications:
+        await asyncio.sleep(0)
+        # Next page is already requested while the first one is consumed.
+        assert len(fake_async_session.requests) == PAGES
+        break
+    await publications.aclose()  # type: ignore[attr-defined]
+
+
+class CursorList:
+    """Replies to list requests paginated with cursor like Centrifugo does."""
+
+    def __init__(self, size: int = STREAM_SIZE) -> None:
+        self.size = size
+
+    def __call__(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        start = int(payload.get("cursor") or 0)
+        end = min(self.size, start + payload["limit"])
+        items: List[Dict[str, Any]] = []
+        for i in range(start, end):
+            device = {"id": str(i), "platform": "web", "provider": "fcm", "token": ""}
+            if method == "device_list":
+                items.append(device)
+            else:
+                items.append({"id": str(i), "user": "user", "topic": "topic", "device": device})
+        result: Dict[str, Any] = {"items": items}
+        if end < self.size:
+            result["next_cursor"] = str(end)
+        if payload.get("include_total_count"):
+            result["total_count"] = self.size
+        return {"result": result}
+
+
+@pytest.mark.parametrize("prefetch", [True, False])
+def test_iter_device_list(fake_client: Client, fake_session: FakeSession, prefetch: bool) -> None:
+    fake_session.handler = CursorList()
+    request = DeviceListRequest(limit=PAGE_SIZE, include_total_count=True)
+    devices = list(fake_client.iter_device_list(request, prefetch=prefetch))
+    assert [device.id for device in devices] == [str(i) for i in range(STREAM_SIZE)]
+    payloads = [payload for _, payload in fake_session.requests]
+    assert [payload.get("cursor") for payload in payloads] == [None, "10", "20"]
+    # Total count is only requested with the first page.
+    assert [payload.get("include_total_count") for payload in payloads] == [True, None, None]
+
+
+def test_iter_user_topic_list_single_page(
+    fake_client: Client,
+    fake_session: FakeSession,
+) -> None:
+    fake_session.handler = CursorList(size=PAGE_SIZE - 1)
+    topics = list(fake_client.iter_user_topic_list(UserTopicListRequest(limit=PAGE_SIZE)))
+    assert len(topics) == PAGE_SIZE - 1
+    assert len(fake_session.requests) == 1
+
+
+async def test_iter_device_topic_list_async(
+    fake_async_client: AsyncClient,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    fake_async_session.handler = CursorList()
+    request = DeviceTopicListRequest(limit=PAGE_SIZE)
+    ids = [item.id async for item in fake_async_client.iter_device_topic_list(request)]
+    assert ids == [str(i) for i in range(STREAM_SIZE)]
@@ -0,0 +1,96 @@
+import asyncio
+import time
+from typing import Any, Dict
+
+import pytest
+
+from cent import CentNetworkError, CentTransportError, LoadBalancing
+from cent.client.session import BalancedAiohttpSession, BalancedRequestsSession
+from cent.client.session.pool import EndpointPool
+from tests.conftest import FakeAsyncSession, FakeSession, ok_handler
+
+URLS = ["http://node1/api", "http://node2/api", "http://node3/api"]
+
+
+def failing_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+    raise CentNetworkError("connection refused")
+
+
+@pytest.mark.parametrize("strategy", ["p2c", "least_outstanding"])
+def test_pool_balances_outstanding(strategy: str) -> None:
+    # With two nodes both strategies always pick the less loaded one.
+    pool = EndpointPool(URLS[:2], LoadBalancing(strategy=strategy))
+    selected = [pool.select() for _ in range(30)]
+    assert [endpoint.outstanding for endpoint in pool.endpoints] == [15, 15]
+    for endpoint in selected:
+        pool.release(endpoint)
+    assert all(endpoint.outstanding == 0 for endpoint in pool.endpoints)
+
+
+def test_pool_ejects_and_probes_back() -> None:
+    pool = EndpointPool(URLS, LoadBalancing(max_failures=2, eject_time=0))
+    failed = pool.endpoints[0]
+    for _ in range(2):
+        failed.outstanding += 1
+        pool.release(failed, CentTransportError(503))
+    assert not failed.healthy
+
+    for _ in range(20):
+        endpoint = pool.select()
+        assert endpoint is not failed
+        pool.release(endpoint, CentTransportError(400))
+
+    assert pool.due_probes() == [failed]
+    assert pool.due_probes() == []
+    pool.probe_done(failed, ok=True)
+    assert failed.healthy
+
+
+def test_pool_all_ejected() -> None:
+    pool = EndpointPool(URLS[:1], LoadBalancing(max_failures=1))
+    endpoint = pool.select()
+    pool.release(endpoint, CentNetworkError(""))
+    assert not endpoint.healthy
+    assert pool.select() is endpoint
+
+
+def test_balanced_requests_session() -> None:
+    session = BalancedRequestsSession(
+        URLS,
+        balancing=LoadBalancing(max_failures=1, eject_time=60),
+    )
+    nodes = {url: FakeSession() for url in URLS}
+    nodes[URLS[0]].handler = failing_handler
+    session._sessions = nodes  # type: ignore[assignment]
+
+    errors = 0
+    for _ in range(20):
+        try:
+            session.make_request("api_key", "publish", b'{"channel": "1", "data": {}}')
+        except CentNetworkError:
+            errors += 1
+    assert errors == 1
+    assert not session.pool.endpoints[0].healthy
+    session.close()
+
+
+async def test_balanced_aiohttp_session_probe(anyio_backend: Any) -> None:  # noqa: ARG001
+    session = BalancedAiohttpSession(URLS, balancing=LoadBalancing(max_failures=1, eject_time=0))
+    for node in session._sessions.values():
+        await node.close()
+    nodes = {url: FakeAsyncSession() for url in URLS}
+    nodes[URLS[0]].handler = failing_handler
+    session._sessions = nodes  # type: ignore[assignment]
+
+    endpoint = session.pool.endpoints[0]
+    endpoint.outstanding += 1
+    session.pool.release(endpoint, CentNetworkError(""))
+    assert not endpoint.healthy
+
+    nodes[URLS[0]].handler = ok_handler
+    time.sleep(0.001)
+    await session.make_request("api_key", "publish", b"{}")
+    await asyncio.sleep(0.01)
+    assert ("info", {}) in nodes[URLS[0]].requests
+    assert endpoint.healthy
+    await session.close()
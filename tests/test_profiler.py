@@ -0,0 +1,76 @@
+import asyncio
+import json
+from typing import Any, AsyncGenerator
+
+import pytest
+from aiohttp import web
+
+from cent import AsyncClient, Client, Profiler, PublishRequest
+from cent.client.profiler import PHASES
+from tests.conftest import API_KEY, FakeClientFactory
+
+NUM_CALLS = 3
+SESSION_PHASES = {"acquire", "network", "read"}
+
+
+async def publish_handler(request: web.Request) -> web.Response:
+    await request.read()
+    return web.json_response({"result": {"offset": 1, "epoch": "epoch"}})
+
+
+@pytest.fixture()
+async def api_url(anyio_backend: Any) -> AsyncGenerator[str, None]:  # noqa: ARG001
+    app = web.Application()
+    app.router.add_post("/api/{method}", publish_handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = runner.addresses[0][1]
+    yield f"http://127.0.0.1:{port}/api"
+    await runner.cleanup()
+
+
+def test_profiler_sync_phases(make_fake_client: FakeClientFactory) -> None:
+    profiler = Profiler()
+    client = make_fake_client(profiler=profiler)
+    for _ in range(NUM_CALLS):
+        client.publish(PublishRequest(channel="1", data={}))
+
+    assert client.profiler is profiler
+    phases = profiler.stats()["publish"]
+    # Fake session does no network calls.
+    assert set(phases) == set(PHASES) - SESSION_PHASES
+    assert all(histogram.count == NUM_CALLS for histogram in phases.values())
+    assert phases["total"].total >= phases["validate"].total
+
+    report = json.loads(profiler.to_json())
+    assert report["publish"]["dump"]["count"] == NUM_CALLS
+    profiler.reset()
+    assert profiler.stats() == {}
+
+
+async def test_profiler_async_session_phases(api_url: str) -> None:
+    profiler = Profiler()
+    client = AsyncClient(api_url, API_KEY, profiler=profiler)
+    try:
+        for _ in range(NUM_CALLS):
+            await client.publish(PublishRequest(channel="1", data={}))
+    finally:
+        await client._session.close()
+
+    phases = profiler.stats()["publish"]
+    assert set(phases) == set(PHASES)
+    assert all(histogram.count == NUM_CALLS for histogram in phases.values())
+    assert phases["network"].total > 0
+
+
+async def test_profiler_requests_session_phases(api_url: str) -> None:
+    profiler = Profiler()
+    with Client(api_url, API_KEY, profiler=profiler) as client:
+        request = PublishRequest(channel="1", data={})
+        await asyncio.to_thread(client.publish, request)
+
+    phases = profiler.stats()["publish"]
+    # Connection acquire can't be told from network round trip with requests.
+    assert set(phases) == set(PHASES) - {"acquire"}
@@ -0,0 +1,157 @@
+import time
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from cent import (
+    BatchRequest,
+    CentNetworkError,
+    CentTimeoutError,
+    CentTransportError,
+    HistoryRequest,
+    PublishRequest,
+    PublishResult,
+    PushNotification,
+    RetryPolicy,
+    SendPushNotificationRequest,
+)
+from cent.client.retry import call_with_retry, with_idempotency_keys
+from cent.dto import PushRecipient
+from tests.conftest import (
+    FakeAsyncClientFactory,
+    FakeAsyncSession,
+    FakeClientFactory,
+    FakeSession,
+    ok_handler,
+)
+
+TIMEOUT = 10.0
+
+
+class FlakyHandler:
+    def __init__(self, errors: List[Exception]) -> None:
+        self.errors = errors
+
+    def __call__(self, method: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        if self.errors:
+            raise self.errors.pop(0)
+        return ok_handler(method, payload)
+
+
+def test_retry(make_fake_client: FakeClientFactory, fake_session: FakeSession) -> None:
+    attempts = 3
+    client = make_fake_client(retry_policy=RetryPolicy(max_attempts=attempts, backoff_base=0))
+    fake_session.handler = FlakyHandler([
+        CentNetworkError("connection refused"),
+        CentTransportError(503),
+    ])
+
+    result = client.publish(PublishRequest(channel="personal_1", data={}))
+    assert isinstance(result, PublishResult)
+    keys = {payload["idempotency_key"] for _, payload in fake_session.requests}
+    assert len(fake_session.requests) == attempts
+    assert len(keys) == 1
+
+
+def test_retry_attempts_exhausted(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    client = make_fake_client(retry_policy=RetryPolicy(max_attempts=2, backoff_base=0))
+    fake_session.handler = FlakyHandler([CentNetworkError("1"), CentNetworkError("2")])
+
+    with pytest.raises(CentNetworkError, match="2"):
+        client.publish(PublishRequest(channel="personal_1", data={}))
+
+
+def test_retry_not_retryable(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    client = make_fake_client(retry_policy=RetryPolicy(backoff_base=0))
+    fake_session.handler = FlakyHandler([CentTransportError(400)])
+
+    with pytest.raises(CentTransportError):
+        client.publish(PublishRequest(channel="personal_1", data={}))
+    assert len(fake_session.requests) == 1
+
+
+def test_retry_deadline() -> None:
+    policy = RetryPolicy(max_attempts=10, backoff_base=10, backoff_max=10, deadline=1)
+    started = time.monotonic()
+    delays = [policy.next_delay(CentNetworkError(""), 1, started) for _ in range(100)]
+    assert None in delays
+    assert all(delay is None or delay <= 1 for delay in delays)
+    assert policy.next_delay(CentNetworkError(""), 1, started - 1) is None
+
+
+def test_retry_attempt_timeout() -> None:
+    policy = RetryPolicy(max_attempts=3, backoff_base=0, deadline=1)
+    timeouts: List[Optional[float]] = []
+
+    def func(timeout: Optional[float]) -> None:
+        timeouts.append(timeout)
+        raise CentTimeoutError("timeout")
+
+    with pytest.raises(CentTimeoutError):
+        call_with_retry(policy, func, TIMEOUT)
+    assert len(timeouts) == policy.max_attempts
+    assert all(timeout is not None and 0 < timeout <= 1 for timeout in timeouts)
+
+    started = time.monotonic()
+    assert RetryPolicy().attempt_timeout(TIMEOUT, started) == TIMEOUT
+    timeout = policy.attempt_timeout(None, started - 2)
+    assert timeout is not None
+    assert 0 < timeout < 1
+
+
+def test_retry_idempotent_only(
+    make_fake_client: FakeClientFactory,
+    fake_session: FakeSession,
+) -> None:
+    client = make_fake_client(retry_policy=RetryPolicy(backoff_base=0, idempotency_keys=False))
+    fake_session.handler = FlakyHandler([CentTimeoutError("timeout")])
+    with pytest.raises(CentTimeoutError):
+        client.publish(PublishRequest(channel="personal_1", data={}))
+    assert len(fake_session.requests) == 1
+
+    policy = RetryPolicy()
+    push = SendPushNotificationRequest(
+        recipient=PushRecipient(fcm_tokens=["token"]),
+        notification=PushNotification(),
+    )
+    assert not policy.is_idempotent(push)
+    assert not policy.is_idempotent(BatchRequest(requests=[push]))
+    keyed = PublishRequest(channel="personal_1", data={}, idempotency_key="key")
+    assert policy.is_idempotent(BatchRequest(requests=[keyed, HistoryRequest(channel="chat")]))
+
+
+def test_with_idempotency_keys() -> None:
+    request = BatchRequest(
+        requests=[
+            PublishRequest(channel="personal_1", data={}),
+            PublishRequest(channel="personal_2", data={}, idempotency_key="key"),
+        ],
+    )
+    prepared = with_idempotency_keys(request)
+    assert isinstance(prepared, BatchRequest)
+    assert prepared.requests[0].idempotency_key
+    assert prepared.requests[1].idempotency_key == "key"
+    assert request.requests[0].idempotency_key is None
+
+
+async def test_retry_async(
+    make_fake_async_client: FakeAsyncClientFactory,
+    fake_async_session: FakeAsyncSession,
+) -> None:
+    client = await make_fake_async_client(
+        retry_policy=RetryPolicy(backoff_base=0, idempotency_keys=False),
+    )
+    fake_async_session.handler = FlakyHandler([CentNetworkError("connection refused")])
+
+    request = PublishRequest(channel="personal_1", data={}, idempotency_key="key")
+    result = await client.publish(request)
+    assert isinstance(result, PublishResult)
+    assert [payload for _, payload in fake_async_session.requests] == [
+        {"channel": "personal_1", "data": {}, "idempotency_key": "key"},
+    ] * 2
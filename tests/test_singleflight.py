@@ -0,0 +1,105 @@
+import asyncio
+from typing import Any, Dict
+
+import pytest
+
+from cent import (
+    CentNetworkError,
+    PresenceStatsRequest,
+    PublishRequest,
+    SingleFlight,
+)
+from tests.conftest import FakeAsyncClientFactory, FakeAsyncSession
+
+NUM_CALLS = 10
+DELAY = 0.01
+
+
+def presence_stats_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+    return {"result": {"num_clients": 1, "num_users": 1}}
+
+
+async def test_single_flight_collapses_reads(
+    make_fake_async_client: FakeAsyncClientFactory,
+) -> None:
+    session = FakeAsyncSession(handler=presence_stats_handler, delay=DELAY)
+    single_flight = SingleFlight()
+    client = await make_fake_async_client(session, single_flight=single_flight)
+
+    results = await asyncio.gather(
+        *[client.presence_stats(PresenceStatsRequest(channel="1")) for _ in range(NUM_CALLS)],
+        client.presence_stats(PresenceStatsRequest(channel="2")),
+    )
+    assert len({id(result) for result in results[:NUM_CALLS]}) == 1
+    assert [payload["channel"] for _, payload in session.requests] == ["1", "2"]
+    stats = single_flight.stats()
+    assert (stats.in_flight, stats.requests, stats.shared) == (0, 2, NUM_CALLS - 1)
+
+    # No staleness: once request is done, the next one is sent again.
+    await client.presence_stats(PresenceStatsRequest(channel="1"))
+    assert [payload["channel"] for _, payload in session.requests] == ["1", "2", "1"]
+
+
+async def test_single_flight_skips_writes(make_fake_async_client: FakeAsyncClientFactory) -> None:
+    session = FakeAsyncSession(delay=DELAY)
+    client = await make_fake_async_client(session, single_flight=SingleFlight())
+    await asyncio.gather(
+        *[client.publish(PublishRequest(channel="1", data={})) for _ in range(NUM_CALLS)],
+    )
+    assert len(session.requests) == NUM_CALLS
+
+
+async def test_single_flight_shares_errors(make_fake_async_client: FakeAsyncClientFactory) -> None:
+    def failing_handler(method: str, payload: Dict[str, Any]) -> Dict[str, Any]:  # noqa: ARG001
+        raise CentNetworkError("connection refused")
+
+    session = FakeAsyncSession(handler=failing_handler, delay=DELAY)
+    client = await make_fake_async_client(session, single_flight=SingleFlight())
+    results = await asyncio.gather(
+        *[client.presence_stats(PresenceStatsRequest(channel="1")) for _ in range(NUM_CALLS)],
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, CentNetworkError) for result in results)
+    assert len(session.requests) == 1
+
+
+async def test_single_flight_cancellation(anyio_backend: Any) -> None:  # noqa: ARG001
+    single_flight = SingleFlight()
+    started = asyncio.Event()
+
+    async def call() -> str:
+        started.set()
+        await asyncio.sleep(DELAY)
+        return "result"
+
+    first = asyncio.ensure_future(single_flight.do("key", call))
+    second = asyncio.ensure_future(single_flight.do("key", call))
+    await started.wait()
+    # Cancelled waiter does not cancel request others wait for.
+    first.cancel()
+    assert await second == "result"
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    # Cancelling the last waiter cancels the shared call and forgets the key.
+    started.clear()
+    call_cancelled = asyncio.Event()
+
+    async def slow_call() -> str:
+        started.set()
+        try:
+            await asyncio.sleep(DELAY)
+        except asyncio.CancelledError:
+            call_cancelled.set()
+            raise
+        return "result"
+
+    third = asyncio.ensure_future(single_flight.do("key", slow_call))
+    await started.wait()
+    assert single_flight.stats().in_flight == 1
+    third.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await third
+    await asyncio.wait_for(call_cancelled.wait(), DELAY)
+    await asyncio.sleep(0)
+    assert single_flight.stats().in_flight == 0